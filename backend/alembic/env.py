@@ -1,25 +1,22 @@
 import asyncio
-import os
-from pathlib import Path
 from logging.config import fileConfig
 
-from dotenv import load_dotenv
 from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
+from app.config import ROOT_ENV_FILE, settings
 from app.models import *  # noqa: F401,F403
 from app.database import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
-ROOT_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
-load_dotenv(ROOT_ENV_FILE)
-database_url = os.environ.get("DATABASE_URL")
-if not database_url:
+# Settings already read the environment and ROOT_ENV_FILE; refuse to fall back
+# to the localhost default when DATABASE_URL was never provided.
+if "database_url" not in settings.model_fields_set:
     raise RuntimeError(f"DATABASE_URL is not set. Expected it in {ROOT_ENV_FILE}.")
-config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
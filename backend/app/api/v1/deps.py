@@ -1,3 +1,5 @@
+import hashlib
+import time
 import uuid
 
 from fastapi import Depends, Header, HTTPException, status
@@ -19,15 +21,42 @@ security = HTTPBearer()
 # Bounds writes to at most one per user per window, keeping the hot auth path cheap.
 SEEN_THROTTLE_SECONDS = 60
 
+# Tokens that already passed signature + blacklist checks, keyed by sha256 of
+# the raw token. A hit skips the JWT decode and the Valkey blacklist lookup.
+# Logout evicts locally; other workers pick up a revocation within the TTL.
+_TOKEN_CACHE_TTL = 15.0  # seconds
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE: dict[bytes, tuple[float, dict]] = {}
+
+
+def forget_token(jti: str) -> None:
+    """Drop any cached validation for the access token with this jti."""
+    for key in [k for k, (_, p) in _TOKEN_CACHE.items() if p.get("jti") == jti]:
+        _TOKEN_CACHE.pop(key, None)
+
+
+# Per-process copy of the throttle, so requests inside the window skip Valkey
+# too; Valkey still dedupes the DB write across workers.
+_SEEN_LOCAL: dict[str, float] = {}
+_SEEN_LOCAL_MAX = 10_000
+
 
 async def _touch_last_seen(user_id: str) -> None:
-    """Best-effort presence heartbeat. Throttled via Valkey, fully isolated from
-    the request transaction, and fail-open so it can never break authentication."""
+    """Best-effort presence heartbeat. Throttled in-process and via Valkey, fully
+    isolated from the request transaction, and fail-open so it can never break
+    authentication."""
+    now = time.monotonic()
+    seen_at = _SEEN_LOCAL.get(user_id)
+    if seen_at is not None and (now - seen_at) < SEEN_THROTTLE_SECONDS:
+        return
+    if len(_SEEN_LOCAL) >= _SEEN_LOCAL_MAX:
+        _SEEN_LOCAL.pop(next(iter(_SEEN_LOCAL)), None)
+    _SEEN_LOCAL.pop(user_id, None)
+    _SEEN_LOCAL[user_id] = now
     try:
-        v = get_valkey()
-        if await v.get(f"seen:{user_id}"):
+        # SET NX is the check and the claim in one round-trip.
+        if not await get_valkey().set(f"seen:{user_id}", "1", ex=SEEN_THROTTLE_SECONDS, nx=True):
             return
-        await v.set(f"seen:{user_id}", "1", ex=SEEN_THROTTLE_SECONDS)
     except Exception:
         # Valkey unavailable — fall through and still record presence.
         pass
@@ -41,8 +70,7 @@ async def _touch_last_seen(user_id: str) -> None:
         pass
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    token = credentials.credentials
+async def _validate_token(token: str) -> dict:
     payload = decode_token_safe(token)
 
     if not payload:
@@ -55,6 +83,21 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         if blacklisted:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked.")
 
+    return payload
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    token = credentials.credentials
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached and (time.monotonic() - cached[0]) < _TOKEN_CACHE_TTL and cached[1].get("exp", 0) > time.time():
+        payload = cached[1]
+    else:
+        payload = await _validate_token(token)
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+            _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)), None)
+        _TOKEN_CACHE[key] = (time.monotonic(), payload)
+
     user_id = payload.get("user_id")
     if user_id:
         await _touch_last_seen(user_id)
@@ -73,8 +116,9 @@ async def get_user_context(
 
 
 def _is_admin_user(user: User | None) -> bool:
-    allow = {e.strip().lower() for e in (settings.admin_emails or "").split(",") if e.strip()}
-    return user is not None and (bool(user.is_admin) or (user.email or "").lower() in allow)
+    return user is not None and (
+        bool(user.is_admin) or (user.email or "").lower() in settings.admin_email_set
+    )
 
 
 async def require_admin(
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -18,7 +18,7 @@ from app.schemas.auth import (
     OAuthRequest, OAuthResponse,
 )
 from app.services import auth as auth_service
-from app.api.v1.deps import get_current_user
+from app.api.v1.deps import forget_token, get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -68,11 +68,13 @@ async def refresh_token(body: RefreshRequest):
 
 @router.post("/logout", response_model=LogoutResponse)
 async def logout(body: RefreshRequest, current_user=Depends(get_current_user)):
-    return await auth_service.logout(
+    result = await auth_service.logout(
         jti=current_user["jti"],
         exp=current_user["exp"],
         refresh=body.refresh_token,
     )
+    forget_token(current_user["jti"])
+    return result
 
 
 @router.post("/resend-verification", response_model=ResendVerificationResponse)
@@ -81,8 +83,12 @@ async def resend_verification(body: ResendVerificationRequest, db: AsyncSession
 
 
 @router.post("/forgot-password", response_model=ForgotPasswordResponse)
-async def forgot_password(body: ForgotPasswordRequest, db: AsyncSession = Depends(get_db)):
-    return await auth_service.forgot_password(db, body.email)
+async def forgot_password(
+    body: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    return await auth_service.forgot_password(db, body.email, background_tasks)
 
 
 @router.post("/reset-password", response_model=ResetPasswordResponse)
@@ -4,12 +4,12 @@ import uuid
 from datetime import date, datetime, timezone
 
 import stripe
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.deps import get_current_user
+from app.api.v1.deps import get_user_context
 from app.config import settings
 from app.database import get_db
 from app.models.bucket import Bucket
@@ -20,7 +20,7 @@ from app.models.user import Profile, User
 from app.services import stripe_billing
 from app.services.notifications import create_notification
 from app.services.plans import _OVERRIDABLE, resolve_effective_plan
-from app.services.team.permissions import parse_active_workspace, resolve_user_context
+from app.services.team.permissions import UserContext
 
 logger = logging.getLogger(__name__)
 
@@ -146,7 +146,7 @@ async def _plan_payload(db: AsyncSession, owner_user_id: uuid.UUID) -> dict:
 
 
 async def _admin_users(db: AsyncSession) -> list[User]:
-    emails = {e.strip().lower() for e in (settings.admin_emails or "").split(",") if e.strip()}
+    emails = settings.admin_email_set
     conditions = [User.is_admin.is_(True)]
     if emails:
         conditions.append(func.lower(User.email).in_(emails))
@@ -167,11 +167,8 @@ async def _user_label(db: AsyncSession, user_id: uuid.UUID) -> str:
 @router.get("/plan")
 async def get_plan(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     payload = await _plan_payload(db, ctx.owner_user_id)
     payload["user_id"] = str(ctx.user_id)
     payload["owner_user_id"] = str(ctx.owner_user_id)
@@ -183,11 +180,8 @@ async def get_plan(
 async def request_limit_increase(
     body: LimitIncreaseRequestBody,
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     requested_limits = _clean_requested_limits(body.requested_limits)
     plan = await _plan_payload(db, ctx.owner_user_id)
     if plan["plan"] != "business":
@@ -241,11 +235,8 @@ async def request_limit_increase(
 @router.post("/upgrade")
 async def upgrade_plan(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     plan = await _plan_payload(db, ctx.owner_user_id)
     requested = {
         key: max(int(plan["limits"].get(key, 0)), int(plan["usage"].get(key, 0))) * 2
@@ -256,19 +247,16 @@ async def upgrade_plan(
         note="General upgrade request.",
         trigger_message="Upgrade requested from billing.",
     )
-    return await request_limit_increase(body, db, current_user, x_workspace)
+    return await request_limit_increase(body, db, ctx)
 
 
 @router.post("/checkout")
 async def create_checkout(
     body: CheckoutRequest,
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
     """Start a Stripe Checkout session for a self-serve plan; returns the URL to redirect to."""
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     owner = await db.get(User, ctx.owner_user_id)
     email = owner.email if owner else ctx.email
     try:
@@ -283,12 +271,9 @@ async def create_checkout(
 @router.post("/portal")
 async def create_portal(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
     """Stripe Customer Portal — manage card, downgrade, or cancel."""
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     try:
         url = await stripe_billing.create_portal_session(db, ctx.owner_user_id)
     except ValueError as exc:
@@ -301,11 +286,8 @@ async def create_portal(
 @router.post("/cancel")
 async def cancel_subscription(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     try:
         await stripe_billing.cancel_subscription(db, ctx.owner_user_id, at_period_end=True)
     except ValueError as exc:
@@ -314,7 +296,7 @@ async def cancel_subscription(
         raise HTTPException(status_code=503, detail=str(exc))
     await create_notification(
         db,
-        str(current_user["user_id"]),
+        str(ctx.user_id),
         "warning",
         "Subscription cancellation scheduled",
         "Your subscription will end at the close of the current billing period.",
@@ -326,11 +308,8 @@ async def cancel_subscription(
 @router.get("/history")
 async def billing_history(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
-    x_workspace: str | None = Header(default=None, alias="X-Workspace"),
+    ctx: UserContext = Depends(get_user_context),
 ):
-    user_id = uuid.UUID(current_user["user_id"])
-    ctx = await resolve_user_context(db, user_id, parse_active_workspace(x_workspace, user_id))
     sub = (
         await db.execute(select(Subscription).where(Subscription.user_id == ctx.owner_user_id))
     ).scalar_one_or_none()
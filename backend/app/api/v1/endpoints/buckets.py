@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -28,14 +28,24 @@ class UpdateBucketRequest(BaseModel):
 
 @router.get("")
 async def list_buckets_endpoint(
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
     ctx: UserContext = Depends(get_user_context),
 ):
-    all_buckets = await list_buckets(db, str(ctx.owner_user_id))
-    if not ctx.is_member:
-        return all_buckets
-    accessible = {str(bid) for bid in await get_accessible_bucket_ids(db, ctx.team_member_id)}
-    return [b for b in all_buckets if b["id"] in accessible]
+    # Members only see buckets they were granted; filter in SQL so file stats
+    # are only aggregated for the rows actually returned.
+    accessible = (
+        await get_accessible_bucket_ids(db, ctx.team_member_id) if ctx.is_member else None
+    )
+    buckets, total = await list_buckets(
+        db, str(ctx.owner_user_id), bucket_ids=accessible, limit=limit, offset=offset
+    )
+    # The body stays a plain list for existing clients; pagers read the total
+    # across all pages from the header.
+    response.headers["X-Total-Count"] = str(total)
+    return buckets
 
 
 @router.post("")
@@ -1,13 +1,14 @@
 import asyncio
-import json
 import uuid
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user, get_user_context
+from app.api.v1.sse import drain_sse_queue
 from app.database import get_db
 from app.models.message_feedback import MessageFeedback
 from app.schemas.agent import (
@@ -20,11 +21,13 @@ from app.schemas.agent import (
     MessageFeedbackRequest,
     MessageFeedbackResponse,
     MessageListResponse,
+    MessageResponse,
 )
 from app.services.agent import (
     create_conversation as create_conversation_service,
     delete_conversation as delete_conversation_service,
     delete_messages_from as delete_messages_from_service,
+    get_conversation_for_user,
     list_conversation_messages,
     list_conversations as list_conversations_service,
     pin_conversation as pin_conversation_service,
@@ -32,13 +35,14 @@ from app.services.agent import (
     run_conversation_turn,
 )
 from app.services.agent.llm import generate_short_title
+from app.services.agent.tools import write_file as tool_write_file
 from app.services.notifications import create_notification
 from app.services.quota import enforce_chat_quota
 from app.services.team.permissions import (
     UserContext,
     get_bucket_access,
 )
-from sqlalchemy import select
+from sqlalchemy import select, text
 from app.models.platform import TeamMember
 from app.models.user import Profile, User
 from app.schemas.agent import MessageSender
@@ -115,9 +119,6 @@ async def get_thread_scope(
     db: AsyncSession = Depends(get_db),
     ctx: UserContext = Depends(get_user_context),
 ):
-    from sqlalchemy import text
-    from app.services.agent.service import get_conversation_for_user
-
     tctx = await _resolve_thread_ctx(db, ctx, bucket_id)
     await get_conversation_for_user(
         db,
@@ -148,9 +149,6 @@ async def set_thread_scope(
     db: AsyncSession = Depends(get_db),
     ctx: UserContext = Depends(get_user_context),
 ):
-    from sqlalchemy import text
-    from app.services.agent.service import get_conversation_for_user
-
     tctx = await _resolve_thread_ctx(db, ctx, bucket_id)
     await get_conversation_for_user(
         db,
@@ -203,10 +201,14 @@ async def list_conversations(
         acting_team_member_id=tctx["team_member_id"],
         can_read_others_threads=tctx["can_read_others_threads"],
     )
-    return {
-        "conversations": [ConversationResponse.model_validate(item) for item in conversations],
-        "total": len(conversations),
-    }
+    # The sidebar refetches this often: return the validated model directly
+    # instead of letting FastAPI dump and re-validate it against response_model.
+    return ORJSONResponse(
+        ConversationListResponse(
+            conversations=[ConversationResponse.model_validate(item) for item in conversations],
+            total=len(conversations),
+        ).model_dump(mode="json")
+    )
 
 
 @router.post("/{bucket_id}/conversations", response_model=ConversationResponse)
@@ -265,10 +267,26 @@ async def get_messages(
         can_read_others_threads=tctx["can_read_others_threads"],
     )
     await _attach_senders(db, messages, ctx, uuid.UUID(bucket_id), tctx)
-    return {
-        "messages": messages,
-        "total": len(messages),
-    }
+    # Validate before the 200 goes out so a bad row is still a clean 500; only
+    # the encoding is streamed, a batch at a time rather than as one buffer.
+    # response_model stays on the route for the OpenAPI schema.
+    validated = [MessageResponse.model_validate(m) for m in messages]
+    return StreamingResponse(_message_list_chunks(validated), media_type="application/json")
+
+
+_MESSAGE_LIST_BATCH = 50
+
+
+async def _message_list_chunks(messages: list[MessageResponse]):
+    """Yield a MessageListResponse body as a JSON object, _MESSAGE_LIST_BATCH
+    already-validated messages per chunk, so the first bytes go out before the
+    whole history is encoded."""
+    yield b'{"total":' + str(len(messages)).encode() + b',"messages":['
+    for start in range(0, len(messages), _MESSAGE_LIST_BATCH):
+        batch = messages[start:start + _MESSAGE_LIST_BATCH]
+        chunk = b",".join(orjson.dumps(m.model_dump(mode="json")) for m in batch)
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
 
 
 @router.post("/{bucket_id}/conversations/{conversation_id}/messages", response_model=AgentReplyResponse)
@@ -403,11 +421,8 @@ async def send_message_stream(
     async def event_stream():
         agent_task = asyncio.create_task(run_agent())
         try:
-            while True:
-                item = await queue.get()
-                if item is DONE:
-                    break
-                yield f"data: {json.dumps(item)}\n\n"
+            async for chunk in drain_sse_queue(queue, DONE):
+                yield chunk
         finally:
             if not agent_task.done():
                 agent_task.cancel()
@@ -429,7 +444,6 @@ async def send_message_stream(
 
 def _serialize_message(message) -> dict:
     """Match MessageResponse shape used by the non-streaming endpoint."""
-    from app.schemas.agent import MessageResponse
     return MessageResponse.model_validate(message).model_dump(mode="json")
 
 
@@ -601,8 +615,6 @@ async def submit_message_feedback(
     db: AsyncSession = Depends(get_db),
     ctx: UserContext = Depends(get_user_context),
 ):
-    from app.services.agent.service import get_conversation_for_user
-
     tctx = await _resolve_thread_ctx(db, ctx, bucket_id)
     await get_conversation_for_user(
         db,
@@ -643,9 +655,6 @@ async def save_message_as_file(
     db: AsyncSession = Depends(get_db),
     ctx: UserContext = Depends(get_user_context),
 ):
-    from app.services.agent.tools import write_file as tool_write_file
-    from app.services.agent.service import get_conversation_for_user
-
     tctx = await _resolve_thread_ctx(db, ctx, bucket_id, require="can_upload_files")
     await get_conversation_for_user(
         db,
@@ -11,7 +11,6 @@ Prefix: ``/demo`` (mounted under ``/v1``).
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 
@@ -29,6 +28,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.sse import drain_sse_queue
 from app.config import settings
 from app.database import get_db
 from app.models.demo import DemoLink
@@ -378,11 +378,9 @@ async def send_message_stream(
     async def event_stream():
         task = asyncio.create_task(run())
         try:
-            while True:
-                item = await queue.get()
-                if item is DONE:
-                    break
-                yield f"data: {json.dumps(item)}\n\n"
+            # Same coalescing and keep-alive as the authenticated chat stream.
+            async for chunk in drain_sse_queue(queue, DONE):
+                yield chunk
         finally:
             if not task.done():
                 task.cancel()
@@ -16,13 +16,13 @@ JWT payload key: user_id  (set by security.create_access_token)
 """
 
 import asyncio
-import json
 import logging
 import uuid
 from urllib.parse import quote
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File as FastAPIFile, status
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,6 +38,7 @@ from app.services.team.permissions import (
     get_bucket_access,
 )
 from app.schemas.files import (
+    CategoryRef,
     ChunkListResponse,
     ChunkResponse,
     DeleteFileResponse,
@@ -49,6 +50,7 @@ from app.schemas.files import (
     LayoutResponse,
     RetryResponse,
 )
+from app.services.dashboard import invalidate_dashboard_stats
 from app.services.pipeline.upload import _normalise_type, intake_upload
 from app.services.quota import enforce_upload_quota
 from app.services.notifications import create_notification
@@ -167,6 +169,7 @@ async def upload_files(
         )
         responses.append(FileUploadResponse.model_validate(file_row))
 
+    invalidate_dashboard_stats(user_id)
     return responses
 
 
@@ -197,9 +200,12 @@ async def list_files(
     for f, cat in rows:
         resp = FileResponse.model_validate(f)
         if cat is not None:
-            resp.category = {"id": cat.id, "name": cat.name, "color": cat.color}
+            resp.category = CategoryRef(id=cat.id, name=cat.name, color=cat.color)
         files.append(resp)
-    return FileListResponse(files=files, total=len(files))
+    # Polled every few seconds while uploads process: the model is already
+    # validated, so return it directly instead of letting FastAPI dump and
+    # re-validate it against response_model (kept for the OpenAPI schema).
+    return ORJSONResponse(FileListResponse(files=files, total=len(files)).model_dump(mode="json"))
 
 
 # ── file detail ──────────────────────────────────────────────────────────────
@@ -246,7 +252,7 @@ async def get_file_layout(
     if row.layout_json_path:
         try:
             raw = download_file(row.layout_json_path)
-            layout_data = json.loads(raw.decode("utf-8"))
+            layout_data = orjson.loads(raw)
         except Exception as exc:
             logger.warning("Could not fetch layout for file %s: %s", file_id, exc)
 
@@ -423,6 +429,7 @@ async def delete_file(
         f'"{file_name}" was deleted from this bucket.',
     )
     await db.commit()
+    invalidate_dashboard_stats(user_id)
 
     return DeleteFileResponse(message="File deleted successfully", file_id=file_id)
 
@@ -579,4 +586,5 @@ async def replace_file(
 
     await schedule_file_processing(str(file_id), trace_run_id, "replace")
 
+    invalidate_dashboard_stats(user_id)
     return FileResponse.model_validate(row)
@@ -11,6 +11,7 @@ on the worker; on the public API it simply rejects anything without the secret.
 
 from __future__ import annotations
 
+import hmac
 import logging
 
 from fastapi import APIRouter, Header, HTTPException, Request
@@ -27,7 +28,10 @@ async def process_file_endpoint(
     request: Request,
     x_processing_secret: str | None = Header(default=None),
 ):
-    if not settings.processing_secret or x_processing_secret != settings.processing_secret:
+    expected = settings.processing_secret
+    if not expected or not hmac.compare_digest(
+        (x_processing_secret or "").encode(), expected.encode()
+    ):
         raise HTTPException(status_code=403, detail="forbidden")
 
     payload = await request.json()
@@ -17,25 +17,29 @@ from __future__ import annotations
 
 import datetime
 import decimal
-import json
 import logging
 import time
 import uuid as _uuid
 
+import orjson
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
 from app.database import db_session
-from app.models.mcp_token import AccountMcpToken, BucketMcpToken, McpAccessLog
+from app.models.bucket import Bucket
+from app.models.mcp_token import AccountMcpToken, BucketMcpToken
+from app.services.mcp.access_log import log_bucket_call
 from app.services.mcp.registry import (
     ACCOUNT_TOOLS,
     BUCKET_TOOLS,
     account_tool_definitions,
     bucket_tool_definitions,
 )
+from app.services.quota import owner_effective_plan
+from app.valkey import get_valkey
 
 logger = logging.getLogger(__name__)
 
@@ -67,15 +71,13 @@ def _json_default(obj):
     return str(obj)
 
 
-def _sanitize(data):
-    """Round-trip through JSON so the payload is fully serializable downstream."""
-    return json.loads(json.dumps(data, default=_json_default))
-
-
 def _tool_ok(data) -> dict:
-    safe = _sanitize(data)
+    # Serialize once: the text block is that JSON, and parsing it back gives a
+    # plain, fully serializable copy for structuredContent.
+    raw = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    safe = orjson.loads(raw)
     return {
-        "content": [{"type": "text", "text": json.dumps(safe)}],
+        "content": [{"type": "text", "text": raw.decode()}],
         "structuredContent": safe if isinstance(safe, dict) else {"value": safe},
         "isError": False,
     }
@@ -85,42 +87,52 @@ def _tool_err(message: str) -> dict:
     return {"content": [{"type": "text", "text": message}], "isError": True}
 
 
-# ── access logging (bucket tokens only) ───────────────────────────────────────
-
-def _client_ip(request: Request) -> str:
-    forwarded = request.headers.get("x-forwarded-for")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+# ── initialize handshake ──────────────────────────────────────────────────────
+
+def _instructions(kind: str) -> str:
+    return (
+        f"AIveilix MCP server ({kind} scope). This server exposes processed knowledge "
+        "from the user's documents.\n\n"
+        "GROUNDING RULES (read first — these are strict):\n"
+        "  1. Answer ONLY from what these tools return. Never use your own general "
+        "knowledge to fill gaps, and never guess.\n"
+        "  2. If the tools return no supporting evidence, say plainly: \"That isn't "
+        "covered in the document(s).\" Do not invent an answer.\n"
+        "  3. ABSENCE CHECK — before concluding something is NOT present (e.g. \"is "
+        "Japanese mentioned?\"), run `search` at least twice: once for the exact term "
+        "and once for a synonym/related term. Only answer \"not found\" if both miss.\n"
+        "  4. COUNTS & STRUCTURE — for \"how many images / pages / sections / visuals / "
+        "chunks\" or \"list every …\", you MUST use the exact tools (`get_file_stats`, "
+        "`list_visuals`, `get_file_layout`, `list_chunks`). NEVER answer counts from "
+        "`search` or `query` — semantic retrieval caps results and undercounts.\n\n"
+        "HOW TO USE — pick the right tool for the job:\n"
+        "  • To ANSWER a question: call `search` to pull the most relevant grounded "
+        "chunks (with citations), then compose the answer YOURSELF from those chunks. "
+        "This is the required path — fastest, grounded, no second model in the loop.\n"
+        "  • `query` is an OPTIONAL fallback that makes the SERVER synthesize a cited "
+        "answer with an internal LLM — use it only for thin/non-AI clients or when you "
+        "cannot compose the answer yourself (it adds latency and a second model that can err).\n"
+        "  • To READ a specific file's full content → `get_file` with the file_id.\n"
+        "  • To LIST what's available → `list_files` or `get_bucket_info`.\n\n"
+        "IMPORTANT — do NOT rely on `get_file_summary` alone. The summary is a short "
+        "high-level overview only and may omit details. To actually read a file, call "
+        "`get_file` (full content) or `search` (grounded chunks across the bucket). "
+        "When in doubt, prefer `search` or `get_file` over the summary."
+    )
 
 
-async def _log_call(
-    db: AsyncSession,
-    *,
-    token: BucketMcpToken,
-    tool: str,
-    status: str,
-    status_code: int,
-    duration_ms: int,
-    request: Request,
-    error_message: str | None = None,
-) -> None:
-    db.add(McpAccessLog(
-        token_id=token.id,
-        bucket_id=token.bucket_id,
-        tool=tool,
-        status=status,
-        status_code=status_code,
-        error_message=error_message,
-        origin=request.headers.get("origin") or request.headers.get("referer"),
-        ip_address=_client_ip(request),
-        duration_ms=duration_ms,
-    ))
-    token.last_used_at = func.now()
-    try:
-        await db.commit()
-    except Exception:
-        await db.rollback()
+# The initialize result only varies by scope and negotiated protocol, and MCP
+# clients repeat the handshake on every (re)connect — build every variant once.
+_INITIALIZE_RESULTS: dict[tuple[str, str], dict] = {
+    (kind, proto): {
+        "protocolVersion": proto,
+        "capabilities": {"tools": {"listChanged": False}},
+        "serverInfo": SERVER_INFO,
+        "instructions": _instructions(kind),
+    }
+    for kind in ("bucket", "account")
+    for proto in SUPPORTED_PROTOCOLS
+}
 
 
 # ── core JSON-RPC message handler ─────────────────────────────────────────────
@@ -129,9 +141,6 @@ async def _check_mcp_rate(db: AsyncSession, owner_id) -> str | None:
     """Per-minute MCP rate limit for the owner's plan. Returns an error message if over, else None."""
     if owner_id is None:
         return None
-    from app.services.quota import owner_effective_plan
-    from app.valkey import get_valkey
-
     try:
         ep = await owner_effective_plan(db, _uuid.UUID(str(owner_id)))
     except Exception:
@@ -183,46 +192,10 @@ async def _handle_message(
         proto = params.get("protocolVersion")
         if proto not in SUPPORTED_PROTOCOLS:
             proto = DEFAULT_PROTOCOL
-        instructions = (
-            f"AIveilix MCP server ({kind} scope). This server exposes processed knowledge "
-            "from the user's documents.\n\n"
-            "GROUNDING RULES (read first — these are strict):\n"
-            "  1. Answer ONLY from what these tools return. Never use your own general "
-            "knowledge to fill gaps, and never guess.\n"
-            "  2. If the tools return no supporting evidence, say plainly: \"That isn't "
-            "covered in the document(s).\" Do not invent an answer.\n"
-            "  3. ABSENCE CHECK — before concluding something is NOT present (e.g. \"is "
-            "Japanese mentioned?\"), run `search` at least twice: once for the exact term "
-            "and once for a synonym/related term. Only answer \"not found\" if both miss.\n"
-            "  4. COUNTS & STRUCTURE — for \"how many images / pages / sections / visuals / "
-            "chunks\" or \"list every …\", you MUST use the exact tools (`get_file_stats`, "
-            "`list_visuals`, `get_file_layout`, `list_chunks`). NEVER answer counts from "
-            "`search` or `query` — semantic retrieval caps results and undercounts.\n\n"
-            "HOW TO USE — pick the right tool for the job:\n"
-            "  • To ANSWER a question: call `search` to pull the most relevant grounded "
-            "chunks (with citations), then compose the answer YOURSELF from those chunks. "
-            "This is the required path — fastest, grounded, no second model in the loop.\n"
-            "  • `query` is an OPTIONAL fallback that makes the SERVER synthesize a cited "
-            "answer with an internal LLM — use it only for thin/non-AI clients or when you "
-            "cannot compose the answer yourself (it adds latency and a second model that can err).\n"
-            "  • To READ a specific file's full content → `get_file` with the file_id.\n"
-            "  • To LIST what's available → `list_files` or `get_bucket_info`.\n\n"
-            "IMPORTANT — do NOT rely on `get_file_summary` alone. The summary is a short "
-            "high-level overview only and may omit details. To actually read a file, call "
-            "`get_file` (full content) or `search` (grounded chunks across the bucket). "
-            "When in doubt, prefer `search` or `get_file` over the summary."
-        )
-        return _result(msg_id, {
-            "protocolVersion": proto,
-            "capabilities": {"tools": {"listChanged": False}},
-            "serverInfo": SERVER_INFO,
-            "instructions": instructions,
-        })
-
-    if method in ("notifications/initialized", "initialized"):
-        return None
+        return _result(msg_id, _INITIALIZE_RESULTS[(kind, proto)])
 
-    if method.startswith("notifications/"):
+    # Any notification (plus the pre-2025 bare "initialized") gets no response.
+    if method == "initialized" or method.startswith("notifications/"):
         return None
 
     if method == "ping":
@@ -255,7 +228,7 @@ async def _handle_message(
                 data = await handler(db, account_token, args)
             duration_ms = int((time.monotonic() - start) * 1000)
             if bucket_token is not None:
-                await _log_call(db, token=bucket_token, tool=name, status="success",
+                log_bucket_call(token=bucket_token, tool=name, status="success",
                                 status_code=200, duration_ms=duration_ms, request=request)
             elif account_token is not None:
                 account_token.last_used_at = func.now()
@@ -269,7 +242,7 @@ async def _handle_message(
             duration_ms = int((time.monotonic() - start) * 1000)
             detail = getattr(exc, "detail", None) or str(exc)
             if bucket_token is not None:
-                await _log_call(db, token=bucket_token, tool=name, status="error",
+                log_bucket_call(token=bucket_token, tool=name, status="error",
                                 status_code=getattr(exc, "status_code", 500),
                                 duration_ms=duration_ms, request=request,
                                 error_message=str(detail)[:500])
@@ -279,6 +252,13 @@ async def _handle_message(
     return None if is_notification else _error(msg_id, -32601, f"Method not found: {method}")
 
 
+# Constant error bodies, serialized once: malformed bodies and dead tokens are
+# what misconfigured clients retry in a loop.
+_PARSE_ERROR = orjson.dumps(_error(None, -32700, "Parse error: invalid JSON."))
+_INVALID_BUCKET_TOKEN = orjson.dumps(_error(None, -32001, "Invalid or revoked MCP token."))
+_INVALID_ACCOUNT_TOKEN = orjson.dumps(_error(None, -32001, "Invalid or revoked account MCP token."))
+
+
 async def _process_request(
     request: Request,
     *,
@@ -293,9 +273,9 @@ async def _process_request(
     user_id=None,
 ) -> Response:
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
     except Exception:
-        return JSONResponse(status_code=400, content=_error(None, -32700, "Parse error: invalid JSON."))
+        return Response(content=_PARSE_ERROR, status_code=400, media_type="application/json")
 
     messages = body if isinstance(body, list) else [body]
     responses = []
@@ -316,7 +296,7 @@ async def _process_request(
         return Response(status_code=202)
 
     payload = responses if isinstance(body, list) else responses[0]
-    return JSONResponse(status_code=200, content=payload)
+    return ORJSONResponse(status_code=200, content=payload)
 
 
 # ── bucket endpoint ───────────────────────────────────────────────────────────
@@ -329,24 +309,24 @@ async def mcp_bucket_endpoint(token: str, request: Request):
         )
         mcp_token = result.scalar_one_or_none()
         if mcp_token is None or not mcp_token.is_active:
-            return JSONResponse(status_code=401, content=_error(None, -32001, "Invalid or revoked MCP token."))
+            return Response(content=_INVALID_BUCKET_TOKEN, status_code=401, media_type="application/json")
 
         allowed = set(mcp_token.allowed_tools or [])
 
         # Lite buckets do NOT expose `query` (server-side LLM synthesis). The
         # plan economics rely on letting the user's own AI answer; we just
         # provide grounded data. `search` + every read tool remain available.
-        from app.models.bucket import Bucket as _Bucket
-
-        bucket_row = await db.get(_Bucket, mcp_token.bucket_id)
-        tier = (getattr(bucket_row, "processing_tier", None) or "full").lower()
-        if tier == "lite":
-            allowed.discard("query")
+        # Tokens without `query` skip the bucket lookup entirely.
+        if "query" in allowed:
+            bucket_row = await db.get(Bucket, mcp_token.bucket_id)
+            tier = (getattr(bucket_row, "processing_tier", None) or "full").lower()
+            if tier == "lite":
+                allowed.discard("query")
 
         return await _process_request(
             request,
             kind="bucket",
-            tool_defs=bucket_tool_definitions(list(allowed)),
+            tool_defs=bucket_tool_definitions(allowed),
             tools=BUCKET_TOOLS,
             allowed=allowed,
             bucket_token=mcp_token,
@@ -366,7 +346,7 @@ async def mcp_account_endpoint(token: str, request: Request):
         )
         account_token = result.scalar_one_or_none()
         if account_token is None or not account_token.is_active:
-            return JSONResponse(status_code=401, content=_error(None, -32001, "Invalid or revoked account MCP token."))
+            return Response(content=_INVALID_ACCOUNT_TOKEN, status_code=401, media_type="application/json")
 
         return await _process_request(
             request,
@@ -383,13 +363,21 @@ async def mcp_account_endpoint(token: str, request: Request):
 
 # ── GET / DELETE (Streamable HTTP transport niceties) ─────────────────────────
 
+# Streamable HTTP clients probe GET on every connect to open an SSE stream; the
+# refusal never changes, so serialize it once.
+_GET_NOT_ALLOWED = orjson.dumps(
+    _error(None, -32000, "This MCP endpoint accepts POST requests only.")
+)
+
+
 @router.get("/bucket/{token}")
 @router.get("/account/{token}")
 async def mcp_get(token: str):
     # Server-initiated SSE streams are not used — clients must POST.
-    return JSONResponse(
+    return Response(
+        content=_GET_NOT_ALLOWED,
         status_code=405,
-        content=_error(None, -32000, "This MCP endpoint accepts POST requests only."),
+        media_type="application/json",
         headers={"Allow": "POST"},
     )
 
@@ -30,7 +30,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import db_session
-from app.models.mcp_token import BucketMcpToken, McpAccessLog
+from app.models.mcp_token import BucketMcpToken
+from app.services.agent.retrieval import search_bucket_documents
+from app.services.mcp.access_log import log_bucket_call
+from app.services.mcp.answer_cache import answer_bucket_question
+from app.services.mcp.tools import (
+    fetch_bucket_info,
+    fetch_file_spread,
+    fetch_files_list,
+    fetch_page_blocks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,46 +79,6 @@ async def _auth(
     return token
 
 
-def _get_ip(request: Request) -> str:
-    forwarded = request.headers.get("x-forwarded-for")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
-
-
-async def _log(
-    db: AsyncSession,
-    *,
-    token: BucketMcpToken,
-    tool: str,
-    status: str,
-    status_code: int,
-    duration_ms: int,
-    request: Request,
-    error_message: str | None = None,
-) -> None:
-    origin = request.headers.get("origin") or request.headers.get("referer")
-    log = McpAccessLog(
-        token_id=token.id,
-        bucket_id=token.bucket_id,
-        tool=tool,
-        status=status,
-        status_code=status_code,
-        error_message=error_message,
-        origin=origin,
-        ip_address=_get_ip(request),
-        duration_ms=duration_ms,
-    )
-    db.add(log)
-    # Update last_used_at on token
-    from sqlalchemy.sql import func
-    token.last_used_at = func.now()
-    try:
-        await db.commit()
-    except Exception:
-        await db.rollback()
-
-
 async def _run_tool(
     db: AsyncSession,
     raw_token: str,
@@ -124,20 +93,20 @@ async def _run_tool(
         token = await _auth(db, raw_token, tool, request)
         result = await handler(db, token)
         duration_ms = int((time.monotonic() - start) * 1000)
-        await _log(db, token=token, tool=tool, status="success", status_code=200, duration_ms=duration_ms, request=request)
+        log_bucket_call(token=token, tool=tool, status="success", status_code=200, duration_ms=duration_ms, request=request)
         logger.info("[MCP] tool=%s bucket=%s duration=%dms", tool, token.bucket_id, duration_ms)
         return result
     except HTTPException as exc:
         duration_ms = int((time.monotonic() - start) * 1000)
         status = "forbidden" if exc.status_code == 403 else "error"
         if token:
-            await _log(db, token=token, tool=tool, status=status, status_code=exc.status_code, duration_ms=duration_ms, request=request, error_message=exc.detail)
+            log_bucket_call(token=token, tool=tool, status=status, status_code=exc.status_code, duration_ms=duration_ms, request=request, error_message=exc.detail)
         logger.warning("[MCP] tool=%s status=%d detail=%s", tool, exc.status_code, exc.detail)
         raise
     except Exception as exc:
         duration_ms = int((time.monotonic() - start) * 1000)
         if token:
-            await _log(db, token=token, tool=tool, status="error", status_code=500, duration_ms=duration_ms, request=request, error_message=str(exc)[:500])
+            log_bucket_call(token=token, tool=tool, status="error", status_code=500, duration_ms=duration_ms, request=request, error_message=str(exc)[:500])
         logger.exception("[MCP] tool=%s unexpected error: %s", tool, exc)
         raise HTTPException(status_code=500, detail="Internal MCP error.")
 
@@ -151,6 +120,7 @@ class SearchRequest(BaseModel):
 
 class QueryRequest(BaseModel):
     question: str
+    fresh: bool = False
 
 
 # ── 1. search ─────────────────────────────────────────────────────────────────
@@ -159,7 +129,6 @@ class QueryRequest(BaseModel):
 async def mcp_search(token: str, body: SearchRequest, request: Request):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.agent.retrieval import search_bucket_documents
             chunks = await search_bucket_documents(db, tok.bucket_id, body.query, limit=min(body.top_k, 10))
             return {
                 "results": [
@@ -184,18 +153,10 @@ async def mcp_search(token: str, body: SearchRequest, request: Request):
 async def mcp_query(token: str, body: QueryRequest, request: Request):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.agent.service import answer_bucket_query
-            resp = await answer_bucket_query(
-                db,
-                user_id=str(tok.user_id),
-                bucket_id=str(tok.bucket_id),
-                question=body.question,
+            return await answer_bucket_question(
+                db, user_id=tok.user_id, bucket_id=tok.bucket_id, question=body.question,
+                fresh=body.fresh,
             )
-            return {
-                "answer": resp.answer,
-                "sources": resp.sources,
-                "used_web_search": resp.used_web_search,
-            }
         return await _run_tool(db, token, "query", request, handler)
 
 
@@ -205,7 +166,6 @@ async def mcp_query(token: str, body: QueryRequest, request: Request):
 async def mcp_list_files(token: str, request: Request):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.mcp.tools import fetch_files_list
             files = await fetch_files_list(db, tok.bucket_id)
             return {"files": files, "total": len(files)}
         return await _run_tool(db, token, "list_files", request, handler)
@@ -217,7 +177,6 @@ async def mcp_list_files(token: str, request: Request):
 async def mcp_get_file(token: str, file_id: str, request: Request):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.mcp.tools import fetch_file_spread
             try:
                 fid = uuid.UUID(file_id)
             except ValueError:
@@ -240,7 +199,6 @@ async def mcp_get_layout(
 ):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.mcp.tools import fetch_page_blocks
             try:
                 fid = uuid.UUID(file_id)
             except ValueError:
@@ -258,7 +216,6 @@ async def mcp_get_layout(
 async def mcp_bucket_info(token: str, request: Request):
     async with db_session() as db:
         async def handler(db, tok):
-            from app.services.mcp.tools import fetch_bucket_info
             data = await fetch_bucket_info(db, tok.bucket_id)
             if data is None:
                 raise HTTPException(status_code=404, detail="Bucket not found.")
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -429,7 +430,10 @@ async def get_team_activity(
             if m.member_user_id and m.member_user_id in online_user_ids
         ]
 
-    return TeamActivityResponse(items=items, online_member_ids=online_ids)
+    # Polled by the activity feed; skip the response_model re-validation pass.
+    return ORJSONResponse(
+        TeamActivityResponse(items=items, online_member_ids=online_ids).model_dump(mode="json")
+    )
 
 
 # ---------- Public invite accept ----------
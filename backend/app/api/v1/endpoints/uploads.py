@@ -36,6 +36,7 @@ from app.schemas.uploads import (
     UploadPartsResponse,
     UploadPartUrl,
 )
+from app.services.dashboard import invalidate_dashboard_stats
 from app.services.notifications import create_notification
 from app.services.pipeline.upload import finalize_r2_upload
 from app.services.quota import enforce_upload_quota
@@ -310,6 +311,7 @@ async def complete_upload(
 
     await schedule_file_processing(str(file_row.id), trace_run_id, "upload")
 
+    invalidate_dashboard_stats(session.user_id)
     return FileUploadResponse.model_validate(file_row)
 
 
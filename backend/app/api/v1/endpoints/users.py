@@ -1,4 +1,4 @@
-from datetime import datetime, date
+from datetime import date
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,8 +26,12 @@ router = APIRouter(prefix="/user", tags=["user"])
 def _parse_month(value: str | None, field_name: str) -> date | None:
     if not value:
         return None
+    # Accepts an unpadded month ("2026-1") like strptime("%Y-%m") did.
+    year, _, month = value.partition("-")
     try:
-        return datetime.strptime(value, "%Y-%m").date().replace(day=1)
+        if not (year.isdigit() and month.isdigit()):
+            raise ValueError(value)
+        return date(int(year), int(month), 1)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid {field_name}. Use YYYY-MM.") from exc
 
@@ -0,0 +1,56 @@
+"""
+Server-Sent Events framing shared by the chat streams (authenticated and demo).
+
+Agent callbacks put event dicts on an asyncio.Queue, followed by a `done`
+sentinel; drain_sse_queue turns that queue into the byte chunks a
+StreamingResponse sends.
+"""
+
+import asyncio
+
+import orjson
+
+SSE_PING_INTERVAL = 15.0  # seconds of silence before a keep-alive comment
+SSE_PING = b": ping\n\n"
+
+
+def sse_batch(items: list, done: object) -> tuple[bytes, bool]:
+    """Render queued stream items as one SSE chunk, merging consecutive token
+    deltas into a single event. Returns (chunk, reached_done); the chunk is
+    bytes so StreamingResponse sends it without re-encoding."""
+    events: list[dict] = []
+    finished = False
+    for item in items:
+        if item is done:
+            finished = True
+            break
+        if item["kind"] == "token" and events and events[-1]["kind"] == "token":
+            events[-1] = {"kind": "token", "text": events[-1]["text"] + item["text"]}
+        else:
+            events.append(item)
+    return b"".join(
+        b"data: " + orjson.dumps(e, option=orjson.OPT_NON_STR_KEYS) + b"\n\n" for e in events
+    ), finished
+
+
+async def drain_sse_queue(queue: asyncio.Queue, done: object):
+    """Yield SSE chunks from an agent event queue until `done` is reached.
+
+    Whatever queued up while the last chunk was being written goes out with the
+    next one, as a single write. While the agent is silent (a long tool call or
+    a slow first token) a comment frame is sent every SSE_PING_INTERVAL so
+    proxies don't drop the idle connection; clients skip frames without data.
+    """
+    while True:
+        try:
+            items = [await asyncio.wait_for(queue.get(), SSE_PING_INTERVAL)]
+        except asyncio.TimeoutError:
+            yield SSE_PING
+            continue
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        chunk, finished = sse_batch(items, done)
+        if chunk:
+            yield chunk
+        if finished:
+            return
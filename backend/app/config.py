@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import field_validator
@@ -151,7 +151,8 @@ class Settings(BaseSettings):
     frontend_allowed_origins: str = ""
     vite_dev_port: int = 5173
 
-    @property
+    # Comma-separated env values are parsed once per Settings instance and cached.
+    @cached_property
     def cors_origins(self) -> list[str]:
         origins = [self.frontend_url, *self.frontend_allowed_origins.split(",")]
         if self.app_env == "development":
@@ -168,9 +169,19 @@ class Settings(BaseSettings):
                 seen.add(cleaned)
         return out
 
+    @cached_property
+    def admin_email_set(self) -> frozenset[str]:
+        """Lower-cased ADMIN_EMAILS allowlist for membership checks."""
+        return frozenset(e.strip().lower() for e in self.admin_emails.split(",") if e.strip())
+
     # MCP
     mcp_base_url: str = "https://mcp.aiveilix.com"
 
+    @cached_property
+    def mcp_endpoint_base(self) -> str:
+        """Public prefix for per-token MCP endpoint URLs."""
+        return f"{self.mcp_base_url.rstrip('/')}/v1/mcp"
+
     # Agentic RAG loop — bounded planner-executor for multi-part questions
     agentic_rag_loop_enabled: bool = False
     agentic_rag_loop_max_subquestions: int = 8
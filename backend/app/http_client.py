@@ -0,0 +1,21 @@
+"""Process-wide httpx client for outbound HTTP calls (OAuth providers, agent fetch_url)."""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(limits=_LIMITS, timeout=httpx.Timeout(15.0))
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
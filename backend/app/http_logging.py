@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
+import secrets
 import time
-import uuid
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exception_handlers import (
@@ -10,17 +10,19 @@ from fastapi.exception_handlers import (
     request_validation_exception_handler,
 )
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+from app.logging_config import request_id_var
 
 logger = logging.getLogger("app.http")
 
 
 def _request_id(request: Request) -> str:
-    rid = getattr(request.state, "request_id", None)
+    rid = request_id_var.get()
     if rid:
         return rid
-    rid = request.headers.get("x-request-id") or uuid.uuid4().hex[:12]
-    request.state.request_id = rid
+    rid = request.headers.get("x-request-id") or secrets.token_hex(6)
+    request_id_var.set(rid)
     return rid
 
 
@@ -33,13 +35,19 @@ def _request_meta(request: Request) -> dict[str, str]:
 def install_http_logging(app: FastAPI) -> None:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        rid = _request_id(request)
-        meta = _request_meta(request)
+        # CORS preflights are answered by CORSMiddleware without touching a route;
+        # don't spend a request id and an access-log line on each one.
+        if request.method == "OPTIONS" and "access-control-request-method" in request.headers:
+            return await call_next(request)
+
+        rid = request.headers.get("x-request-id") or secrets.token_hex(6)
+        rid_token = request_id_var.set(rid)
         started = time.perf_counter()
 
         try:
             response = await call_next(request)
         except Exception:
+            meta = _request_meta(request)
             logger.exception(
                 "[HTTP] %s %s unhandled rid=%s origin=%s client=%s",
                 request.method,
@@ -48,48 +56,51 @@ def install_http_logging(app: FastAPI) -> None:
                 meta["origin"],
                 meta["client"],
             )
-            response = JSONResponse(
+            response = ORJSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error.", "request_id": rid},
                 headers={"X-Request-ID": rid},
             )
         response.headers.setdefault("X-Request-ID", rid)
 
-        duration_ms = int((time.perf_counter() - started) * 1000)
-        message = (
-            "[HTTP] %s %s -> %s %dms rid=%s origin=%s client=%s"
-            % (
+        if response.status_code >= 500:
+            level = logging.ERROR
+        elif response.status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        # Skip header lookups and formatting entirely when the level is filtered out.
+        if logger.isEnabledFor(level):
+            meta = _request_meta(request)
+            logger.log(
+                level,
+                "[HTTP] %s %s -> %s %dms rid=%s origin=%s client=%s",
                 request.method,
                 request.url.path,
                 response.status_code,
-                duration_ms,
+                int((time.perf_counter() - started) * 1000),
                 rid,
                 meta["origin"],
                 meta["client"],
             )
-        )
-        if response.status_code >= 500:
-            logger.error(message)
-        elif response.status_code >= 400:
-            logger.warning(message)
-        else:
-            logger.info(message)
+        request_id_var.reset(rid_token)
         return response
 
     @app.exception_handler(HTTPException)
     async def log_http_exception(request: Request, exc: HTTPException):
         rid = _request_id(request)
-        meta = _request_meta(request)
-        logger.warning(
-            "[HTTP] %s %s raised HTTPException status=%s rid=%s detail=%r origin=%s client=%s",
-            request.method,
-            request.url.path,
-            exc.status_code,
-            rid,
-            exc.detail,
-            meta["origin"],
-            meta["client"],
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            meta = _request_meta(request)
+            logger.warning(
+                "[HTTP] %s %s raised HTTPException status=%s rid=%s detail=%r origin=%s client=%s",
+                request.method,
+                request.url.path,
+                exc.status_code,
+                rid,
+                exc.detail,
+                meta["origin"],
+                meta["client"],
+            )
         response = await http_exception_handler(request, exc)
         response.headers.setdefault("X-Request-ID", rid)
         return response
@@ -97,16 +108,17 @@ def install_http_logging(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def log_validation_exception(request: Request, exc: RequestValidationError):
         rid = _request_id(request)
-        meta = _request_meta(request)
-        logger.warning(
-            "[HTTP] %s %s validation_failed rid=%s errors=%s origin=%s client=%s",
-            request.method,
-            request.url.path,
-            rid,
-            exc.errors(),
-            meta["origin"],
-            meta["client"],
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            meta = _request_meta(request)
+            logger.warning(
+                "[HTTP] %s %s validation_failed rid=%s errors=%s origin=%s client=%s",
+                request.method,
+                request.url.path,
+                rid,
+                exc.errors(),
+                meta["origin"],
+                meta["client"],
+            )
         response = await request_validation_exception_handler(request, exc)
         response.headers.setdefault("X-Request-ID", rid)
         return response
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
+from contextvars import ContextVar
+from datetime import datetime, timezone
 
 try:
     import colorlog as _colorlog
@@ -10,6 +13,11 @@ except ImportError:  # pragma: no cover
     _colorlog = None  # type: ignore[assignment]
     _HAS_COLORLOG = False
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None  # type: ignore[assignment]
+
 
 # ANSI colors applied to [TAG] prefixes in agent log lines
 _TAG_COLORS: dict[str, str] = {
@@ -47,7 +55,32 @@ else:
             return super().format(record)
 
 
-def setup_logging(level: str = "INFO") -> None:
+# Set once per HTTP request by the access-log middleware, so every log line
+# emitted while serving it (handlers, services, background tasks) can carry it.
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per line — Cloud Logging parses `severity`/`message` natively."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, object] = {
+            "severity": record.levelname,
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        rid = request_id_var.get()
+        if rid:
+            entry["request_id"] = rid
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if _orjson is not None:
+            return _orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def setup_logging(level: str = "INFO", json_logs: bool = False) -> None:
     root = logging.getLogger()
     root.setLevel(level)
     for h in root.handlers[:]:
@@ -55,7 +88,9 @@ def setup_logging(level: str = "INFO") -> None:
 
     handler = logging.StreamHandler()
 
-    if _HAS_COLORLOG:
+    if json_logs:
+        handler.setFormatter(_JsonFormatter())
+    elif _HAS_COLORLOG:
         handler.setFormatter(
             _Formatter(
                 "%(log_color)s%(levelname)-8s%(reset)s  "
@@ -1,16 +1,21 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.http_logging import install_http_logging
 from app.logging_config import setup_logging
 
-setup_logging(level="DEBUG" if settings.app_env == "development" else "INFO")
+setup_logging(
+    level="DEBUG" if settings.app_env == "development" else "INFO",
+    json_logs=settings.app_env != "development",
+)
 from app.database import engine
+from app.http_client import close_http_client
 from app.qdrant_client import close_qdrant_clients
 from app.services.health import get_dependency_health_report
+from app.services.mcp.access_log import drain_access_logs
 from app.services.qdrant.file_indexer import ensure_collections
 from app.valkey import close_valkey
 from app.api.v1.router import router as v1_router
@@ -29,6 +34,8 @@ async def lifespan(app: FastAPI):
 
     yield
     # Shutdown
+    await drain_access_logs()
+    await close_http_client()
     await close_qdrant_clients()
     await close_valkey()
     await engine.dispose()
@@ -40,6 +47,7 @@ app = FastAPI(
     docs_url="/docs" if settings.app_env == "development" else None,
     redoc_url="/redoc" if settings.app_env == "development" else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -48,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 install_http_logging(app)
 
@@ -58,4 +67,4 @@ app.include_router(v1_router, prefix="/v1")
 async def health():
     report = await get_dependency_health_report()
     status_code = 200 if report["status"] == "ok" else 503
-    return JSONResponse(status_code=status_code, content=report)
+    return ORJSONResponse(status_code=status_code, content=report)
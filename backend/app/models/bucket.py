@@ -11,6 +11,9 @@ from app.database import Base
 
 class Bucket(Base):
     __tablename__ = "buckets"
+    # Fetch created_at/updated_at via RETURNING on INSERT and UPDATE, so callers
+    # can render a bucket right after commit without a refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
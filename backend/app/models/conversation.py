@@ -51,11 +51,16 @@ class Conversation(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     bucket: Mapped["Bucket"] = relationship("Bucket", back_populates="conversations")
-    messages: Mapped[list["Message"]] = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
+    # passive_deletes: the FKs are ON DELETE CASCADE, so deleting a conversation
+    # is one DELETE; the ORM doesn't load and delete every child row first.
+    messages: Mapped[list["Message"]] = relationship(
+        "Message", back_populates="conversation", cascade="all, delete-orphan", passive_deletes=True
+    )
     memory_chunks: Mapped[list["ConversationChunk"]] = relationship(
         "ConversationChunk",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -107,6 +112,7 @@ class Message(Base):
         "ConversationChunk",
         back_populates="message",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -37,6 +37,7 @@ class TurnInput:
     user_id: uuid.UUID
     scope_file_ids: list[uuid.UUID] | None = None  # thread file scope (None = full bucket, [] = no files, [...] = subset)
     current_speaker: str | None = None             # display name of the team member sending this turn (None = workspace owner)
+    file_index: dict[str | uuid.UUID, uuid.UUID] | None = field(default=None, repr=False, compare=False)  # built lazily by the tools' file resolver
 
 
 @dataclass(slots=True)
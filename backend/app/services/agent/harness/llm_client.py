@@ -15,13 +15,14 @@ One interface used by the runner:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import uuid as _uuid
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -292,7 +293,7 @@ class _OpenAIStyleClient(LLMClient):
                             "type": "function",
                             "function": {
                                 "name": c["name"],
-                                "arguments": json.dumps(c["args"]),
+                                "arguments": orjson.dumps(c["args"]).decode(),
                             },
                         } for c in tool_calls
                     ]
@@ -333,7 +334,7 @@ class _OpenAIStyleClient(LLMClient):
         calls: list[ToolCall] = []
         for tc in tool_calls:
             try:
-                args = json.loads(tc.function.arguments or "{}")
+                args = orjson.loads(tc.function.arguments or "{}")
             except Exception:
                 args = {}
             calls.append(ToolCall(
@@ -460,6 +461,18 @@ class _GeminiClient(LLMClient):
 _ACTION_RE = re.compile(r"^\s*ACTION:\s*([a-z_]+)\s*(\{.*\})?\s*$", re.IGNORECASE | re.MULTILINE)
 _ANSWER_RE = re.compile(r"^\s*ANSWER:\s*(.+)$", re.IGNORECASE | re.MULTILINE | re.DOTALL)
 
+_REACT_FORMAT = (
+    "Format every message exactly as:\n"
+    "THOUGHT: <one short line about what you'll do or learned>\n"
+    "ACTION: <tool_name> {\"arg\": \"value\", ...}\n"
+    "OR when finished:\n"
+    "THOUGHT: <one short line>\n"
+    "ANSWER: <your final reply to the user>"
+)
+# Rendered tool docs keyed by the tool names offered. The registry is static
+# for the process, so every ReAct step of every turn re-sends the same text.
+_TOOLS_DOC_CACHE: dict[tuple[str, ...], str] = {}
+
 
 class _ReActClient(LLMClient):
     """Text-protocol fallback. The model emits ACTION:/ANSWER: lines.
@@ -479,6 +492,10 @@ class _ReActClient(LLMClient):
         self._underlying = configured[0] if configured else "claude"
 
     def _tools_doc(self, tools):
+        key = tuple(t["name"] for t in tools)
+        cached = _TOOLS_DOC_CACHE.get(key)
+        if cached is not None:
+            return cached
         lines = ["Available tools:"]
         for t in tools:
             lines.append(f"- {t['name']}: {t['description']}")
@@ -487,15 +504,9 @@ class _ReActClient(LLMClient):
                 desc = v.get("description") if isinstance(v, dict) else ""
                 lines.append(f"    {k}: {desc}")
         lines.append("")
-        lines.append(
-            "Format every message exactly as:\n"
-            "THOUGHT: <one short line about what you'll do or learned>\n"
-            "ACTION: <tool_name> {\"arg\": \"value\", ...}\n"
-            "OR when finished:\n"
-            "THOUGHT: <one short line>\n"
-            "ANSWER: <your final reply to the user>"
-        )
-        return "\n".join(lines)
+        lines.append(_REACT_FORMAT)
+        _TOOLS_DOC_CACHE[key] = doc = "\n".join(lines)
+        return doc
 
     async def chat(self, system_prompt, messages, tools):
         text_prompt = system_prompt + "\n\n" + self._tools_doc(tools)
@@ -506,16 +517,17 @@ class _ReActClient(LLMClient):
             return reply
 
         text = (reply.text or "").strip()
-        answer_match = _ANSWER_RE.search(text)
+        upper = text.upper()
+        answer_match = _ANSWER_RE.search(text) if "ANSWER:" in upper else None
         if answer_match:
             return Reply(kind="text", text=answer_match.group(1).strip())
 
-        action_match = _ACTION_RE.search(text)
+        action_match = _ACTION_RE.search(text) if "ACTION:" in upper else None
         if action_match:
             name = action_match.group(1).strip()
             raw_args = action_match.group(2) or "{}"
             try:
-                args = json.loads(raw_args)
+                args = orjson.loads(raw_args)
             except Exception:
                 args = {}
             return Reply(
@@ -368,13 +368,14 @@ class AgentRunner:
                 any_new = True
             if result.success and result.summary and "no matches" not in result.summary.lower():
                 any_new = True
-            logger.info(
-                "[TURN %s] tool=%s success=%s srcs=%d step=%d/%d stall=%d elapsed=%.1fs",
-                str(turn.conversation_id)[:8],
-                call.name, result.success, sources_added,
-                state.total_steps, MAX_TOOL_CALLS,
-                state.stall_count, state.elapsed_seconds(),
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[TURN %s] tool=%s success=%s srcs=%d step=%d/%d stall=%d elapsed=%.1fs",
+                    str(turn.conversation_id)[:8],
+                    call.name, result.success, sources_added,
+                    state.total_steps, MAX_TOOL_CALLS,
+                    state.stall_count, state.elapsed_seconds(),
+                )
             observations.append({
                 "role": "tool",
                 "tool_call_id": call.id,
@@ -531,13 +532,15 @@ async def _stream_final_text(text: str, on_event: EventCallback | None) -> None:
     """Chunk the final text into small tokens so the UI feels live."""
     if on_event is None:
         return
-    words = text.split(" ")
     buf: list[str] = []
-    for w in words:
+    size = -1  # running len(" ".join(buf)) — no rejoin per word
+    for w in text.split(" "):
         buf.append(w)
-        if len(" ".join(buf)) >= 32:
+        size += len(w) + 1
+        if size >= 32:
             await emit_token(on_event, " ".join(buf) + " ")
             buf = []
+            size = -1
     if buf:
         await emit_token(on_event, " ".join(buf))
 
@@ -99,7 +99,7 @@ class AgentState:
     def fingerprint(self, name: str, args: dict[str, object]) -> str:
         """Stable hash of a tool call. Used to detect repeat calls."""
         normalized = json.dumps(args, sort_keys=True, default=str)
-        return hashlib.sha1(f"{name}|{normalized}".encode("utf-8")).hexdigest()
+        return hashlib.sha1(f"{name}|{normalized}".encode("utf-8"), usedforsecurity=False).hexdigest()
 
     def elapsed_seconds(self) -> float:
         return time.monotonic() - self.started_at
@@ -153,18 +153,26 @@ class AgentState:
     def commit_pending_sources(self) -> None:
         """Promote any pending source (added by a tool that was used) to the
         final-used list. Called after the model writes its final answer."""
-        for src in self.pending_doc_sources:
-            if src not in self.used_doc_sources:
-                self.used_doc_sources.append(src)
-        for src in self.pending_web_sources:
-            if src not in self.used_web_sources:
-                self.used_web_sources.append(src)
+        _append_unique(self.used_doc_sources, self.pending_doc_sources)
+        _append_unique(self.used_web_sources, self.pending_web_sources)
 
     def reset_pending_sources(self) -> None:
         self.pending_doc_sources = []
         self.pending_web_sources = []
 
 
+def _append_unique(used: list[dict[str, object]], pending: list[dict[str, object]]) -> None:
+    """Append each pending source not already in `used`, keeping order. Source
+    payloads hold only scalar values, so their items hash and one key set
+    replaces a scan of `used` per source."""
+    seen = {frozenset(src.items()) for src in used}
+    for src in pending:
+        key = frozenset(src.items())
+        if key not in seen:
+            seen.add(key)
+            used.append(src)
+
+
 # ─── budget caps (from the design doc §9) ────────────────────────────────────
 
 MAX_TOOL_CALLS = 30  # raised from 15 — multi-question turns decompose into one search per question
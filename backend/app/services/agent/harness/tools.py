@@ -16,6 +16,7 @@ import json
 import logging
 import uuid
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -75,29 +76,39 @@ def _uuid(value: object) -> uuid.UUID | None:
         return None
 
 
-def _resolve_file_uuid(
-    raw: object,
-    bucket_files: list,  # list[BucketFile]
-) -> uuid.UUID | None:
+def _file_index(turn: TurnInput) -> dict[str | uuid.UUID, uuid.UUID]:
+    """Lookup table for the turn's files, built once and reused by every tool
+    call: file id → itself, plus lowercased name and stem (text before the
+    first dot) → file id. The first file to claim a name keeps it."""
+    index = turn.file_index
+    if index is None:
+        index = {}
+        for f in turn.bucket_files:
+            index[f.file_id] = f.file_id
+            name = f.name.lower()
+            index.setdefault(name, f.file_id)
+            index.setdefault(name.split(".")[0], f.file_id)
+        turn.file_index = index
+    return index
+
+
+def _resolve_file_uuid(raw: object, turn: TurnInput) -> uuid.UUID | None:
     """Accept either a UUID string or a (case-insensitive) file name.
 
-    Only resolves to a file the thread is allowed to use: `bucket_files` is
+    Only resolves to a file the thread is allowed to use: `turn.bucket_files` is
     already filtered to the thread's scope, so a raw UUID for a blocked (or
     cross-bucket) file returns None instead of leaking it.
     """
     if not raw:
         return None
-    allowed = {f.file_id for f in bucket_files}
+    index = _file_index(turn)
     direct = _uuid(raw)
     if direct is not None:
-        return direct if direct in allowed else None
+        return index.get(direct)
     needle = str(raw).strip().lower()
     if not needle:
         return None
-    for f in bucket_files:
-        if f.name.lower() == needle or f.name.lower().split(".")[0] == needle:
-            return f.file_id
-    return None
+    return index.get(needle)
 
 
 def _truncate(text: str, limit: int = 2400) -> str:
@@ -125,12 +136,9 @@ def _doc_source_payload(chunk) -> dict[str, object]:
 
 
 def _web_source_payload(result) -> dict[str, object]:
-    from urllib.parse import urlparse
-    parsed = urlparse(result.url)
-    label = f"[web] {parsed.netloc}{parsed.path or ''}"
     return {
         "kind": "web",
-        "label": label,
+        "label": retrieval_mod._web_source_label(result.url),
         "url": result.url,
         "title": result.title,
         "score": round(float(result.score or 0.0), 4),
@@ -182,7 +190,7 @@ async def _t_list_bucket_members(state, turn, db, args):
 
 
 async def _t_get_file_summary(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None:
         return ToolResult(summary="error: file_id is required and must match a real file.", success=False)
     result = await legacy_tools.get_file_summary(db, file_id=file_id)
@@ -202,7 +210,7 @@ async def _t_get_file_summary(state, turn, db, args):
 
 
 async def _t_read_file(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None:
         return ToolResult(summary="error: file_id is required and must match a real file.", success=False)
     result = await legacy_tools.read_file(db, bucket_id=turn.bucket_id, file_id=file_id)
@@ -226,7 +234,7 @@ async def _t_search_documents(state, turn, db, args):
     if not query:
         return ToolResult(summary="error: query is required.", success=False)
 
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     # Preserve the 3 states: None = full bucket, [] = no files, [...] = subset.
     scope = turn.scope_file_ids
 
@@ -278,7 +286,7 @@ async def _t_search_documents(state, turn, db, args):
 
 
 async def _t_get_file_stats(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -310,7 +318,7 @@ async def _t_read_outline(state, turn, db, args):
     """Return the COMPLETE section outline (every heading + its page) — the
     document's table of contents. Use for 'list all headings / headlines /
     sections'. Paged at 200 headings per call via `offset` for huge docs."""
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -355,7 +363,7 @@ async def _t_read_outline(state, turn, db, args):
 
 
 async def _t_get_page(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -390,7 +398,7 @@ async def _t_get_page(state, turn, db, args):
 
 
 async def _t_get_visual(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -428,7 +436,7 @@ async def _t_get_visual(state, turn, db, args):
 
 
 async def _t_list_visuals(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -486,7 +494,7 @@ async def _t_list_visuals(state, turn, db, args):
 
 
 async def _t_get_section(state, turn, db, args):
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -533,7 +541,7 @@ async def _t_read_all_chunks(state, turn, db, args):
     exhaustive path — use it for 'extract all / list every / summarize the whole
     file', NOT semantic search (which caps and undercounts). Completeness, not
     order, is what this guarantees."""
-    file_id = _resolve_file_uuid(args.get("file_id"), turn.bucket_files)
+    file_id = _resolve_file_uuid(args.get("file_id"), turn)
     if file_id is None and len(turn.bucket_files) == 1:
         file_id = turn.bucket_files[0].file_id
     if file_id is None:
@@ -544,12 +552,15 @@ async def _t_read_all_chunks(state, turn, db, args):
         offset = 0
 
     BATCH = 40  # chunks per call — page through with offset for the rest
-    payload = await bucket_data.fetch_chunks_list(db, turn.bucket_id, file_id)
+    # Only this batch's chunks are loaded — a full scan pages through the file
+    # instead of re-reading every chunk on every call.
+    payload = await bucket_data.fetch_chunks_list(
+        db, turn.bucket_id, file_id, offset=offset, limit=BATCH,
+    )
     if payload is None:
         return ToolResult(summary="No content — file not found or not ready.", success=False)
-    chunks = payload.get("chunks", [])
-    total = payload.get("total_chunks", len(chunks))
-    window = chunks[offset:offset + BATCH]
+    window = payload.get("chunks", [])
+    total = payload.get("total_chunks", offset + len(window))
     if not window:
         return ToolResult(
             summary=f"No chunks at offset {offset} — the file has {total} chunks total.",
@@ -654,11 +665,16 @@ async def _t_recall_memory(state, turn, db, args):
     )
 
 
+def _first_nonblank(values, n: int) -> list[str]:
+    """Up to `n` non-blank stringified values, stripped, without scanning the rest."""
+    return list(islice(filter(None, (str(v).strip() for v in values)), n))
+
+
 async def _t_ask_user(state, turn, db, args):
     """Halt the loop and return a clarifying question to the user."""
     question = (args.get("question") or "").strip()
     options_raw = args.get("options") or []
-    options = [str(o).strip() for o in options_raw if str(o).strip()][:4]
+    options = _first_nonblank(options_raw, 4)
     if not question:
         return ToolResult(summary="error: question is required.", success=False)
     state.action_required = True
@@ -673,7 +689,7 @@ async def _t_ask_user(state, turn, db, args):
 
 async def _t_make_plan(state, turn, db, args):
     items_raw = args.get("items") or args.get("tasks") or []
-    items = [str(t).strip() for t in items_raw if str(t).strip()][:10]
+    items = _first_nonblank(items_raw, 10)
     if not items:
         return ToolResult(summary="error: items must be a non-empty list of tasks.", success=False)
     state.set_plan(items)
@@ -211,8 +211,11 @@ async def _generate_with_gemini(system_prompt: str, user_prompt: str, chat_histo
     return await asyncio.to_thread(_generate_with_gemini_sync, system_prompt, user_prompt, chat_history)
 
 
+_WS_RE = re.compile(r"\s+")
+
+
 def _clean_fallback_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 _THREAD_CONTEXT_FALLBACK_TRIGGERS = (
@@ -237,6 +240,8 @@ def _looks_like_thread_context_question(question: str) -> bool:
 _USED_LINE_RE = re.compile(
     r"(?im)[\s>*\-•]*\**\s*\bUSED\b\**\s*:\**\s*([^\n]*?)\s*\**\s*$"
 )
+_USED_SPLIT_RE = re.compile(r"[,\s;]+")
+_USED_TOKEN_RE = re.compile(r"^(D|W|DOC|WEB|DOCUMENT)\s*#?\s*(\d+)$")
 
 
 def extract_used_marker(answer: str) -> tuple[str, set[int] | None, set[int] | None]:
@@ -248,7 +253,9 @@ def extract_used_marker(answer: str) -> tuple[str, set[int] | None, set[int] | N
     absent — caller should fall back to including everything that was retrieved.
     `set()` (empty) means the model explicitly said "USED: none".
     """
-    matches = list(_USED_LINE_RE.finditer(answer))
+    # Most answers carry no marker; a substring test skips the line regex,
+    # which otherwise probes every position of a long answer.
+    matches = list(_USED_LINE_RE.finditer(answer)) if "used" in answer.lower() else []
     if not matches:
         logger.warning("[CITE] USED marker missing — falling back to all retrieved sources")
         return answer.rstrip(), None, None
@@ -262,11 +269,11 @@ def extract_used_marker(answer: str) -> tuple[str, set[int] | None, set[int] | N
 
     doc_idx: set[int] = set()
     web_idx: set[int] = set()
-    for token in re.split(r"[,\s;]+", raw):
+    for token in _USED_SPLIT_RE.split(raw):
         token = token.strip().strip("[]()").upper()
         if not token:
             continue
-        m = re.match(r"^(D|W|DOC|WEB|DOCUMENT)\s*#?\s*(\d+)$", token)
+        m = _USED_TOKEN_RE.match(token)
         if not m:
             continue
         kind = m.group(1)
@@ -277,7 +284,8 @@ def extract_used_marker(answer: str) -> tuple[str, set[int] | None, set[int] | N
             doc_idx.add(num)
         elif kind in ("W", "WEB"):
             web_idx.add(num)
-    logger.info("[CITE] USED parsed: docs=%s web=%s (raw=%r)", sorted(doc_idx), sorted(web_idx), raw)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[CITE] USED parsed: docs=%s web=%s (raw=%r)", sorted(doc_idx), sorted(web_idx), raw)
     return cleaned, doc_idx, web_idx
 
 
@@ -492,9 +500,13 @@ TITLE_SYSTEM_PROMPT = (
 )
 
 
+_MENTION_RE = re.compile(r"@\S+")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9\s]")
+
+
 def _fallback_short_title(text: str) -> str:
-    clean = re.sub(r"@\S+", "", text or "").strip()
-    clean = re.sub(r"[^A-Za-z0-9\s]", " ", clean)
+    clean = _MENTION_RE.sub("", text or "").strip()
+    clean = _NON_ALNUM_RE.sub(" ", clean)
     words = [w for w in clean.split() if w]
     if not words:
         return "Chat"
@@ -515,8 +527,8 @@ def _sanitize_title(raw: str | None, fallback_source: str) -> str:
     if not raw:
         return _fallback_short_title(fallback_source)
     title = raw.strip().strip('"').strip("'").splitlines()[0].strip()
-    title = re.sub(r"[\.!?,:;]+$", "", title)
-    title = re.sub(r"\s+", " ", title)
+    title = title.rstrip(".!?,:;")
+    title = _WS_RE.sub(" ", title)
     if not title:
         return _fallback_short_title(fallback_source)
     if len(title) > 10:
@@ -6,6 +6,8 @@ import math
 import re
 import uuid
 from dataclasses import dataclass, replace as dc_replace
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 
 from qdrant_client.models import (
@@ -18,7 +20,8 @@ from qdrant_client.models import (
     Prefetch,
     SparseVector,
 )
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -82,9 +85,12 @@ class QueryEmbedding:
 
 import time as _time
 
+# Insertion-ordered dict used as an LRU: hits move to the end, eviction pops
+# the front. Query vectors are deterministic per model, so the TTL only bounds
+# how long a cold entry holds memory.
 _QUERY_EMBED_CACHE: dict[tuple[str, bool], tuple[float, QueryEmbedding]] = {}
-_QUERY_EMBED_CACHE_TTL = 60.0  # seconds
-_QUERY_EMBED_CACHE_MAX = 64
+_QUERY_EMBED_CACHE_TTL = 600.0  # seconds
+_QUERY_EMBED_CACHE_MAX = 512
 
 # Per-bucket tier cache so the hot retrieval path doesn't repeat the SELECT.
 _BUCKET_TIER_CACHE: dict[uuid.UUID, tuple[float, str]] = {}
@@ -115,22 +121,24 @@ async def _embed_query_text(query: str, lite: bool = False) -> QueryEmbedding:
     standard `text_chunks` collection. lite=True swaps to voyage-3-lite
     (512-dim) for the MCP/lite tier's `text_chunks_lite` collection.
 
-    A tiny TTL cache dedupes repeat embeds inside a single turn (e.g. when both
-    `search_bucket_documents` and `search_bucket_documents_for_files` run).
+    An LRU cache dedupes repeat embeds inside a turn (e.g. when both
+    `search_bucket_documents` and `search_bucket_documents_for_files` run) and
+    across the repeated searches an MCP client issues over a session. Queries
+    are whitespace-normalized so trivially reformatted repeats share an entry.
     """
+    query = " ".join(query.split())
     now = _time.monotonic()
     cache_key = (query, lite)
-    cached = _QUERY_EMBED_CACHE.get(cache_key)
+    cached = _QUERY_EMBED_CACHE.pop(cache_key, None)
     if cached and (now - cached[0]) < _QUERY_EMBED_CACHE_TTL:
+        _QUERY_EMBED_CACHE[cache_key] = cached
         return cached[1]
 
     dense = await _voyage_embed_query(query, lite=lite)
     result = QueryEmbedding(dense=[float(value) for value in dense], sparse=None)
 
     if len(_QUERY_EMBED_CACHE) >= _QUERY_EMBED_CACHE_MAX:
-        # Drop the oldest entry — cheap eviction
-        oldest_key = min(_QUERY_EMBED_CACHE, key=lambda k: _QUERY_EMBED_CACHE[k][0])
-        _QUERY_EMBED_CACHE.pop(oldest_key, None)
+        _QUERY_EMBED_CACHE.pop(next(iter(_QUERY_EMBED_CACHE)), None)
     _QUERY_EMBED_CACHE[cache_key] = (now, result)
     return result
 
@@ -157,7 +165,7 @@ async def _embed_conversation_query(query: str) -> QueryEmbedding:
 
     from app.services.embeddings.service import embed_texts as embed_dense_texts
 
-    dense = embed_dense_texts([query])[0]
+    dense = (await asyncio.to_thread(embed_dense_texts, [query]))[0]
     return QueryEmbedding(dense=[float(value) for value in dense], sparse=None)
 
 
@@ -193,17 +201,18 @@ async def _resolve_file_names(db: AsyncSession, file_ids: set[uuid.UUID]) -> dic
     }
 
 
-async def _resolve_file_summaries(db: AsyncSession, file_ids: list[uuid.UUID]) -> dict[uuid.UUID, Summary]:
+async def _resolve_file_summaries(db: AsyncSession, file_ids: list[uuid.UUID]) -> dict[uuid.UUID, Row]:
+    """Newest summary per file as (id, file_id, content) rows. DISTINCT ON keeps
+    older summary versions off the wire instead of discarding them here."""
     if not file_ids:
         return {}
     result = await db.execute(
-        select(Summary).where(Summary.file_id.in_(file_ids)).order_by(Summary.created_at.desc())
+        select(Summary.id, Summary.file_id, Summary.content)
+        .where(Summary.file_id.in_(file_ids))
+        .distinct(Summary.file_id)
+        .order_by(Summary.file_id, Summary.created_at.desc())
     )
-    summaries: dict[uuid.UUID, Summary] = {}
-    for row in result.scalars():
-        if row.file_id and row.file_id not in summaries:
-            summaries[row.file_id] = row
-    return summaries
+    return {row.file_id: row for row in result.all()}
 
 
 async def _prioritize_file_summaries(
@@ -215,19 +224,15 @@ async def _prioritize_file_summaries(
     if not results:
         return results
 
-    ordered_file_ids: list[uuid.UUID] = []
+    # Group in one pass; dict order keeps each file's first-seen position.
+    chunks_by_file: dict[uuid.UUID, list[RetrievedDocumentChunk]] = {}
     for chunk in results:
-        if chunk.file_id not in ordered_file_ids:
-            ordered_file_ids.append(chunk.file_id)
+        chunks_by_file.setdefault(chunk.file_id, []).append(chunk)
 
-    summaries = await _resolve_file_summaries(db, ordered_file_ids)
+    summaries = await _resolve_file_summaries(db, list(chunks_by_file))
     output: list[RetrievedDocumentChunk] = []
 
-    for file_id in ordered_file_ids:
-        file_chunks = [chunk for chunk in results if chunk.file_id == file_id]
-        if not file_chunks:
-            continue
-
+    for file_id, file_chunks in chunks_by_file.items():
         existing_summary = next((chunk for chunk in file_chunks if chunk.is_summary), None)
         if existing_summary is not None:
             output.append(existing_summary)
@@ -310,6 +315,11 @@ async def _hybrid_bucket_search(
 
 # ── Fix 4: Multi-query expansion ───────────────────────────────────────────────
 
+def _first_lines(text: str, n: int = 2) -> list[str]:
+    """First `n` non-blank lines, stripped; stops scanning once it has them."""
+    return list(islice(filter(None, (line.strip() for line in text.split("\n"))), n))
+
+
 async def _generate_query_rephrasings(query: str) -> list[str]:
     """
     Generate 2 alternative rephrasings of the query using the fastest available LLM.
@@ -337,7 +347,7 @@ async def _generate_query_rephrasings(query: str) -> list[str]:
                 timeout=4.0,
             )
             text = resp.content[0].text.strip()
-            return [line.strip() for line in text.split("\n") if line.strip()][:2]
+            return _first_lines(text)
 
         if settings.gemini_api_key:
             import google.generativeai as genai
@@ -350,7 +360,7 @@ async def _generate_query_rephrasings(query: str) -> list[str]:
                 timeout=4.0,
             )
             text = resp.text.strip()
-            return [line.strip() for line in text.split("\n") if line.strip()][:2]
+            return _first_lines(text)
 
         if settings.openai_api_key and not settings.openai_api_key.startswith("your-"):
             from openai import AsyncOpenAI
@@ -364,7 +374,7 @@ async def _generate_query_rephrasings(query: str) -> list[str]:
                 timeout=4.0,
             )
             text = resp.choices[0].message.content.strip()
-            return [line.strip() for line in text.split("\n") if line.strip()][:2]
+            return _first_lines(text)
 
         if settings.deepseek_api_key and not settings.deepseek_api_key.startswith("your-"):
             from openai import AsyncOpenAI
@@ -381,7 +391,7 @@ async def _generate_query_rephrasings(query: str) -> list[str]:
                 timeout=4.0,
             )
             text = resp.choices[0].message.content.strip()
-            return [line.strip() for line in text.split("\n") if line.strip()][:2]
+            return _first_lines(text)
 
     except Exception as exc:
         logger.debug("Query expansion failed (non-critical, continuing): %s", exc)
@@ -772,10 +782,14 @@ async def search_bucket_documents(
     # The fast pass was weak — search harder. Widen the candidate net and add LLM
     # query rephrasings, fusing all hits with reciprocal-rank fusion before the
     # rerank. Nothing is capped away: a weak match triggers *more* retrieval.
+    # The rephrasing call does not depend on the wide search, so its LLM round
+    # trip overlaps the Qdrant query instead of following it.
     search_limit = max(limit, candidate_limit)
-    point_lists = [await _run_main_search(search_limit)]
-
-    rephrasings = await _generate_query_rephrasings(query)
+    main_points, rephrasings = await asyncio.gather(
+        _run_main_search(search_limit),
+        _generate_query_rephrasings(query),
+    )
+    point_lists = [main_points]
     if rephrasings:
         extra_searches = await asyncio.gather(
             *[_search_with_text(r, bucket_id, search_limit, allowed_file_ids=allowed_file_ids, tier=tier) for r in rephrasings],
@@ -1003,25 +1017,28 @@ _CATEGORY_HINTS = {
 }
 
 
+_MATCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NON_MATCH_CHARS_RE = re.compile(r"[^a-z0-9]+")
+_FILE_EXT_RE = re.compile(r"\.[a-z0-9]{1,8}$")
+_ENTITY_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9&.-]*")
+_PERIOD_TOKEN_RE = re.compile(r"(q[1-4]|fy)?20\d{2}")
+
+
 def _match_tokens(text: str) -> list[str]:
-    return [token for token in re.findall(r"[a-z0-9]+", text.lower()) if len(token) >= 2]
+    return [token for token in _MATCH_TOKEN_RE.findall(text.lower()) if len(token) >= 2]
 
 
 def _compact_match_text(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", text.lower())
+    return _NON_MATCH_CHARS_RE.sub("", text.lower())
 
 
 def _file_stem(name: str) -> str:
-    return re.sub(r"\.[a-z0-9]{1,8}$", "", name.lower()).replace("_", " ").replace("-", " ").strip()
+    return _FILE_EXT_RE.sub("", name.lower()).replace("_", " ").replace("-", " ").strip()
 
 
-def _has_cross_doc_intent(query: str) -> bool:
+def _has_cross_doc_trigger(query: str) -> bool:
     lowered = f" {query.lower()} "
-    return (
-        _has_collection_wide_intent(query)
-        or _has_standalone_image_intent(query)
-        or any(trigger in lowered for trigger in _CROSS_DOC_TRIGGERS)
-    )
+    return any(trigger in lowered for trigger in _CROSS_DOC_TRIGGERS)
 
 
 def _has_all_document_intent(query: str) -> bool:
@@ -1053,11 +1070,11 @@ def _has_standalone_image_intent(query: str) -> bool:
 
 
 def _has_named_entity_hint(query: str) -> bool:
-    for token in re.findall(r"[A-Za-z][A-Za-z0-9&.-]*", query):
+    for token in _ENTITY_TOKEN_RE.findall(query):
         lowered = token.lower().strip(".")
         if lowered in _FIELD_EXTRACTION_STOPWORDS or lowered in _METRIC_ACRONYMS:
             continue
-        if re.fullmatch(r"(q[1-4]|fy)?20\d{2}", lowered):
+        if _PERIOD_TOKEN_RE.fullmatch(lowered):
             continue
         if token.isupper() or (len(token) > 2 and token[0].isupper()):
             return True
@@ -1090,13 +1107,24 @@ def _is_document_like_file(file_name: str | None, file_type: str | None) -> bool
     )
 
 
+@lru_cache(maxsize=256)
+def _query_match_features(query: str) -> tuple[str, str, frozenset[str], frozenset[str]]:
+    """Query-side inputs to the per-file scores: (lowered, compact, tokens,
+    distinctive tokens). Scoring walks every file in the bucket with the same
+    query, so these are normalised once instead of once per file."""
+    tokens = frozenset(_match_tokens(query))
+    distinctive = frozenset(
+        token for token in tokens
+        if len(token) >= 4 and token not in _SUMMARY_MATCH_STOPWORDS
+    )
+    return query.lower(), _compact_match_text(query), tokens, distinctive
+
+
 def _file_match_score(query: str, file_name: str, summary: str = "") -> float:
-    lowered = query.lower()
-    compact_query = _compact_match_text(query)
+    lowered, compact_query, query_tokens, distinctive_query_tokens = _query_match_features(query)
     stem = _file_stem(file_name)
     compact_stem = _compact_match_text(stem)
     stem_tokens = [t for t in _match_tokens(stem) if t not in {"pdf", "doc", "paper", "report"}]
-    query_tokens = set(_match_tokens(query))
 
     score = 0.0
     if file_name.lower() in lowered:
@@ -1116,10 +1144,6 @@ def _file_match_score(query: str, file_name: str, summary: str = "") -> float:
     # even when the filename is abbreviated. Keep this weak to avoid dragging in
     # unrelated files from broad summary vocabulary.
     summary_tokens = set(_match_tokens(summary[:900]))
-    distinctive_query_tokens = {
-        token for token in query_tokens
-        if len(token) >= 4 and token not in _SUMMARY_MATCH_STOPWORDS
-    }
     title_overlap = len(distinctive_query_tokens & summary_tokens)
     if title_overlap >= 2:
         score += min(2.0, title_overlap / 3)
@@ -1130,7 +1154,7 @@ def _file_match_score(query: str, file_name: str, summary: str = "") -> float:
 
 
 def _category_match_score(query: str, file_name: str, summary: str = "") -> float:
-    query_tokens = set(_match_tokens(query))
+    query_tokens = _query_match_features(query)[2]
     doc_tokens = set(_match_tokens(f"{file_name} {summary[:1800]}"))
     score = 0.0
     for hint in _CATEGORY_HINTS.values():
@@ -1214,6 +1238,9 @@ async def _resolve_cross_doc_fallback_files(
     return []
 
 
+_IMAGE_FILE_CHUNKS = 4  # extracted-text chunks quoted per standalone image
+
+
 async def search_bucket_standalone_images(
     db: AsyncSession,
     bucket_id: uuid.UUID,
@@ -1225,6 +1252,7 @@ async def search_bucket_standalone_images(
         select(File.id, File.name)
         .where(File.bucket_id == bucket_id, File.status == "ready", File.type == "image")
         .order_by(File.created_at.asc())
+        .limit(max_files)
     )
     if allowed_file_ids is not None:
         if not allowed_file_ids:
@@ -1234,14 +1262,25 @@ async def search_bucket_standalone_images(
     image_files = (await db.execute(file_stmt)).all()
     if not image_files:
         return []
-    image_files = image_files[:max_files]
     image_ids = [file_id for file_id, _ in image_files]
 
     summaries = await _resolve_file_summaries(db, image_ids)
-    chunks_result = await db.execute(
-        select(Chunk.file_id, Chunk.id, Chunk.page, Chunk.content, Chunk.block_id)
+    # Only the first _IMAGE_FILE_CHUNKS chunks of each image are shown, so
+    # rank per file in SQL rather than loading every chunk's content.
+    ranked = (
+        select(
+            Chunk.file_id, Chunk.id, Chunk.page, Chunk.content, Chunk.block_id,
+            func.row_number().over(
+                partition_by=Chunk.file_id, order_by=(Chunk.page.asc(), Chunk.id.asc())
+            ).label("rank"),
+        )
         .where(Chunk.file_id.in_(image_ids), Chunk.status == "embedded")
-        .order_by(Chunk.file_id.asc(), Chunk.page.asc(), Chunk.id.asc())
+        .subquery()
+    )
+    chunks_result = await db.execute(
+        select(ranked.c.file_id, ranked.c.id, ranked.c.page, ranked.c.content, ranked.c.block_id)
+        .where(ranked.c.rank <= _IMAGE_FILE_CHUNKS)
+        .order_by(ranked.c.file_id.asc(), ranked.c.rank.asc())
     )
     chunks_by_file: dict[uuid.UUID, list[tuple[uuid.UUID, int, str, str]]] = {}
     for file_id, chunk_id, page, content, block_id in chunks_result.all():
@@ -1255,7 +1294,7 @@ async def search_bucket_standalone_images(
             parts.append(f"Summary:\n{summary.content.strip()}")
 
         file_chunks = chunks_by_file.get(file_id, [])
-        for _, page, content, _ in file_chunks[:4]:
+        for _, page, content, _ in file_chunks:
             clean = (content or "").strip()
             if clean:
                 parts.append(f"Page {page} extracted content:\n{clean}")
@@ -1307,20 +1346,24 @@ async def search_bucket_documents_with_file_coverage(
     if allowed_file_ids is not None and len(allowed_file_ids) == 0:
         return []
 
-    if _has_standalone_image_intent(query):
+    # Evaluate each intent once: the collection-wide check tokenizes the query,
+    # and both it and the image check also decide the cross-doc branch below.
+    image_intent = _has_standalone_image_intent(query)
+    if image_intent:
         image_chunks = await search_bucket_standalone_images(
             db, bucket_id, allowed_file_ids=allowed_file_ids
         )
         if image_chunks:
             return image_chunks
 
-    if not _has_cross_doc_intent(query):
+    collection_wide = _has_collection_wide_intent(query)
+    if not (collection_wide or image_intent or _has_cross_doc_trigger(query)):
         return await search_bucket_documents(
             db, bucket_id, query, limit=limit, allowed_file_ids=allowed_file_ids
         )
 
     target_file_ids: list[uuid.UUID] = []
-    if _has_collection_wide_intent(query):
+    if collection_wide:
         target_file_ids = await _resolve_cross_doc_fallback_files(
             db, bucket_id, allowed_file_ids=allowed_file_ids, max_files=12
         )
@@ -1408,6 +1451,14 @@ async def search_conversation_memory(
     return results
 
 
+@lru_cache(maxsize=1024)
+def _web_source_label(url: str) -> str:
+    """Citation label for a web result. The same URLs come back across the
+    tool payloads and the final sources block of a turn, so parses are cached."""
+    parsed = urlparse(url)
+    return f"[web] {parsed.netloc}{parsed.path or ''}"
+
+
 def format_sources_section(document_chunks: list[RetrievedDocumentChunk], web_results: list[RetrievedWebResult]) -> tuple[str, list[dict[str, object]]]:
     lines = ["Sources:"]
     payload: list[dict[str, object]] = []
@@ -1441,8 +1492,7 @@ def format_sources_section(document_chunks: list[RetrievedDocumentChunk], web_re
         if result.url in seen_urls:
             continue
         seen_urls.add(result.url)
-        parsed = urlparse(result.url)
-        label = f"[web] {parsed.netloc}{parsed.path or ''}"
+        label = _web_source_label(result.url)
         lines.append(label)
         payload.append(
             {
@@ -8,8 +8,10 @@ each turn via the tool registry in ``harness/``.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -17,11 +19,14 @@ from typing import Awaitable, Callable
 
 from fastapi import HTTPException, status
 from qdrant_client.models import Distance, PointStruct, VectorParams
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.config import settings
+from app.database import db_session
 from app.models.bucket import Bucket
+from app.models.chunk import Chunk
 from app.models.conversation import Conversation, ConversationChunk, Message
 from app.models.file import File
 from app.models.platform import TeamMember
@@ -40,7 +45,7 @@ from app.services.agent.retrieval import (
     get_conversation_file_scope,
     search_bucket_documents_with_file_coverage,
 )
-from app.services.agent.llm import generate_answer, infer_style_guidance
+from app.services.agent.llm import extract_used_marker, generate_answer, infer_style_guidance
 from app.services.outline import clean_section_outline
 from app.services.embeddings.service import (
     embed_texts as embed_dense_texts,
@@ -80,6 +85,19 @@ class AgentTurnResult:
 
 # ─────────────────────────────────────────────────────────── CRUD operations ──
 
+# Columns the list endpoints serialize (ConversationResponse / MessageResponse).
+_CONVERSATION_LIST_COLUMNS = (
+    Conversation.id, Conversation.user_id, Conversation.bucket_id, Conversation.title,
+    Conversation.web_search_mode, Conversation.follow_up_mode, Conversation.is_pinned,
+    Conversation.created_at, Conversation.updated_at,
+)
+_MESSAGE_LIST_COLUMNS = (
+    Message.id, Message.conversation_id, Message.parent_message_id, Message.role, Message.content,
+    Message.chunks_used, Message.token_count, Message.embedding_status, Message.agent_plan,
+    Message.agent_steps, Message.sender_team_member_id, Message.created_at,
+)
+
+
 async def get_bucket_for_user(db: AsyncSession, user_id: str, bucket_id: str) -> Bucket:
     stmt = select(Bucket).where(Bucket.id == uuid.UUID(bucket_id), Bucket.user_id == uuid.UUID(user_id))
     result = await db.execute(stmt)
@@ -94,6 +112,26 @@ async def get_profile_for_user(db: AsyncSession, user_id: str) -> Profile | None
     return result.scalar_one_or_none()
 
 
+def _conversation_visibility(
+    user_id: str,
+    bucket_id: str,
+    conversation_id: str,
+    acting_team_member_id: str | None,
+    can_read_others_threads: bool,
+) -> list:
+    """WHERE clauses matching one conversation the caller may see."""
+    clauses = [
+        Conversation.id == uuid.UUID(conversation_id),
+        Conversation.bucket_id == uuid.UUID(bucket_id),
+        Conversation.user_id == uuid.UUID(user_id),
+    ]
+    if acting_team_member_id and not can_read_others_threads:
+        clauses.append(
+            Conversation.created_by_team_member_id == uuid.UUID(acting_team_member_id)
+        )
+    return clauses
+
+
 async def get_conversation_for_user(
     db: AsyncSession,
     user_id: str,
@@ -111,14 +149,10 @@ async def get_conversation_for_user(
     cannot read others' threads.
     """
     stmt = select(Conversation).where(
-        Conversation.id == uuid.UUID(conversation_id),
-        Conversation.bucket_id == uuid.UUID(bucket_id),
-        Conversation.user_id == uuid.UUID(user_id),
-    )
-    if acting_team_member_id and not can_read_others_threads:
-        stmt = stmt.where(
-            Conversation.created_by_team_member_id == uuid.UUID(acting_team_member_id)
+        *_conversation_visibility(
+            user_id, bucket_id, conversation_id, acting_team_member_id, can_read_others_threads
         )
+    )
     result = await db.execute(stmt)
     conversation = result.scalar_one_or_none()
     if conversation is None:
@@ -134,9 +168,9 @@ async def list_conversations(
     acting_team_member_id: str | None = None,
     can_read_others_threads: bool = True,
 ) -> list[Conversation]:
-    await get_bucket_for_user(db, user_id, bucket_id)
     stmt = (
         select(Conversation)
+        .options(load_only(*_CONVERSATION_LIST_COLUMNS))
         .where(
             Conversation.user_id == uuid.UUID(user_id),
             Conversation.bucket_id == uuid.UUID(bucket_id),
@@ -148,7 +182,12 @@ async def list_conversations(
             Conversation.created_by_team_member_id == uuid.UUID(acting_team_member_id)
         )
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    conversations = list(result.scalars().all())
+    # Rows are already filtered by owner + bucket, so any hit proves the bucket
+    # is the caller's; only an empty list needs the separate 404 check.
+    if not conversations:
+        await get_bucket_for_user(db, user_id, bucket_id)
+    return conversations
 
 
 async def create_conversation(
@@ -323,20 +362,30 @@ async def list_conversation_messages(
     acting_team_member_id: str | None = None,
     can_read_others_threads: bool = True,
 ) -> list[Message]:
-    await get_conversation_for_user(
-        db,
-        user_id,
-        bucket_id,
-        conversation_id,
-        acting_team_member_id=acting_team_member_id,
-        can_read_others_threads=can_read_others_threads,
-    )
+    # The visibility check rides along as a join, so a non-empty history costs
+    # one round trip; an empty one falls back to the explicit 404 check.
     result = await db.execute(
         select(Message)
-        .where(Message.conversation_id == uuid.UUID(conversation_id))
+        .options(load_only(*_MESSAGE_LIST_COLUMNS))
+        .join(Conversation, Conversation.id == Message.conversation_id)
+        .where(
+            *_conversation_visibility(
+                user_id, bucket_id, conversation_id, acting_team_member_id, can_read_others_threads
+            )
+        )
         .order_by(Message.created_at.asc())
     )
-    return list(result.scalars().all())
+    messages = list(result.scalars().all())
+    if not messages:
+        await get_conversation_for_user(
+            db,
+            user_id,
+            bucket_id,
+            conversation_id,
+            acting_team_member_id=acting_team_member_id,
+            can_read_others_threads=can_read_others_threads,
+        )
+    return messages
 
 
 # ─────────────────────────────────────────────────────── conversation memory ──
@@ -369,7 +418,8 @@ async def _persist_message_memory(
         embedding_rows = await embed_hybrid_texts(memory_parts)
         vectors = [[float(value) for value in row["dense"]] for row in embedding_rows]
     except Exception:
-        vectors = [[float(value) for value in vector] for vector in embed_dense_texts(memory_parts)]
+        dense_rows = await asyncio.to_thread(embed_dense_texts, memory_parts)
+        vectors = [[float(value) for value in vector] for vector in dense_rows]
 
     await _ensure_conversation_collection()
     client = get_async_qdrant_client()
@@ -418,6 +468,33 @@ async def _persist_message_memory(
         message.embedding_status = "failed"
 
 
+# Conversation-memory embedding for a finished turn runs after the reply is
+# sent, on its own session. Messages stay "pending" until it lands; the set
+# keeps a reference so running tasks are not garbage-collected.
+_memory_tasks: set[asyncio.Task] = set()
+
+
+async def _persist_turn_memory(conversation_id: uuid.UUID, message_ids: list[uuid.UUID]) -> None:
+    try:
+        async with db_session() as db:
+            conversation = await db.get(Conversation, conversation_id)
+            if conversation is None:
+                return
+            for message_id in message_ids:
+                message = await db.get(Message, message_id)
+                if message is not None:
+                    await _persist_message_memory(db, conversation=conversation, message=message)
+            await db.commit()
+    except Exception:
+        logger.exception("[MEMORY] could not embed turn for conversation %s", conversation_id)
+
+
+def _schedule_turn_memory(conversation_id: uuid.UUID, message_ids: list[uuid.UUID]) -> None:
+    task = asyncio.create_task(_persist_turn_memory(conversation_id, message_ids))
+    _memory_tasks.add(task)
+    task.add_done_callback(_memory_tasks.discard)
+
+
 # ─────────────────────────────────────────────────────────── turn helpers ──
 
 async def _recent_chat_history(
@@ -459,13 +536,35 @@ async def _recent_chat_history(
     return history[-max_messages:]
 
 
+# Per-bucket file list for the turn prompt, reused across turns while the
+# bucket's (file count, newest updated_at) signature is unchanged. Any upload,
+# delete, rename or status change moves the signature.
+_BUCKET_FILES_TTL = 60.0  # seconds
+_BUCKET_FILES_MAX = 1024
+_BUCKET_FILES_CACHE: dict[uuid.UUID, tuple[float, tuple, list[BucketFile]]] = {}
+
+
 async def _load_bucket_files(db: AsyncSession, bucket_id: uuid.UUID) -> list[BucketFile]:
+    # updated_at is the transaction start time, so concurrent processing can
+    # flip a status without moving the max; the per-status counts catch that.
+    signature = tuple((await db.execute(
+        select(
+            func.count(File.id),
+            func.max(File.updated_at),
+            *(func.count().filter(File.status == s) for s in ("processing", "ready", "failed")),
+        ).where(File.bucket_id == bucket_id)
+    )).one())
+    now = time.monotonic()
+    cached = _BUCKET_FILES_CACHE.get(bucket_id)
+    if cached is not None and cached[1] == signature and (now - cached[0]) < _BUCKET_FILES_TTL:
+        return list(cached[2])
+
     result = await db.execute(
         select(File.id, File.name, File.status, File.is_agent_written)
         .where(File.bucket_id == bucket_id)
         .order_by(File.created_at.desc())
     )
-    return [
+    files = [
         BucketFile(
             file_id=row.id,
             name=row.name,
@@ -474,6 +573,11 @@ async def _load_bucket_files(db: AsyncSession, bucket_id: uuid.UUID) -> list[Buc
         )
         for row in result.all()
     ]
+    _BUCKET_FILES_CACHE.pop(bucket_id, None)
+    if len(_BUCKET_FILES_CACHE) >= _BUCKET_FILES_MAX:
+        _BUCKET_FILES_CACHE.pop(next(iter(_BUCKET_FILES_CACHE)), None)
+    _BUCKET_FILES_CACHE[bucket_id] = (now, signature, files)
+    return list(files)
 
 
 async def _resolve_active_file(
@@ -493,6 +597,7 @@ async def _resolve_active_file(
         .order_by(Message.created_at.desc())
         .limit(8)
     )
+    candidates: list[uuid.UUID] = []
     for (chunks_used,) in result.all():
         for item in chunks_used or []:
             if isinstance(item, dict) and item.get("kind") == "document":
@@ -503,16 +608,21 @@ async def _resolve_active_file(
                     candidate = uuid.UUID(str(raw))
                 except Exception:
                     continue
-                exists = await db.execute(
-                    select(File.id).where(
-                        File.id == candidate,
-                        File.bucket_id == bucket_id,
-                        File.status == "ready",
-                    )
-                )
-                if exists.scalar_one_or_none() is not None:
-                    return candidate
-    return None
+                if candidate not in candidates:
+                    candidates.append(candidate)
+    if not candidates:
+        return None
+    # One existence check for every candidate instead of a query per file id.
+    ready = set(
+        (await db.execute(
+            select(File.id).where(
+                File.id.in_(candidates),
+                File.bucket_id == bucket_id,
+                File.status == "ready",
+            )
+        )).scalars().all()
+    )
+    return next((c for c in candidates if c in ready), None)
 
 
 async def _maybe_set_conversation_title(conversation: Conversation, first_user_message: str) -> None:
@@ -559,7 +669,9 @@ async def run_conversation_turn(
     )
     profile = await get_profile_for_user(db, user_id)
     user_message_text = content.strip()
-    logger.info("[USER] %.120s", user_message_text.replace("\n", " "))
+    # Slice before replacing so a long pasted message isn't copied just to log 120 chars.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[USER] %s", user_message_text[:120].replace("\n", " "))
 
     user_message = Message(
         conversation_id=conversation.id,
@@ -638,8 +750,6 @@ async def run_conversation_turn(
     db.add(assistant_message)
     await db.flush()
 
-    await _persist_message_memory(db, conversation=conversation, message=user_message)
-    await _persist_message_memory(db, conversation=conversation, message=assistant_message)
     await _maybe_set_conversation_title(conversation, user_message_text)
 
     if assistant_message.role == "assistant":
@@ -653,6 +763,7 @@ async def run_conversation_turn(
 
     await db.commit()
     await db.refresh(conversation)
+    _schedule_turn_memory(conversation.id, [user_message.id, assistant_message.id])
 
     thinking_step_labels = [s.get("label", "") for s in output.steps]
     return AgentTurnResult(
@@ -727,14 +838,14 @@ _COUNT_TRIGGER_RE = re.compile(
 # Order here = the order metrics appear in a multi-count answer. Anything not on
 # this list (languages, ingredients, products, claims, emails, addresses,
 # testimonials, …) is SEMANTIC and must fall through to normal retrieval.
-_COUNT_NOUNS: list[tuple[str, str]] = [
-    ("files", r"\b(files?|documents?|docs?|pdfs?)\b"),
-    ("pages", r"\bpages?\b"),
-    ("sections", r"\b(sections?|headings?|chapters?)\b"),
-    ("images", r"\b(images?|pictures?|photos?|figures?|graphics?)\b"),
-    ("text_blocks", r"\btext[\s-]?blocks?\b"),
-    ("total_visuals", r"\b(visuals?|visual\s+elements?)\b"),
-    ("chunks", r"\bchunks?\b"),
+_COUNT_NOUNS: list[tuple[str, re.Pattern[str]]] = [
+    ("files", re.compile(r"\b(files?|documents?|docs?|pdfs?)\b")),
+    ("pages", re.compile(r"\bpages?\b")),
+    ("sections", re.compile(r"\b(sections?|headings?|chapters?)\b")),
+    ("images", re.compile(r"\b(images?|pictures?|photos?|figures?|graphics?)\b")),
+    ("text_blocks", re.compile(r"\btext[\s-]?blocks?\b")),
+    ("total_visuals", re.compile(r"\b(visuals?|visual\s+elements?)\b")),
+    ("chunks", re.compile(r"\bchunks?\b")),
 ]
 
 # Human label for each metric (singular, plural).
@@ -777,7 +888,7 @@ def _detect_count_intents(question: str) -> list[str]:
     boundary = _COUNT_BOUNDARY_RE.search(span)
     if boundary:
         span = span[: boundary.start()]
-    return [kind for kind, pat in _COUNT_NOUNS if re.search(pat, span)]
+    return [kind for kind, pat in _COUNT_NOUNS if pat.search(span)]
 
 
 async def _count_answer_from_metadata(
@@ -808,8 +919,6 @@ async def _count_answer_from_metadata(
                 len(clean_section_outline(f.section_outline or [])) for f in files
             )
         elif kind == "chunks":
-            from sqlalchemy import func
-            from app.models.chunk import Chunk
             totals["chunks"] = int(
                 (await db.execute(
                     select(func.count()).select_from(Chunk).where(
@@ -821,13 +930,16 @@ async def _count_answer_from_metadata(
         elif kind in ("text_blocks", "total_visuals"):
             # Layout-derived — load once, reuse for both metrics if both asked.
             if "text_blocks" not in totals and "total_visuals" not in totals:
-                from app.services.mcp.tools import fetch_visual_list
+                from app.services.mcp.tools import _enumerate_visuals, _load_layout, _visual_counts
+                # Every layout is an independent R2 download — fetch them together.
+                layouts = await asyncio.gather(
+                    *(_load_layout(f.layout_json_path) for f in files if f.layout_json_path)
+                )
                 tb = tv = 0
-                for f in files:
-                    vl = await fetch_visual_list(db, bucket_id, f.id, limit=1)
-                    if vl:
-                        tb += int(vl.get("text_block_count") or 0)
-                        tv += int(vl.get("total_visuals") or 0)
+                for layout in layouts:
+                    total, _, text_blocks = _visual_counts(_enumerate_visuals(layout))
+                    tb += text_blocks
+                    tv += total
                 if "text_blocks" in kinds:
                     totals["text_blocks"] = tb
                 if "total_visuals" in kinds:
@@ -920,7 +1032,6 @@ async def answer_bucket_query(
         web_results=[],
     )
     # Strip any USED: marker the LLM may still emit (legacy prompt path).
-    from app.services.agent.llm import extract_used_marker
     answer_body, _, _ = extract_used_marker(answer_body)
     sources_block, source_payload = format_sources_section(document_chunks, [])
     return BucketQueryResponse(
@@ -27,6 +27,14 @@ from app.models.summary import Summary
 # fetch_url
 # ---------------------------------------------------------------------------
 
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+# <style> and <script> blocks in one pass; the backreference pins the close tag.
+_STYLE_SCRIPT_RE = re.compile(r"<(style|script)[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+# Remaining tags and named entities both become a single space.
+_MARKUP_RE = re.compile(r"<[^>]+>|&[a-z]+;")
+_WS_RE = re.compile(r"\s+")
+
+
 @dataclass(slots=True)
 class FetchUrlResult:
     url: str
@@ -40,28 +48,29 @@ async def fetch_url(url: str) -> FetchUrlResult:
     """Fetch a URL and return cleaned text content."""
     try:
         import asyncio
-        import httpx
 
-        def _fetch(url: str) -> tuple[str, str]:
-            with httpx.Client(follow_redirects=True, timeout=15) as client:
-                response = client.get(url, headers={"User-Agent": "Mozilla/5.0 (compatible; Aiveilix/1.0)"})
-                response.raise_for_status()
-                html = response.text
+        from app.http_client import get_http_client
 
+        def _clean(html: str) -> tuple[str, str]:
             # Try to extract title
-            title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
+            title_match = _TITLE_RE.search(html)
             title = title_match.group(1).strip() if title_match else url
 
             # Strip HTML tags and collapse whitespace
-            text = re.sub(r"<style[^>]*>.*?</style>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r"<script[^>]*>.*?</script>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r"<[^>]+>", " ", text)
-            text = re.sub(r"&[a-z]+;", " ", text)
-            text = re.sub(r"\s+", " ", text).strip()
+            text = _STYLE_SCRIPT_RE.sub(" ", html)
+            text = _MARKUP_RE.sub(" ", text)
+            text = _WS_RE.sub(" ", text).strip()
             # Limit to first ~4000 chars to keep prompt manageable
             return title, text[:4000]
 
-        title, content = await asyncio.to_thread(_fetch, url)
+        response = await get_http_client().get(
+            url,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; Aiveilix/1.0)"},
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+        # The regex passes over a full page are CPU-bound; keep them off the loop.
+        title, content = await asyncio.to_thread(_clean, response.text)
         return FetchUrlResult(url=url, title=title, content=content, success=True)
 
     except Exception as exc:
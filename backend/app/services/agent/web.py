@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from urllib.parse import urlparse
 
 try:
     from duckduckgo_search import DDGS
@@ -24,7 +25,6 @@ _JUNK_DOMAINS = {
 
 
 def _is_junk_url(url: str) -> bool:
-    from urllib.parse import urlparse
     try:
         host = (urlparse(url).hostname or "").lower()
     except Exception:
@@ -1,9 +1,10 @@
+import asyncio
 import uuid
 import random
 import httpx
 from datetime import timedelta, timezone, datetime
 from urllib.parse import urlencode
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.sql import func
@@ -17,6 +18,7 @@ from app.core.security import (
     generate_totp_secret, get_totp_uri, verify_totp,
     generate_backup_codes,
 )
+from app.http_client import get_http_client
 from app.valkey import get_valkey
 from app.services.email import send_verification_email, send_password_reset_email
 from app.services.notifications import create_notification
@@ -58,10 +60,10 @@ async def _check_rate_limit(email: str):
 
 
 async def _record_failed_attempt(email: str):
-    v = get_valkey()
     key = f"failed_login:{email}"
-    await v.incr(key)
-    await v.expire(key, RATE_LIMIT_TTL)
+    # One round-trip; each failure still pushes the lockout window out.
+    async with get_valkey().pipeline(transaction=True) as pipe:
+        await pipe.incr(key).expire(key, RATE_LIMIT_TTL).execute()
 
 
 async def _reset_failed_attempts(email: str):
@@ -176,7 +178,7 @@ async def register(db: AsyncSession, full_name: str, email: str, password: str)
 
     user = User(
         email=email,
-        password_hash=hash_password(password),
+        password_hash=await asyncio.to_thread(hash_password, password),
         provider="email",
         is_verified=False,
     )
@@ -211,7 +213,7 @@ async def register(db: AsyncSession, full_name: str, email: str, password: str)
     v = get_valkey()
     await v.setex(f"email_verify:{token}", VERIFY_TTL, str(user.id))
 
-    send_verification_email(email, token)
+    await asyncio.to_thread(send_verification_email, email, token)
     return {"message": "Account created. Please check your email to verify your account."}
 
 
@@ -258,7 +260,7 @@ async def login(db: AsyncSession, email: str, password: str) -> dict:
     await _check_rate_limit(email)
 
     user = await _get_user_by_email(db, email)
-    if not user or not user.password_hash or not verify_password(password, user.password_hash):
+    if not user or not user.password_hash or not await asyncio.to_thread(verify_password, password, user.password_hash):
         await _record_failed_attempt(email)
         raise HTTPException(status_code=401, detail="Incorrect email or password.")
 
@@ -437,7 +439,7 @@ async def resend_verification(db: AsyncSession, email: str) -> dict:
         token = str(uuid.uuid4())
         v = get_valkey()
         await v.setex(f"email_verify:{token}", VERIFY_TTL, str(user.id))
-        send_verification_email(email, token)
+        await asyncio.to_thread(send_verification_email, email, token)
         await create_notification(
             db,
             str(user.id),
@@ -451,13 +453,14 @@ async def resend_verification(db: AsyncSession, email: str) -> dict:
 
 # ---------- Forgot Password ----------
 
-async def forgot_password(db: AsyncSession, email: str) -> dict:
+async def forgot_password(db: AsyncSession, email: str, background_tasks: BackgroundTasks) -> dict:
     user = await _get_user_by_email(db, email)
     if user:
         code = str(random.randint(100000, 999999))
         v = get_valkey()
         await v.setex(f"password_reset:{code}", RESET_TTL, str(user.id))
-        send_password_reset_email(email, code)
+        # Sent after the response so timing doesn't reveal whether the account exists.
+        background_tasks.add_task(send_password_reset_email, email, code)
         await create_notification(
             db,
             str(user.id),
@@ -481,7 +484,7 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> dic
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
 
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await asyncio.to_thread(hash_password, new_password)
     await create_notification(
         db,
         str(user.id),
@@ -497,33 +500,33 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> dic
 # ---------- Google OAuth ----------
 
 async def exchange_google_oauth(code: str, redirect_uri: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.post("https://oauth2.googleapis.com/token", data={
-            "code": code,
-            "client_id": settings.google_client_id,
-            "client_secret": settings.google_client_secret,
-            "redirect_uri": redirect_uri,
-            "grant_type": "authorization_code",
-        })
-        if token_resp.is_error:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Google token exchange failed: {_oauth_error_detail(token_resp, 'OAuth request was rejected.')}",
-            )
-        token_data = token_resp.json()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise HTTPException(status_code=400, detail="Google token exchange did not return an access token.")
-        user_resp = await client.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {access_token}"},
+    client = get_http_client()
+    token_resp = await client.post("https://oauth2.googleapis.com/token", data={
+        "code": code,
+        "client_id": settings.google_client_id,
+        "client_secret": settings.google_client_secret,
+        "redirect_uri": redirect_uri,
+        "grant_type": "authorization_code",
+    })
+    if token_resp.is_error:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Google token exchange failed: {_oauth_error_detail(token_resp, 'OAuth request was rejected.')}",
         )
-        if user_resp.is_error:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Google user profile fetch failed: {_oauth_error_detail(user_resp, 'Unable to load Google profile.')}",
-            )
-        user_info = user_resp.json()
+    token_data = token_resp.json()
+    access_token = token_data.get("access_token")
+    if not access_token:
+        raise HTTPException(status_code=400, detail="Google token exchange did not return an access token.")
+    user_resp = await client.get(
+        "https://www.googleapis.com/oauth2/v2/userinfo",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if user_resp.is_error:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Google user profile fetch failed: {_oauth_error_detail(user_resp, 'Unable to load Google profile.')}",
+        )
+    user_info = user_resp.json()
 
     expires_at = None
     if token_data.get("expires_in"):
@@ -562,24 +565,24 @@ async def google_oauth(db: AsyncSession, code: str, redirect_uri: str) -> dict:
 # ---------- GitHub OAuth ----------
 
 async def exchange_github_oauth(code: str, redirect_uri: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.post(
-            "https://github.com/login/oauth/access_token",
-            data={"client_id": settings.github_client_id, "client_secret": settings.github_client_secret, "code": code, "redirect_uri": redirect_uri},
-            headers={"Accept": "application/json"},
-        )
-        token_data = token_resp.json()
-        user_resp = await client.get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {token_data['access_token']}"},
-        )
-        user_info = user_resp.json()
-        email_resp = await client.get(
-            "https://api.github.com/user/emails",
-            headers={"Authorization": f"Bearer {token_data['access_token']}"},
-        )
-        emails = email_resp.json()
-        primary_email = next((e["email"] for e in emails if e["primary"]), user_info.get("email"))
+    client = get_http_client()
+    token_resp = await client.post(
+        "https://github.com/login/oauth/access_token",
+        data={"client_id": settings.github_client_id, "client_secret": settings.github_client_secret, "code": code, "redirect_uri": redirect_uri},
+        headers={"Accept": "application/json"},
+    )
+    token_data = token_resp.json()
+    user_resp = await client.get(
+        "https://api.github.com/user",
+        headers={"Authorization": f"Bearer {token_data['access_token']}"},
+    )
+    user_info = user_resp.json()
+    email_resp = await client.get(
+        "https://api.github.com/user/emails",
+        headers={"Authorization": f"Bearer {token_data['access_token']}"},
+    )
+    emails = email_resp.json()
+    primary_email = next((e["email"] for e in emails if e["primary"]), user_info.get("email"))
 
     return {
         "email": primary_email,
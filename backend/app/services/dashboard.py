@@ -1,8 +1,9 @@
 import secrets
+import time
 import uuid
 from datetime import date
 from fastapi import HTTPException
-from sqlalchemy import select, func, desc
+from sqlalchemy import Date, cast, delete, select, func, desc
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -47,14 +48,31 @@ async def get_profile(db: AsyncSession, user_id: str) -> dict:
 
 # ---------- Stats ----------
 
+# The dashboard polls these counters on every page view. Keep each user's
+# result briefly; bucket and file mutations in this process drop it early.
+_STATS_CACHE: dict[uuid.UUID, tuple[float, date, dict]] = {}
+_STATS_CACHE_TTL = 15.0  # seconds
+_STATS_CACHE_MAX = 4096
+
+
+def invalidate_dashboard_stats(user_id: uuid.UUID | str) -> None:
+    """Drop a user's cached dashboard counters after their data changed."""
+    _STATS_CACHE.pop(uuid.UUID(str(user_id)), None)
+
+
 async def get_stats(db: AsyncSession, user_id: str) -> dict:
     uid = uuid.UUID(user_id)
     today = date.today()
     month_start = today.replace(day=1)
 
+    now = time.monotonic()
+    cached = _STATS_CACHE.get(uid)
+    if cached and (now - cached[0]) < _STATS_CACHE_TTL and cached[1] == month_start:
+        return dict(cached[2])
+
     snapshot = await _get_live_dashboard_snapshot(db, uid, month_start)
 
-    return {
+    stats = {
         "storage_gb": round(snapshot["storage_bytes"] / (1024 ** 3), 2),
         "storage_bytes": snapshot["storage_bytes"],
         "bucket_count": snapshot["bucket_count"],
@@ -62,56 +80,63 @@ async def get_stats(db: AsyncSession, user_id: str) -> dict:
         "chat_messages": snapshot["chat_messages"],
         "mcp_calls": snapshot["mcp_calls"],
     }
+    if len(_STATS_CACHE) >= _STATS_CACHE_MAX:
+        _STATS_CACHE.pop(next(iter(_STATS_CACHE)), None)
+    _STATS_CACHE[uid] = (now, month_start, stats)
+    return dict(stats)
 
 
 async def _get_live_dashboard_snapshot(db: AsyncSession, uid: uuid.UUID, month_start: date) -> dict:
     # Storage & file count from the current files table.
     # `buckets.storage_used` is not kept in sync in the upload/delete/replace flow,
     # so the dashboard must compute these totals live.
-    storage_and_files_result = await db.execute(
-        select(
-            func.coalesce(func.sum(File.size), 0),
-            func.count(File.id),
-        )
+    storage_bytes_q = (
+        select(func.coalesce(func.sum(File.size), 0))
         .join(Bucket, File.bucket_id == Bucket.id)
         .where(Bucket.user_id == uid)
+        .scalar_subquery()
     )
-    storage_bytes, files_count = storage_and_files_result.one()
-    storage_bytes = int(storage_bytes or 0)
-    files_count = int(files_count or 0)
-
-    bucket_result = await db.execute(select(func.count()).where(Bucket.user_id == uid))
-    bucket_count = bucket_result.scalar() or 0
-
-    chat_messages_result = await db.execute(
+    files_count_q = (
+        select(func.count(File.id))
+        .join(Bucket, File.bucket_id == Bucket.id)
+        .where(Bucket.user_id == uid)
+        .scalar_subquery()
+    )
+    bucket_count_q = select(func.count(Bucket.id)).where(Bucket.user_id == uid).scalar_subquery()
+    chat_messages_q = (
         select(func.count(Message.id))
         .join(Conversation, Message.conversation_id == Conversation.id)
         .where(
             Conversation.user_id == uid,
             Message.created_at >= month_start,
         )
+        .scalar_subquery()
     )
-    chat_messages = int(chat_messages_result.scalar() or 0)
-
     # MCP calls this month, counted live from the access log.
     # `usage_tracking.mcp_calls_count` is never incremented anywhere, so it
     # would always read 0 — `mcp_access_logs` is the real source of truth.
-    mcp_calls_result = await db.execute(
+    mcp_calls_q = (
         select(func.count(McpAccessLog.id))
         .join(Bucket, McpAccessLog.bucket_id == Bucket.id)
         .where(
             Bucket.user_id == uid,
             McpAccessLog.created_at >= month_start,
         )
+        .scalar_subquery()
     )
-    mcp_calls = int(mcp_calls_result.scalar() or 0)
+
+    # All five counters in one round-trip.
+    result = await db.execute(
+        select(storage_bytes_q, files_count_q, bucket_count_q, chat_messages_q, mcp_calls_q)
+    )
+    storage_bytes, files_count, bucket_count, chat_messages, mcp_calls = result.one()
 
     return {
-        "storage_bytes": storage_bytes,
-        "bucket_count": bucket_count,
-        "files_count": files_count,
-        "chat_messages": chat_messages,
-        "mcp_calls": mcp_calls,
+        "storage_bytes": int(storage_bytes or 0),
+        "bucket_count": int(bucket_count or 0),
+        "files_count": int(files_count or 0),
+        "chat_messages": int(chat_messages or 0),
+        "mcp_calls": int(mcp_calls or 0),
     }
 
 
@@ -161,47 +186,29 @@ async def get_monthly_stats(
     if start_month > end_month:
         raise HTTPException(status_code=400, detail="start_month cannot be after end_month.")
 
-    bucket_baseline_result = await db.execute(
-        select(func.count(Bucket.id))
-        .where(
-            Bucket.user_id == uid,
-            Bucket.created_at < start_month,
-        )
-    )
-    bucket_total = int(bucket_baseline_result.scalar() or 0)
-
-    file_baseline_result = await db.execute(
-        select(
-            func.count(File.id),
-            func.coalesce(func.sum(File.size), 0),
-        )
-        .join(Bucket, File.bucket_id == Bucket.id)
-        .where(
-            Bucket.user_id == uid,
-            File.created_at < start_month,
-        )
-    )
-    file_total, storage_total = file_baseline_result.one()
-    file_total = int(file_total or 0)
-    storage_total = int(storage_total or 0)
+    # Cumulative series: rows older than the window are clamped into its first
+    # month, so the baseline totals come back with the per-month increments.
+    window_start = cast(start_month, Date)
 
-    bucket_month_expr = func.date_trunc("month", Bucket.created_at).label("bucket_month")
+    bucket_month_expr = func.greatest(
+        func.date_trunc("month", Bucket.created_at), window_start
+    ).label("bucket_month")
     bucket_rows = await db.execute(
         select(bucket_month_expr, func.count(Bucket.id))
         .where(
             Bucket.user_id == uid,
-            Bucket.created_at >= start_month,
             Bucket.created_at < end_month_exclusive,
         )
         .group_by(bucket_month_expr)
-        .order_by(bucket_month_expr.asc())
     )
     bucket_increments = {
         bucket_month.date().replace(day=1): int(bucket_count or 0)
         for bucket_month, bucket_count in bucket_rows.all()
     }
 
-    file_month_expr = func.date_trunc("month", File.created_at).label("file_month")
+    file_month_expr = func.greatest(
+        func.date_trunc("month", File.created_at), window_start
+    ).label("file_month")
     file_rows = await db.execute(
         select(
             file_month_expr,
@@ -211,11 +218,9 @@ async def get_monthly_stats(
         .join(Bucket, File.bucket_id == Bucket.id)
         .where(
             Bucket.user_id == uid,
-            File.created_at >= start_month,
             File.created_at < end_month_exclusive,
         )
         .group_by(file_month_expr)
-        .order_by(file_month_expr.asc())
     )
     file_increments: dict[date, dict[str, int]] = {}
     for file_month, file_count, storage_used in file_rows.all():
@@ -258,6 +263,7 @@ async def get_monthly_stats(
         for mcp_month, mcp_calls in mcp_rows.all()
     }
 
+    bucket_total = file_total = storage_total = 0
     series: list[dict[str, object]] = []
     for month in _iter_months(start_month, end_month):
         bucket_total += bucket_increments.get(month, 0)
@@ -304,14 +310,50 @@ async def get_bucket(db: AsyncSession, user_id: str, bucket_id: str) -> dict:
     }
 
 
-async def list_buckets(db: AsyncSession, user_id: str) -> list:
+async def list_buckets(
+    db: AsyncSession,
+    user_id: str,
+    *,
+    bucket_ids: list[uuid.UUID] | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> tuple[list, int]:
+    """Return one page of the caller's buckets and the total across all pages.
+
+    The total rides along on each row as a window count, so paging costs no
+    extra query unless `offset` is past the last row.
+    """
     uid = uuid.UUID(user_id)
-    result = await db.execute(
-        select(Bucket)
-        .where(Bucket.user_id == uid, Bucket.is_demo.is_(False))
+    filters = [Bucket.user_id == uid, Bucket.is_demo.is_(False)]
+    if bucket_ids is not None:
+        filters.append(Bucket.id.in_(bucket_ids))
+    # Plain column rows: the listing never touches the ORM objects, so skip
+    # hydrating and identity-tracking a full Bucket per row.
+    stmt = (
+        select(
+            Bucket.id,
+            Bucket.name,
+            Bucket.description,
+            Bucket.color,
+            Bucket.icon,
+            Bucket.processing_tier,
+            Bucket.updated_at,
+            Bucket.created_at,
+            func.count().over().label("total"),
+        )
+        .where(*filters)
         .order_by(desc(Bucket.updated_at))
+        .limit(limit)
+        .offset(offset)
     )
-    buckets = result.scalars().all()
+    result = await db.execute(stmt)
+    buckets = result.all()
+    if buckets:
+        total = buckets[0].total
+    elif offset:
+        total = (await db.execute(select(func.count()).select_from(Bucket).where(*filters))).scalar_one()
+    else:
+        total = 0
 
     stats_map = await _get_bucket_stats_map(db, [b.id for b in buckets])
 
@@ -326,14 +368,14 @@ async def list_buckets(db: AsyncSession, user_id: str) -> list:
             "description": b.description,
             "color": b.color,
             "icon": b.icon,
-            "processing_tier": getattr(b, "processing_tier", None) or "full",
+            "processing_tier": b.processing_tier or "full",
             "storage_used": storage_used,
             "storage_gb": round(storage_used / (1024 ** 3), 2),
             "file_count": file_count,
             "updated_at": b.updated_at.isoformat(),
             "created_at": b.created_at.isoformat(),
         })
-    return out
+    return out, total
 
 
 async def create_bucket(
@@ -372,7 +414,7 @@ async def create_bucket(
         if "buckets_name_per_user_unique" in str(exc.orig):
             raise HTTPException(status_code=409, detail="A bucket with this name already exists.") from exc
         raise
-    await db.refresh(bucket)
+    invalidate_dashboard_stats(uid)
     return {
         "id": str(bucket.id),
         "name": bucket.name,
@@ -420,7 +462,6 @@ async def update_bucket(
         f'Bucket "{bucket.name}" was updated successfully.',
     )
     await db.commit()
-    await db.refresh(bucket)
     bucket_stats = await _get_bucket_stats_map(db, [bid])
     file_count = bucket_stats[bid]["file_count"]
     storage_used = bucket_stats[bid]["storage_used"]
@@ -440,11 +481,9 @@ async def update_bucket(
 
 async def delete_all_buckets(db: AsyncSession, user_id: str) -> dict:
     uid = uuid.UUID(user_id)
-    result = await db.execute(select(Bucket).where(Bucket.user_id == uid))
-    buckets = result.scalars().all()
-    deleted_count = len(buckets)
-    for bucket in buckets:
-        await db.delete(bucket)
+    # One statement; files, chunks, conversations etc. go via ON DELETE CASCADE.
+    result = await db.execute(delete(Bucket).where(Bucket.user_id == uid))
+    deleted_count = result.rowcount
     await create_notification(
         db,
         user_id,
@@ -453,21 +492,21 @@ async def delete_all_buckets(db: AsyncSession, user_id: str) -> dict:
         f"{deleted_count} bucket(s) were deleted from your account.",
     )
     await db.commit()
+    invalidate_dashboard_stats(uid)
     return {"message": "All buckets deleted successfully.", "deleted_count": deleted_count}
 
 
 async def delete_bucket(db: AsyncSession, user_id: str, bucket_id: str) -> dict:
     uid = uuid.UUID(user_id)
     bid = uuid.UUID(bucket_id)
+    # Ownership check and delete in one statement; dependents go via ON DELETE CASCADE.
     result = await db.execute(
-        select(Bucket).where(Bucket.id == bid, Bucket.user_id == uid)
+        delete(Bucket).where(Bucket.id == bid, Bucket.user_id == uid).returning(Bucket.name)
     )
-    bucket = result.scalar_one_or_none()
-    if not bucket:
+    bucket_name = result.scalar_one_or_none()
+    if bucket_name is None:
         raise HTTPException(status_code=404, detail="Bucket not found.")
 
-    bucket_name = bucket.name
-    await db.delete(bucket)
     await create_notification(
         db,
         user_id,
@@ -476,6 +515,7 @@ async def delete_bucket(db: AsyncSession, user_id: str, bucket_id: str) -> dict:
         f'Bucket "{bucket_name}" was deleted successfully.',
     )
     await db.commit()
+    invalidate_dashboard_stats(uid)
     return {"message": "Bucket deleted successfully.", "id": bucket_id}
 
 
@@ -79,20 +79,23 @@ def split_text_for_memory(text: str, chunk_size: int = 256, overlap: int = 50) -
     return [chunk for chunk in chunks if chunk]
 
 
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "i", "in", "is", "it", "of", "on", "or", "that", "the", "this", "to",
+    "was", "what", "when", "where", "which", "who", "why", "with", "you",
+})
+
+
 def normalize_terms(text: str) -> list[str]:
-    stop_words = {
-        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
-        "i", "in", "is", "it", "of", "on", "or", "that", "the", "this", "to",
-        "was", "what", "when", "where", "which", "who", "why", "with", "you",
-    }
     terms = [term.lower() for term in _WORD_RE.findall(text)]
-    return [term for term in terms if term not in stop_words and len(term) > 1]
+    return [term for term in terms if term not in _STOP_WORDS and len(term) > 1]
 
 
 def _hash_embedding(text: str, dimension: int = DEFAULT_EMBEDDING_DIMENSION) -> list[float]:
     vector = [0.0] * dimension
     for term in normalize_terms(text):
-        digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+        # Bucketing hash, not a security primitive.
+        digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16, usedforsecurity=False).digest()
         idx = int.from_bytes(digest[:4], "big") % dimension
         sign = 1.0 if digest[4] % 2 == 0 else -1.0
         vector[idx] += sign
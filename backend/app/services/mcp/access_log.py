@@ -0,0 +1,159 @@
+"""
+Per-call access logging for bucket MCP tokens.
+
+Shared by the JSON-RPC server (/mcp/bucket/{token}) and the REST tool
+endpoints (/mcp/bucket/{token}/...), which record the same McpAccessLog row
+and bump the token's last_used_at on every tool call.
+
+Rows are buffered in-process and written in batches — one INSERT for every
+buffered row plus one last_used_at UPDATE per flush — instead of a commit on
+the request's session per tool call. A single background loop flushes every
+_FLUSH_INTERVAL while rows are waiting, immediately once _FLUSH_MAX_ROWS are
+buffered, and drain_access_logs() writes the rest at shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import Request
+from sqlalchemy import insert, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.sql import func
+
+from app.database import db_session
+from app.models.mcp_token import BucketMcpToken, McpAccessLog
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL = 0.2  # seconds a logged call may wait before it is written
+_FLUSH_MAX_ROWS = 100
+
+_ORIGIN_MAX = McpAccessLog.__table__.c.origin.type.length
+_IP_MAX = McpAccessLog.__table__.c.ip_address.type.length
+
+_pending_rows: list[dict] = []
+_touched_tokens: set[uuid.UUID] = set()
+_flush_scheduled = False  # a _flush_loop task is alive
+_flush_now = asyncio.Event()  # wakes the loop early when the buffer is full
+_flush_tasks: set[asyncio.Task] = set()
+
+
+def client_ip(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def log_bucket_call(
+    *,
+    token: BucketMcpToken,
+    tool: str,
+    status: str,
+    status_code: int,
+    duration_ms: int,
+    request: Request,
+    error_message: str | None = None,
+) -> None:
+    global _flush_scheduled
+    _pending_rows.append({
+        "token_id": token.id,
+        "bucket_id": token.bucket_id,
+        "tool": tool,
+        "status": status,
+        "status_code": status_code,
+        "error_message": error_message,
+        # Truncated to the column widths: one oversized header must not fail
+        # the INSERT for every other call in the batch.
+        "origin": (request.headers.get("origin") or request.headers.get("referer") or "")[:_ORIGIN_MAX] or None,
+        "ip_address": client_ip(request)[:_IP_MAX],
+        "duration_ms": duration_ms,
+        "created_at": datetime.now(timezone.utc),
+    })
+    _touched_tokens.add(token.id)
+
+    if len(_pending_rows) >= _FLUSH_MAX_ROWS:
+        _flush_now.set()
+    if not _flush_scheduled:
+        _flush_scheduled = True
+        task = asyncio.create_task(_flush_loop())
+        _flush_tasks.add(task)
+        task.add_done_callback(_flush_tasks.discard)
+
+
+async def _flush_loop() -> None:
+    """Single writer: flushes until the buffer is empty, then exits.
+
+    Only one loop runs at a time, so a slow or unreachable database delays
+    flushes instead of stacking up concurrent ones.
+    """
+    global _flush_scheduled
+    try:
+        while _pending_rows:
+            try:
+                await asyncio.wait_for(_flush_now.wait(), _FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            _flush_now.clear()
+            await flush_access_logs()
+    finally:
+        _flush_scheduled = False
+
+
+async def drain_access_logs() -> None:
+    """Write everything still buffered; call once at shutdown."""
+    _flush_now.set()
+    await asyncio.gather(*_flush_tasks, return_exceptions=True)
+    await flush_access_logs()
+
+
+async def flush_access_logs() -> None:
+    """Write every buffered access-log row in one transaction.
+
+    If the batch is rejected by a constraint (e.g. a token deleted while its
+    rows were buffered), the rows are retried one by one so only the bad ones
+    are lost. Any other failure, such as the database being unreachable, drops
+    the batch once rather than retrying every row against it.
+    """
+    if not _pending_rows:
+        return
+    rows = _pending_rows[:]
+    token_ids = list(_touched_tokens)
+    _pending_rows.clear()
+    _touched_tokens.clear()
+    try:
+        await _write_rows(rows, token_ids)
+        return
+    except (IntegrityError, DataError):
+        logger.warning("[MCP] access-log batch of %d rows rejected; retrying row by row", len(rows))
+    except Exception:
+        logger.exception("[MCP] dropped %d access-log rows: batch write failed", len(rows))
+        return
+
+    dropped = 0
+    for i, row in enumerate(rows):
+        try:
+            await _write_rows([row], [row["token_id"]])
+        except (IntegrityError, DataError):
+            dropped += 1
+        except Exception:
+            logger.exception("[MCP] access-log retry failed; dropping the remaining rows")
+            dropped += len(rows) - i
+            break
+    if dropped:
+        logger.error("[MCP] dropped %d of %d access-log rows", dropped, len(rows))
+
+
+async def _write_rows(rows: list[dict], token_ids: list[uuid.UUID]) -> None:
+    async with db_session() as db:
+        await db.execute(insert(McpAccessLog), rows)
+        await db.execute(
+            update(BucketMcpToken)
+            .where(BucketMcpToken.id.in_(token_ids))
+            .values(last_used_at=func.now())
+        )
+        await db.commit()
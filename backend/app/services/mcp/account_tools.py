@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import logging
 import secrets
+import time
 import uuid
 
 from fastapi import HTTPException
@@ -36,18 +37,14 @@ from app.services.notifications import create_notification
 logger = logging.getLogger(__name__)
 
 
-def _mcp_base() -> str:
-    return getattr(settings, "mcp_base_url", "https://mcp.aiveilix.com").rstrip("/")
-
-
 def bucket_mcp_url(token: str) -> str:
     """Canonical MCP endpoint URL for a bucket token."""
-    return f"{_mcp_base()}/v1/mcp/bucket/{token}"
+    return f"{settings.mcp_endpoint_base}/bucket/{token}"
 
 
 def account_mcp_url(token: str) -> str:
     """Canonical MCP endpoint URL for an account token."""
-    return f"{_mcp_base()}/v1/mcp/account/{token}"
+    return f"{settings.mcp_endpoint_base}/account/{token}"
 
 
 # ── scope helpers ─────────────────────────────────────────────────────────────
@@ -64,51 +61,71 @@ def _in_scope(token: AccountMcpToken, bucket_id: uuid.UUID) -> bool:
     return scope is None or bucket_id in scope
 
 
-async def _bucket_stats(db: AsyncSession, bucket_id: uuid.UUID) -> tuple[int, int]:
-    """Returns (files_count, storage_used) for ready files of a bucket."""
-    files_count = (
-        await db.execute(
-            select(func.count()).where(File.bucket_id == bucket_id, File.status == "ready")
-        )
-    ).scalar_one()
-    storage_used = (
-        await db.execute(
-            select(func.coalesce(func.sum(File.size), 0)).where(
-                File.bucket_id == bucket_id, File.status == "ready"
-            )
-        )
-    ).scalar_one()
-    return files_count, int(storage_used or 0)
+async def _bucket_stats(db: AsyncSession, bucket_ids: list[uuid.UUID]) -> dict[uuid.UUID, tuple[int, int]]:
+    """(files_count, storage_used) over ready files, for every bucket in one query.
+    Buckets without ready files are absent from the result."""
+    rows = await db.execute(
+        select(File.bucket_id, func.count(), func.coalesce(func.sum(File.size), 0))
+        .where(File.bucket_id.in_(bucket_ids), File.status == "ready")
+        .group_by(File.bucket_id)
+    )
+    return {bid: (count, int(size or 0)) for bid, count, size in rows.all()}
 
 
-async def _first_token_url(db: AsyncSession, bucket_id: uuid.UUID) -> str | None:
-    """First active bucket-MCP token URL for a bucket, if one exists."""
-    token = (
-        await db.execute(
-            select(BucketMcpToken.token)
-            .where(BucketMcpToken.bucket_id == bucket_id, BucketMcpToken.is_active.is_(True))
-            .order_by(BucketMcpToken.created_at.asc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
-    return bucket_mcp_url(token) if token else None
+async def _first_token_urls(db: AsyncSession, bucket_ids: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+    """URL of the oldest active bucket-MCP token per bucket, for every bucket in one query."""
+    rows = await db.execute(
+        select(BucketMcpToken.bucket_id, BucketMcpToken.token)
+        .where(BucketMcpToken.bucket_id.in_(bucket_ids), BucketMcpToken.is_active.is_(True))
+        .order_by(BucketMcpToken.created_at.asc())
+    )
+    urls: dict[uuid.UUID, str] = {}
+    for bid, tok in rows.all():
+        urls.setdefault(bid, bucket_mcp_url(tok))
+    return urls
 
 
 # ── list_buckets ──────────────────────────────────────────────────────────────
 
+# MCP clients tend to call list_buckets back-to-back (tool discovery, then again
+# before every bucket-level call), and each listing costs three queries. Keep
+# the result briefly per (user, scope); MCP create/delete drop the user's entries.
+_LIST_CACHE: dict[tuple[uuid.UUID, frozenset[uuid.UUID] | None], tuple[float, dict]] = {}
+_LIST_CACHE_TTL = 10.0  # seconds
+_LIST_CACHE_MAX = 256
+
+
+def invalidate_bucket_listing(user_id: uuid.UUID) -> None:
+    for key in [k for k in _LIST_CACHE if k[0] == user_id]:
+        _LIST_CACHE.pop(key, None)
+
+
 async def acct_list_buckets(db: AsyncSession, token: AccountMcpToken) -> dict:
     scope = _scope(token)
     if scope is not None and not scope:
         return {"buckets": [], "total": 0}
 
+    cache_key = (token.user_id, None if scope is None else frozenset(scope))
+    now = time.monotonic()
+    cached = _LIST_CACHE.get(cache_key)
+    if cached and (now - cached[0]) < _LIST_CACHE_TTL:
+        return cached[1]
+
     query = select(Bucket).where(Bucket.user_id == token.user_id)
     if scope is not None:
         query = query.where(Bucket.id.in_(scope))
     buckets = (await db.execute(query.order_by(Bucket.created_at.desc()))).scalars().all()
 
+    stats: dict[uuid.UUID, tuple[int, int]] = {}
+    urls: dict[uuid.UUID, str] = {}
+    if buckets:
+        ids = [b.id for b in buckets]
+        stats = await _bucket_stats(db, ids)
+        urls = await _first_token_urls(db, ids)
+
     out = []
     for b in buckets:
-        files_count, storage_used = await _bucket_stats(db, b.id)
+        files_count, storage_used = stats.get(b.id, (0, 0))
         out.append({
             "bucket_id": str(b.id),
             "name": b.name,
@@ -116,10 +133,15 @@ async def acct_list_buckets(db: AsyncSession, token: AccountMcpToken) -> dict:
             "color": b.color,
             "files_count": files_count,
             "storage_used": storage_used,
-            "mcp_url": await _first_token_url(db, b.id),
+            "mcp_url": urls.get(b.id),
             "created_at": b.created_at.isoformat(),
         })
-    return {"buckets": out, "total": len(out)}
+    result = {"buckets": out, "total": len(out)}
+
+    if len(_LIST_CACHE) >= _LIST_CACHE_MAX:
+        _LIST_CACHE.pop(next(iter(_LIST_CACHE)), None)
+    _LIST_CACHE[cache_key] = (now, result)
+    return result
 
 
 # ── create_bucket ─────────────────────────────────────────────────────────────
@@ -159,6 +181,7 @@ async def acct_create_bucket(
             raise HTTPException(status_code=409, detail="A bucket with this name already exists.") from exc
         raise
     await db.refresh(bucket)
+    invalidate_bucket_listing(token.user_id)
 
     # A "selected"-scope token gains access to buckets it creates itself.
     if token.bucket_mode == "selected":
@@ -186,7 +209,8 @@ async def acct_get_bucket(db: AsyncSession, token: AccountMcpToken, bucket_id: u
     ).scalar_one_or_none()
     if bucket is None:
         return None
-    files_count, storage_used = await _bucket_stats(db, bucket.id)
+    files_count, storage_used = (await _bucket_stats(db, [bucket.id])).get(bucket.id, (0, 0))
+    urls = await _first_token_urls(db, [bucket.id])
     return {
         "bucket_id": str(bucket.id),
         "name": bucket.name,
@@ -194,7 +218,7 @@ async def acct_get_bucket(db: AsyncSession, token: AccountMcpToken, bucket_id: u
         "color": bucket.color,
         "files_count": files_count,
         "storage_used": storage_used,
-        "mcp_url": await _first_token_url(db, bucket.id),
+        "mcp_url": urls.get(bucket.id),
         "created_at": bucket.created_at.isoformat(),
     }
 
@@ -228,6 +252,7 @@ async def acct_delete_bucket(db: AsyncSession, token: AccountMcpToken, bucket_id
         ]
 
     await db.commit()
+    invalidate_bucket_listing(token.user_id)
     return {"success": True, "message": f'Bucket "{bucket_name}" deleted successfully.'}
 
 
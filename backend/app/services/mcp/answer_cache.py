@@ -0,0 +1,117 @@
+"""
+Short-lived semantic cache for the bucket MCP `query` tool.
+
+Agents re-ask near-identical questions within a session ("what does X do?",
+"What does X do"), and every answer costs retrieval plus a full LLM
+generation. Answers are kept per (user, bucket) for a couple of minutes and
+reused when a new question's embedding is close enough to a stored one.
+
+The question embedding comes from retrieval's own query cache, so a miss
+costs nothing extra: the search that follows reuses the same vector.
+
+Near-identical embeddings can still belong to different questions ("revenue
+in 2023" vs "revenue in 2024"), so a caller can skip the cache entirely with
+`fresh=True` or by putting the word `nocache` in the question.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.agent.retrieval import _bucket_processing_tier, _embed_query_text
+from app.services.agent.service import answer_bucket_query
+
+logger = logging.getLogger(__name__)
+
+_ANSWER_CACHE_TTL = 120.0  # seconds — new uploads show up after this
+_ANSWER_CACHE_MIN_SIMILARITY = 0.95
+_ANSWER_CACHE_PER_SCOPE = 32
+_ANSWER_CACHE_MAX_SCOPES = 512
+_NOCACHE_RE = re.compile(r"\bnocache\b", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _Entry:
+    stored_at: float
+    vector: np.ndarray  # unit-normalised, so a dot product is the cosine
+    answer: dict
+
+
+_ANSWER_CACHE: dict[tuple[uuid.UUID, uuid.UUID], list[_Entry]] = {}
+
+
+async def _question_vector(db: AsyncSession, bucket_id: uuid.UUID, question: str) -> np.ndarray | None:
+    try:
+        tier = await _bucket_processing_tier(db, bucket_id)
+        emb = await _embed_query_text(question, lite=tier == "lite")
+    except Exception as exc:
+        logger.debug("answer cache skipped, embedding failed: %s", exc)
+        return None
+    vec = np.asarray(emb.dense, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else None
+
+
+async def answer_bucket_question(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    bucket_id: uuid.UUID,
+    question: str,
+    fresh: bool = False,
+) -> dict:
+    """Answer a bucket question for an MCP tool call, reusing a recent answer
+    to a near-identical question from the same user on the same bucket.
+
+    `fresh=True`, or a `nocache` word anywhere in the question, bypasses the
+    cache (no lookup, no store). The question itself is answered as given.
+    """
+    if fresh or _NOCACHE_RE.search(question):
+        return await _answer(db, user_id, bucket_id, question)
+
+    key = (user_id, bucket_id)
+    vec = await _question_vector(db, bucket_id, question)
+    now = time.monotonic()
+    entries = [e for e in _ANSWER_CACHE.get(key, ()) if (now - e.stored_at) < _ANSWER_CACHE_TTL]
+
+    if vec is not None and entries:
+        sims = np.stack([e.vector for e in entries]) @ vec
+        best = int(sims.argmax())
+        if sims[best] >= _ANSWER_CACHE_MIN_SIMILARITY:
+            logger.info("[MCP] answer cache hit bucket=%s similarity=%.3f", bucket_id, sims[best])
+            return _copy(entries[best].answer)
+
+    answer = await _answer(db, user_id, bucket_id, question)
+    if vec is None:
+        return answer
+
+    entries.append(_Entry(stored_at=now, vector=vec, answer=answer))
+    del entries[:-_ANSWER_CACHE_PER_SCOPE]
+    _ANSWER_CACHE.pop(key, None)
+    if len(_ANSWER_CACHE) >= _ANSWER_CACHE_MAX_SCOPES:
+        _ANSWER_CACHE.pop(next(iter(_ANSWER_CACHE)), None)
+    _ANSWER_CACHE[key] = entries
+    return _copy(answer)
+
+
+def _copy(answer: dict) -> dict:
+    """Hand callers their own dict so nothing they do reaches the cached entry."""
+    return {**answer, "sources": list(answer["sources"])}
+
+
+async def _answer(db: AsyncSession, user_id: uuid.UUID, bucket_id: uuid.UUID, question: str) -> dict:
+    resp = await answer_bucket_query(
+        db, user_id=str(user_id), bucket_id=str(bucket_id), question=question
+    )
+    return {
+        "answer": resp.answer,
+        "sources": resp.sources,
+        "used_web_search": resp.used_web_search,
+    }
@@ -14,6 +14,8 @@ Account handler signature: async (db, user_id, args) -> dict
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
+from functools import lru_cache
 
 from fastapi import HTTPException
 
@@ -70,17 +72,13 @@ async def _h_search(db, bucket_id, user_id, args):
 
 
 async def _h_query(db, bucket_id, user_id, args):
-    from app.services.agent.service import answer_bucket_query
+    from app.services.mcp.answer_cache import answer_bucket_question
 
     question = _require(args, "question")
-    resp = await answer_bucket_query(
-        db, user_id=str(user_id), bucket_id=str(bucket_id), question=question
+    return await answer_bucket_question(
+        db, user_id=user_id, bucket_id=bucket_id, question=question,
+        fresh=bool(args.get("fresh")),
     )
-    return {
-        "answer": resp.answer,
-        "sources": resp.sources,
-        "used_web_search": resp.used_web_search,
-    }
 
 
 async def _h_list_files(db, bucket_id, user_id, args):
@@ -238,6 +236,7 @@ BUCKET_TOOLS: dict[str, dict] = {
                 "type": "object",
                 "properties": {
                     "question": {"type": "string", "description": "The question to answer."},
+                    "fresh": {"type": "boolean", "description": "Skip the short-lived cache of answers to near-identical recent questions.", "default": False},
                 },
                 "required": ["question"],
             },
@@ -475,8 +474,13 @@ ACCOUNT_TOOLS: dict[str, dict] = {
 }
 
 
-def bucket_tool_definitions(allowed: list[str] | None = None) -> list[dict]:
-    """tools/list payload for a bucket token, optionally filtered to allowed names."""
+# Definitions are static, so tools/list payloads are built once: the full
+# account list at import, and one filtered bucket list per allowed-tools set.
+_ACCOUNT_TOOL_DEFS = [entry["definition"] for entry in ACCOUNT_TOOLS.values()]
+
+
+@lru_cache(maxsize=64)
+def _bucket_defs_for(allowed: frozenset[str] | None) -> list[dict]:
     return [
         entry["definition"]
         for name, entry in BUCKET_TOOLS.items()
@@ -484,5 +488,10 @@ def bucket_tool_definitions(allowed: list[str] | None = None) -> list[dict]:
     ]
 
 
+def bucket_tool_definitions(allowed: Iterable[str] | None = None) -> list[dict]:
+    """tools/list payload for a bucket token, optionally filtered to allowed names."""
+    return _bucket_defs_for(None if allowed is None else frozenset(allowed))
+
+
 def account_tool_definitions() -> list[dict]:
-    return [entry["definition"] for entry in ACCOUNT_TOOLS.values()]
+    return _ACCOUNT_TOOL_DEFS
@@ -22,6 +22,7 @@ import uuid
 
 from qdrant_client.models import FieldCondition, Filter, MatchValue, Range
 from sqlalchemy import and_, func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.bucket import Bucket, Category
@@ -36,6 +37,12 @@ from app.services.qdrant.file_indexer import IMAGE_COLLECTION, TEXT_COLLECTION
 
 logger = logging.getLogger(__name__)
 
+# Chunk fields every chunk listing returns. Selecting the columns (rather than
+# Chunk entities) skips ORM instrumentation, and rows unpack straight to locals.
+_CHUNK_COLUMNS = (
+    Chunk.id, Chunk.page, Chunk.block_id, Chunk.content, Chunk.token_count, Chunk.nearby_image_id,
+)
+
 
 # ── fetch_files_list ──────────────────────────────────────────────────────────
 
@@ -129,23 +136,20 @@ async def fetch_file_spread(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
 
     # Chunks from Postgres grouped by page
     chunks_result = await db.execute(
-        select(Chunk)
+        select(*_CHUNK_COLUMNS)
         .where(Chunk.file_id == file_id, Chunk.status == "embedded")
-        .order_by(Chunk.page.asc(), Chunk.chunk_index.asc() if hasattr(Chunk, "chunk_index") else Chunk.id)
+        .order_by(Chunk.page.asc(), Chunk.id)
     )
-    chunks = chunks_result.scalars().all()
+    chunks = chunks_result.all()
 
     chunks_by_page: dict[int, list[dict]] = {}
-    for chunk in chunks:
-        page = chunk.page
-        if page not in chunks_by_page:
-            chunks_by_page[page] = []
-        chunks_by_page[page].append({
-            "chunk_id": str(chunk.id),
-            "block_id": chunk.block_id,
-            "content": chunk.content,
-            "token_count": chunk.token_count,
-            "nearby_image_id": chunk.nearby_image_id,
+    for cid, page, block_id, content, token_count, nearby_image_id in chunks:
+        chunks_by_page.setdefault(page, []).append({
+            "chunk_id": str(cid),
+            "block_id": block_id,
+            "content": content,
+            "token_count": token_count,
+            "nearby_image_id": nearby_image_id,
         })
 
     images_by_page = await _fetch_images_for_file_unified(db, file_id)
@@ -187,11 +191,11 @@ async def fetch_page_blocks(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
 
     # Text chunks for this page
     chunks_result = await db.execute(
-        select(Chunk)
+        select(*_CHUNK_COLUMNS)
         .where(Chunk.file_id == file_id, Chunk.page == page, Chunk.status == "embedded")
         .order_by(Chunk.id)
     )
-    chunks = chunks_result.scalars().all()
+    chunks = chunks_result.all()
 
     images_by_page = await _fetch_images_for_file_unified(db, file_id, page_filter=page)
 
@@ -203,13 +207,13 @@ async def fetch_page_blocks(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
         "blocks": [
             {
                 "type": "text",
-                "chunk_id": str(chunk.id),
-                "block_id": chunk.block_id,
-                "content": chunk.content,
-                "token_count": chunk.token_count,
-                "nearby_image_id": chunk.nearby_image_id,
+                "chunk_id": str(cid),
+                "block_id": block_id,
+                "content": content,
+                "token_count": token_count,
+                "nearby_image_id": nearby_image_id,
             }
-            for chunk in chunks
+            for cid, _, block_id, content, token_count, nearby_image_id in chunks
         ],
         "images": images_by_page.get(page, []),
     }
@@ -412,7 +416,7 @@ async def _fetch_images_for_file(
 
 # ── fetch_file_layout ─────────────────────────────────────────────────────────
 
-def _layout_block_from_element(elem: dict, chunk_by_block: dict[str, Chunk]) -> dict:
+def _layout_block_from_element(elem: dict, chunk_by_block: dict[str, Row]) -> dict:
     """Map one raw layout element to a layout block, preserving the structural
     fields (bbox, source, sort_order, image_uri, metadata) the raw layout
     carries. Text elements are enriched with their chunk_id/token_count so the
@@ -459,19 +463,18 @@ async def fetch_file_layout(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
     if row is None:
         return None
 
-    chunks_result = await db.execute(
-        select(Chunk)
-        .where(Chunk.file_id == file_id, Chunk.status == "embedded")
-        .order_by(Chunk.page.asc(), Chunk.id)
-    )
-    chunks = chunks_result.scalars().all()
-    chunk_by_block = {c.block_id: c for c in chunks if c.block_id}
-
     pages: dict[int, list[dict]] = {}
     doc_conflicts: list = []
 
     if row.layout_json_path:
         # Preferred path: serve the raw layout map with all structural fields.
+        # Block text comes from the layout itself, so chunk content stays in
+        # Postgres; only the ids that link blocks back to chunks are read.
+        chunks_result = await db.execute(
+            select(Chunk.id, Chunk.block_id, Chunk.token_count, Chunk.nearby_image_id)
+            .where(Chunk.file_id == file_id, Chunk.status == "embedded")
+        )
+        chunk_by_block = {c.block_id: c for c in chunks_result.all() if c.block_id}
         layout = await _load_layout(row.layout_json_path)
         doc_conflicts = layout.get("name_conflicts") or []
         for page_obj in layout.get("pages", []):
@@ -485,8 +488,13 @@ async def fetch_file_layout(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
             ]
     else:
         # Legacy fallback: reconstruct from chunks + images (no bbox/sort_order).
+        chunks_result = await db.execute(
+            select(*_CHUNK_COLUMNS)
+            .where(Chunk.file_id == file_id, Chunk.status == "embedded")
+            .order_by(Chunk.page.asc(), Chunk.id)
+        )
         images_by_page = await _fetch_images_for_file_unified(db, file_id)
-        for chunk in chunks:
+        for chunk in chunks_result.all():
             pages.setdefault(chunk.page, []).append({
                 "type": "text",
                 "id": chunk.block_id,
@@ -605,7 +613,17 @@ async def fetch_chunk(db: AsyncSession, bucket_id: uuid.UUID, chunk_id: uuid.UUI
 
 # ── fetch_chunks_list ─────────────────────────────────────────────────────────
 
-async def fetch_chunks_list(db: AsyncSession, bucket_id: uuid.UUID, file_id: uuid.UUID) -> dict | None:
+async def fetch_chunks_list(
+    db: AsyncSession,
+    bucket_id: uuid.UUID,
+    file_id: uuid.UUID,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+) -> dict | None:
+    """All chunks of a file, or the `offset`/`limit` window of them. With a
+    limit only that window's content is loaded; `total_chunks` is still the
+    whole file's count."""
     file_result = await db.execute(
         select(File.id, File.name)
         .where(File.id == file_id, File.bucket_id == bucket_id, File.status == "ready")
@@ -619,36 +637,48 @@ async def fetch_chunks_list(db: AsyncSession, bucket_id: uuid.UUID, file_id: uui
     # (ingest order, often identical for a bulk insert) then id as a stable
     # tiebreaker. This guarantees the SAME order every call, but within-page
     # order is approximate. A real chunk_index at ingest is the proper fix.
-    chunks_result = await db.execute(
-        select(Chunk)
-        .where(Chunk.file_id == file_id, Chunk.status == "embedded")
+    where = (Chunk.file_id == file_id, Chunk.status == "embedded")
+    stmt = (
+        select(*_CHUNK_COLUMNS)
+        .where(*where)
         .order_by(Chunk.page.asc(), Chunk.created_at.asc(), Chunk.id.asc())
     )
-    chunks = chunks_result.scalars().all()
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    chunks = (await db.execute(stmt)).all()
+    if limit is None and not offset:
+        total = len(chunks)
+    else:
+        total = (await db.execute(select(func.count()).select_from(Chunk).where(*where))).scalar_one()
 
     return {
         "file_id": str(row.id),
         "file_name": row.name,
-        "total_chunks": len(chunks),
+        "total_chunks": total,
         "chunks": [
             {
-                "chunk_id": str(c.id),
-                "page": c.page,
-                "block_id": c.block_id,
-                "content": c.content,
-                "token_count": c.token_count,
-                "nearby_image_id": c.nearby_image_id,
+                "chunk_id": str(cid),
+                "page": page,
+                "block_id": block_id,
+                "content": content,
+                "token_count": token_count,
+                "nearby_image_id": nearby_image_id,
             }
-            for c in chunks
+            for cid, page, block_id, content, token_count, nearby_image_id in chunks
         ],
     }
 
 
 # ── fetch_section ─────────────────────────────────────────────────────────────
 
+_WS_RE = re.compile(r"\s+")
+
+
 def _normalize_heading(text: str) -> str:
     """Collapse whitespace so `Report \\nhighlights` matches `report highlights`."""
-    return re.sub(r"\s+", " ", (text or "").strip()).lower()
+    return _WS_RE.sub(" ", (text or "").strip()).lower()
 
 
 async def fetch_section(
@@ -806,7 +836,7 @@ async def _fetch_chunks_in_page_range(
     page_end: int,
 ) -> list[dict]:
     chunks_result = await db.execute(
-        select(Chunk)
+        select(*_CHUNK_COLUMNS)
         .where(
             and_(
                 Chunk.file_id == file_id,
@@ -817,17 +847,16 @@ async def _fetch_chunks_in_page_range(
         )
         .order_by(Chunk.page.asc(), Chunk.id)
     )
-    chunks = chunks_result.scalars().all()
     return [
         {
-            "chunk_id": str(c.id),
-            "page": c.page,
-            "block_id": c.block_id,
-            "content": c.content,
-            "token_count": c.token_count,
-            "nearby_image_id": c.nearby_image_id,
+            "chunk_id": str(cid),
+            "page": page,
+            "block_id": block_id,
+            "content": content,
+            "token_count": token_count,
+            "nearby_image_id": nearby_image_id,
         }
-        for c in chunks
+        for cid, page, block_id, content, token_count, nearby_image_id in chunks_result.all()
     ]
 
 
@@ -839,7 +868,7 @@ _LAYOUT_CACHE: dict[str, dict] = {}
 async def _load_layout(file_layout_path: str) -> dict:
     """Download + parse the structured layout JSON. Cached by R2 key so a
     burst of visual lookups for the same file doesn't re-download."""
-    import json as _json
+    import orjson
 
     from app.services.storage.r2 import download_file
 
@@ -847,7 +876,7 @@ async def _load_layout(file_layout_path: str) -> dict:
     if cached is not None:
         return cached
     raw = await asyncio.to_thread(download_file, file_layout_path)
-    parsed = _json.loads(raw.decode("utf-8"))
+    parsed = orjson.loads(raw)
     _LAYOUT_CACHE[file_layout_path] = parsed
     return parsed
 
@@ -1196,9 +1225,9 @@ async def _describe_pending_visual(
 
         # Persist the updated layout back to R2 + refresh the in-process cache.
         try:
-            import json as _json
+            import orjson
             await asyncio.to_thread(
-                upload_json, _json.dumps(layout, ensure_ascii=False), layout_path
+                upload_json, orjson.dumps(layout, option=orjson.OPT_NON_STR_KEYS), layout_path
             )
             _LAYOUT_CACHE[layout_path] = layout
         except Exception as exc:
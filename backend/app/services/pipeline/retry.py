@@ -3,7 +3,6 @@
 import asyncio
 import functools
 import logging
-import traceback
 from typing import Any, Callable, Coroutine, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -53,11 +52,14 @@ def with_retry(stage: str):
                     if attempt < MAX_RETRIES:
                         await asyncio.sleep(RETRY_DELAY)
                     else:
+                        # exc_info defers traceback formatting to the handler,
+                        # so nothing is rendered if ERROR is filtered out.
                         logger.error(
-                            "[%s] all %d attempts exhausted. Last error:\n%s",
+                            "[%s] all %d attempts exhausted. Last error: %s",
                             stage,
                             MAX_RETRIES,
-                            traceback.format_exc(),
+                            exc,
+                            exc_info=True,
                         )
             raise PipelineError(stage, last_exc)
         return wrapper  # type: ignore[return-value]
@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace as dc_replace
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Mapping
 
 _MB = 1024 ** 2
 _GB = 1024 ** 3
@@ -46,7 +48,9 @@ class PlanLimits:
     max_file_size_bytes: int  # largest single upload allowed (per-file cap)
 
 
-PLAN_LIMITS: dict[str, PlanLimits] = {
+# Read-only view: every EffectivePlan shares these PlanLimits instances, so the
+# table must never be mutated at runtime (overrides go through apply_override).
+PLAN_LIMITS: Mapping[str, PlanLimits] = MappingProxyType({
     "individual": PlanLimits(
         name="Individual", price_usd=15,
         max_users=1, max_buckets=5, max_documents=100, max_pages=1_800,
@@ -77,7 +81,7 @@ PLAN_LIMITS: dict[str, PlanLimits] = {
         max_storage_bytes=1 * _TB, max_chat_messages=100_000, mcp_rate_per_min=600,
         max_images=1_000_000, max_file_size_bytes=100 * _GB,
     ),
-}
+})
 
 # Trial-expired / cancelled accounts: data readable, every create action blocked.
 LOCKED_LIMITS = PlanLimits(
@@ -88,14 +92,14 @@ LOCKED_LIMITS = PlanLimits(
 )
 
 # Legacy enum values mapped onto current plans ('business' is now Enterprise).
-_LEGACY_PLAN_ALIASES = {"free": "individual", "pro": "individual"}
+_LEGACY_PLAN_ALIASES = MappingProxyType({"free": "individual", "pro": "individual"})
 
 # Fields an admin override may set per Enterprise customer.
-_OVERRIDABLE = {
+_OVERRIDABLE = frozenset({
     "max_users", "max_buckets", "max_documents", "max_pages",
     "max_storage_bytes", "max_chat_messages", "mcp_rate_per_min", "max_images",
     "max_file_size_bytes",
-}
+})
 
 
 @dataclass(frozen=True)
@@ -107,6 +111,10 @@ class EffectivePlan:
     locked: bool
 
 
+# Accounts with no subscription row resolve to this on every quota check.
+_NO_SUBSCRIPTION_PLAN = EffectivePlan(TRIAL_PLAN, PLAN_LIMITS[TRIAL_PLAN], True, None, False)
+
+
 def trial_end_from(start: datetime | None = None) -> datetime:
     """Trial end = start (default now) + TRIAL_DAYS."""
     return (start or datetime.now(timezone.utc)) + timedelta(days=TRIAL_DAYS)
@@ -145,7 +153,7 @@ def resolve_effective_plan(sub, now: datetime | None = None) -> EffectivePlan:
     now = now or datetime.now(timezone.utc)
 
     if sub is None:
-        return EffectivePlan(TRIAL_PLAN, PLAN_LIMITS[TRIAL_PLAN], True, None, False)
+        return _NO_SUBSCRIPTION_PLAN
 
     plan = normalize_plan_key(getattr(sub, "plan", ""))
     has_paid = bool(getattr(sub, "stripe_subscription_id", None))
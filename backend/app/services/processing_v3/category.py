@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import re
+import string
 
 from app.config import settings
 
@@ -25,6 +25,11 @@ logger = logging.getLogger(__name__)
 _MAX_WORDS = 3
 _MAX_CHARS = 40
 
+# Characters _clean trims off either end of the model's reply (the tail also
+# drops trailing punctuation).
+_LEADING_NOISE = "`*_'\"" + string.whitespace
+_TRAILING_NOISE = _LEADING_NOISE + ".,!?:"
+
 _PROMPT = (
     "Classify this document into ONE short category (1-2 words). "
     "Reply with ONLY the category name — no quotes, no punctuation, no extra text.\n\n"
@@ -56,7 +61,7 @@ def _clean(raw: str, filename: str) -> str:
     """Strip punctuation and clamp to 1-2 words / _MAX_CHARS."""
     text = (raw or "").strip()
     # Strip Markdown emphasis, code fences, and surrounding quotes.
-    text = re.sub(r"^[`*_'\"\s]+|[`*_'\"\s.,!?:]+$", "", text)
+    text = text.lstrip(_LEADING_NOISE).rstrip(_TRAILING_NOISE)
     # Take only the first line.
     text = text.splitlines()[0] if text else ""
     if not text:
@@ -2,8 +2,11 @@
 Step 02 — file-type detection. Ported verbatim from Aiveilix-pipline.
 """
 
+import json
 import logging
+import re
 from enum import Enum
+from html import unescape
 
 logger = logging.getLogger(__name__)
 
@@ -126,28 +129,37 @@ def detect_file_type(mime_type: str, filename: str, data: bytes) -> FileType:
     raise ValueError(f"Unsupported file type: mime={mime_type!r} ext={ext!r}")
 
 
+_HTML_SCRIPT_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_INLINE_WS_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+
+_RTF_PAR_RE = re.compile(r"\\par[d]?")
+_RTF_TAB_RE = re.compile(r"\\tab")
+_RTF_HEX_RE = re.compile(r"\\'[0-9a-fA-F]{2}")
+_RTF_CONTROL_RE = re.compile(r"\\[a-zA-Z]+-?\d* ?")
+_RTF_BRACE_RE = re.compile(r"[{}]")
+
+
 def _strip_html(text: str) -> str:
-    import re
-    from html import unescape
     # Drop <script>/<style> blocks entirely (including content)
-    text = re.sub(r"<(script|style)\b[^>]*>.*?</\1>", " ", text, flags=re.IGNORECASE | re.DOTALL)
+    text = _HTML_SCRIPT_RE.sub(" ", text)
     # Remove all remaining tags
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _HTML_TAG_RE.sub(" ", text)
     text = unescape(text)
     # Collapse whitespace
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)
+    text = _INLINE_WS_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
 def _strip_rtf(text: str) -> str:
     """Very basic RTF stripper — removes control words and braces. Good enough for indexing."""
-    import re
-    text = re.sub(r"\\par[d]?", "\n", text)
-    text = re.sub(r"\\tab", "\t", text)
-    text = re.sub(r"\\'[0-9a-fA-F]{2}", "", text)
-    text = re.sub(r"\\[a-zA-Z]+-?\d* ?", "", text)
-    text = re.sub(r"[{}]", "", text)
+    text = _RTF_PAR_RE.sub("\n", text)
+    text = _RTF_TAB_RE.sub("\t", text)
+    text = _RTF_HEX_RE.sub("", text)
+    text = _RTF_CONTROL_RE.sub("", text)
+    text = _RTF_BRACE_RE.sub("", text)
     return text.strip()
 
 
@@ -172,13 +184,11 @@ def preprocess_text_bytes(data: bytes, filename: str) -> bytes:
         cleaned = _strip_rtf(text)
     elif ext == "json":
         try:
-            import json
             cleaned = json.dumps(json.loads(text), indent=2, ensure_ascii=False)
         except Exception:
             cleaned = text  # Malformed JSON — index as-is
     elif ext in ("jsonl", "ndjson"):
         try:
-            import json
             lines = []
             for raw in text.splitlines():
                 raw = raw.strip()
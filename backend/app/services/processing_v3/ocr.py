@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
 import httpx
+import orjson
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from app.config import settings
@@ -65,7 +66,7 @@ class MistralOCRProvider:
             timeout=_OCR_TIMEOUT_SECONDS,
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     async def run(self, image_data: bytes, page_number: int) -> OCRResult:
         b64 = base64.b64encode(image_data).decode()
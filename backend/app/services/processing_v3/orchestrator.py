@@ -32,7 +32,6 @@ An advisory lock prevents duplicate concurrent runs for the same file.
 """
 
 import asyncio
-import json
 import logging
 import traceback
 import uuid
@@ -40,6 +39,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from time import perf_counter
 
+import orjson
 from sqlalchemy import delete, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -302,7 +302,7 @@ async def _run_pipeline(db: AsyncSession, file_id: str, trace: TraceContext) ->
                 raw_ocr_uri = None
                 try:
                     raw_ocr_uri = await storage.upload_ocr_json(
-                        json.dumps(ocr.raw_response).encode(), file_id, rp.page_number,
+                        orjson.dumps(ocr.raw_response, option=orjson.OPT_NON_STR_KEYS), file_id, rp.page_number,
                     )
                 except Exception as exc:
                     logger.warning("[v3] OCR JSON upload failed page=%s: %s", rp.page_number, exc)
@@ -451,7 +451,9 @@ async def _run_pipeline(db: AsyncSession, file_id: str, trace: TraceContext) ->
     export = build_export_json(doc_meta, pages_meta, elements, name_conflicts=name_conflicts)
     layout_key = build_layout_key(file_id)
     try:
-        await asyncio.to_thread(upload_json, json.dumps(export, ensure_ascii=False), layout_key)
+        await asyncio.to_thread(
+            upload_json, orjson.dumps(export, option=orjson.OPT_NON_STR_KEYS), layout_key
+        )
     except Exception as exc:
         raise PipelineStageError("layout_upload", str(exc)) from exc
 
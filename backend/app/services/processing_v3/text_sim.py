@@ -28,8 +28,11 @@ def normalize_text(text: str) -> str:
     """
     if not text:
         return ""
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    # ASCII has no decompositions or combining marks, and most chunks are
+    # ASCII; skip the per-character accent pass for them.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
     text = text.lower()
     text = _PUNCT_RE.sub(" ", text)
     text = _WS_RE.sub(" ", text)
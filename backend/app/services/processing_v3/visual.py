@@ -7,11 +7,10 @@ much cheaper per image.)
 """
 
 import asyncio
-import json
 import logging
-import re
 from typing import Protocol, runtime_checkable
 
+import orjson
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.config import settings
@@ -63,6 +62,42 @@ _FALLBACK = {
 }
 
 
+def _json_object_span(text: str) -> str | None:
+    """Return the first balanced ``{...}`` in *text*, found in one linear scan
+    that ignores braces inside JSON strings. None if there is no complete object."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _parse_visual_reply(raw: str) -> dict:
+    parsed = orjson.loads(_json_object_span(raw) or raw)
+    if not isinstance(parsed, dict):
+        raise ValueError(f"visual model returned non-object JSON: {type(parsed).__name__}")
+    return parsed
+
+
 @runtime_checkable
 class VisualUnderstandingProvider(Protocol):
     async def understand(self, image_data: bytes) -> dict: ...
@@ -95,10 +130,7 @@ class GeminiVisualUnderstandingAdapter:
 
     def _call(self, image_data: bytes) -> dict:
         raw = self._request(image_data)
-        m = re.search(r"\{.*\}", raw, re.DOTALL)
-        parsed = json.loads(m.group() if m else raw)
-        if not isinstance(parsed, dict):
-            raise ValueError(f"visual model returned non-object JSON: {type(parsed).__name__}")
+        parsed = _parse_visual_reply(raw)
         parsed.setdefault("provider", "gemini")
         parsed.setdefault("model", self._model_name)
         return parsed
@@ -160,10 +192,7 @@ class KimiVisualUnderstandingAdapter:
 
         image_url = "data:image/png;base64," + base64.b64encode(image_data).decode("ascii")
         raw = self._request(image_url)
-        m = re.search(r"\{.*\}", raw, re.DOTALL)
-        parsed = json.loads(m.group() if m else raw)
-        if not isinstance(parsed, dict):
-            raise ValueError(f"visual model returned non-object JSON: {type(parsed).__name__}")
+        parsed = _parse_visual_reply(raw)
         parsed.setdefault("provider", "kimi")
         parsed.setdefault("model", self._model_name)
         return parsed
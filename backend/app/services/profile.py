@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import uuid
 from zoneinfo import ZoneInfo
@@ -12,6 +13,7 @@ from app.models.user import OAuthToken, Profile, User
 from app.services.auth import exchange_github_oauth, exchange_google_oauth, get_oauth_authorize_url
 from app.services.notifications import create_notification
 from app.services.storage.r2 import upload_file
+from app.services.team.permissions import invalidate_user_context
 
 MAX_AVATAR_BYTES = 2 * 1024 * 1024
 
@@ -154,13 +156,14 @@ async def change_password(db: AsyncSession, user_id: str, current_password: str,
     user = await _get_user(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
-    if user.password_hash and not verify_password(current_password, user.password_hash):
-        raise HTTPException(status_code=400, detail="Current password is incorrect.")
+    # Cheap validation first: the bcrypt verify below costs a full hash.
     if len(new_password) < 8:
         raise HTTPException(status_code=400, detail="New password must be at least 8 characters.")
+    if user.password_hash and not await asyncio.to_thread(verify_password, current_password, user.password_hash):
+        raise HTTPException(status_code=400, detail="Current password is incorrect.")
 
     is_first_password = not bool(user.password_hash)
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await asyncio.to_thread(hash_password, new_password)
     await create_notification(
         db,
         user_id,
@@ -272,11 +275,15 @@ async def delete_account(db: AsyncSession, user_id: str, password: str) -> dict:
     user = await _get_user(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
-    if user.password_hash and not verify_password(password, user.password_hash):
+    if user.password_hash and not await asyncio.to_thread(verify_password, password, user.password_hash):
         raise HTTPException(status_code=400, detail="Password confirmation failed.")
 
-    await db.delete(user)
+    deleted_id = user.id
+    # One statement; buckets, files, conversations etc. go via ON DELETE CASCADE
+    # instead of the ORM loading and deleting every dependent row.
+    await db.execute(delete(User).where(User.id == deleted_id))
     await db.commit()
+    invalidate_user_context(deleted_id)
     return {"message": "Account deleted successfully."}
 
 
@@ -102,14 +102,18 @@ def build_layout_key(file_id: str) -> str:
 
 # ── object-key safety ────────────────────────────────────────────────────────
 
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f]")
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9._ +()\-]")
+
+
 def safe_object_filename(filename: str) -> str:
     """Sanitize a user-supplied filename for use as the final segment of an R2
     object key. Strips any path components and restricts to a safe charset so a
     crafted name can never escape the ``raw/{file_id}/v{n}/`` prefix."""
     raw = (filename or "").strip().replace("\\", "/")
     base = raw.rsplit("/", 1)[-1]                      # drop any path prefix
-    base = re.sub(r"[\x00-\x1f]", "", base)            # strip control chars
-    base = re.sub(r"[^A-Za-z0-9._ +()\-]", "_", base)  # safe charset only
+    base = _CONTROL_CHARS_RE.sub("", base)             # strip control chars
+    base = _UNSAFE_CHARS_RE.sub("_", base)             # safe charset only
     base = base.strip().strip(".")                     # no leading/trailing dots
     base = base[:200] or "file"
     return base
@@ -8,6 +8,7 @@ with granular boolean flags.
 owner's data to query and which permission set applies.
 """
 
+import time
 import uuid
 from dataclasses import dataclass
 
@@ -28,7 +29,7 @@ PERMISSION_FIELDS = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserContext:
     user_id: uuid.UUID
     email: str
@@ -56,11 +57,38 @@ def parse_active_workspace(x_workspace: str | None, user_id: uuid.UUID) -> uuid.
         return None
 
 
-async def resolve_user_context(
-    db: AsyncSession,
-    user_id: uuid.UUID,
-    active_owner_id: uuid.UUID | None = None,
-) -> UserContext:
+@dataclass(frozen=True, slots=True)
+class _Membership:
+    owner_user_id: uuid.UUID
+    team_member_id: uuid.UUID
+    display_name: str | None
+    display_color: str | None
+
+
+# resolve_user_context runs on every authenticated request, but a user's email
+# and accepted memberships almost never change. Keep a short per-process
+# snapshot (plain values, never ORM rows); every membership mutation in this
+# process calls invalidate_user_context, other instances converge within the TTL.
+_CONTEXT_CACHE: dict[uuid.UUID, tuple[float, str, tuple[_Membership, ...]]] = {}
+_CONTEXT_CACHE_TTL = 30.0  # seconds
+_CONTEXT_CACHE_MAX = 4096
+
+
+def invalidate_user_context(*user_ids: uuid.UUID | None) -> None:
+    """Drop cached identity snapshots, e.g. after a membership change."""
+    for user_id in user_ids:
+        if user_id is not None:
+            _CONTEXT_CACHE.pop(user_id, None)
+
+
+async def _load_identity(
+    db: AsyncSession, user_id: uuid.UUID
+) -> tuple[str, tuple[_Membership, ...]]:
+    now = time.monotonic()
+    cached = _CONTEXT_CACHE.get(user_id)
+    if cached and (now - cached[0]) < _CONTEXT_CACHE_TTL:
+        return cached[1], cached[2]
+
     user_q = await db.execute(select(User).where(User.id == user_id))
     user = user_q.scalar_one_or_none()
     if not user:
@@ -74,10 +102,27 @@ async def resolve_user_context(
             TeamMember.status == "accepted",
         )
     )
-    memberships = list(members_q.scalars().all())
+    memberships = tuple(
+        _Membership(m.owner_user_id, m.id, m.display_name, m.display_color)
+        for m in members_q.scalars().all()
+    )
+
+    if len(_CONTEXT_CACHE) >= _CONTEXT_CACHE_MAX:
+        # Dicts keep insertion order — evict the oldest entry.
+        _CONTEXT_CACHE.pop(next(iter(_CONTEXT_CACHE)), None)
+    _CONTEXT_CACHE[user_id] = (now, user.email, memberships)
+    return user.email, memberships
+
+
+async def resolve_user_context(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    active_owner_id: uuid.UUID | None = None,
+) -> UserContext:
+    email, memberships = await _load_identity(db, user_id)
 
     # Decide which workspace is active for this request.
-    selected: TeamMember | None = None
+    selected: _Membership | None = None
     if active_owner_id is not None and active_owner_id != user_id:
         # Explicit team selection; fall back to a default membership if the id is
         # stale/invalid rather than erroring.
@@ -92,20 +137,20 @@ async def resolve_user_context(
 
     if selected is not None:
         return UserContext(
-            user_id=user.id,
-            email=user.email,
+            user_id=user_id,
+            email=email,
             is_member=True,
             owner_user_id=selected.owner_user_id,
-            team_member_id=selected.id,
+            team_member_id=selected.team_member_id,
             display_name=selected.display_name,
             display_color=selected.display_color,
         )
 
     return UserContext(
-        user_id=user.id,
-        email=user.email,
+        user_id=user_id,
+        email=email,
         is_member=False,
-        owner_user_id=user.id,
+        owner_user_id=user_id,
         team_member_id=None,
     )
 
@@ -160,27 +205,77 @@ async def list_user_workspaces(db: AsyncSession, user_id: uuid.UUID) -> list[dic
     return workspaces
 
 
-async def get_bucket_access(
-    db: AsyncSession, team_member_id: uuid.UUID, bucket_id: uuid.UUID
-) -> TeamBucketAccess | None:
+@dataclass(frozen=True, slots=True)
+class BucketGrant:
+    """Plain snapshot of one TeamBucketAccess row's permission flags."""
+
+    bucket_id: uuid.UUID
+    history_scope: str
+    can_see_other_members: bool
+    can_upload_files: bool
+    can_download_files: bool
+    can_delete_files: bool
+    can_use_mcp: bool
+
+
+# Member bucket checks run on nearly every member request (listing, files,
+# chat), while grants change only when the owner edits them. Cache each
+# member's full grant set like _CONTEXT_CACHE; grant/update/revoke/remove in
+# this process call invalidate_bucket_grants.
+_GRANT_CACHE: dict[uuid.UUID, tuple[float, dict[uuid.UUID, BucketGrant]]] = {}
+_GRANT_CACHE_TTL = 30.0  # seconds
+_GRANT_CACHE_MAX = 4096
+
+
+def invalidate_bucket_grants(*team_member_ids: uuid.UUID | None) -> None:
+    """Drop cached bucket grants, e.g. after an access change."""
+    for team_member_id in team_member_ids:
+        if team_member_id is not None:
+            _GRANT_CACHE.pop(team_member_id, None)
+
+
+async def _load_grants(
+    db: AsyncSession, team_member_id: uuid.UUID
+) -> dict[uuid.UUID, BucketGrant]:
+    now = time.monotonic()
+    cached = _GRANT_CACHE.get(team_member_id)
+    if cached and (now - cached[0]) < _GRANT_CACHE_TTL:
+        return cached[1]
+
     result = await db.execute(
         select(TeamBucketAccess).where(
-            TeamBucketAccess.team_member_id == team_member_id,
-            TeamBucketAccess.bucket_id == bucket_id,
+            TeamBucketAccess.team_member_id == team_member_id
         )
     )
-    return result.scalar_one_or_none()
+    grants = {
+        a.bucket_id: BucketGrant(
+            a.bucket_id,
+            a.history_scope,
+            a.can_see_other_members,
+            a.can_upload_files,
+            a.can_download_files,
+            a.can_delete_files,
+            a.can_use_mcp,
+        )
+        for a in result.scalars().all()
+    }
+
+    if len(_GRANT_CACHE) >= _GRANT_CACHE_MAX:
+        _GRANT_CACHE.pop(next(iter(_GRANT_CACHE)), None)
+    _GRANT_CACHE[team_member_id] = (now, grants)
+    return grants
+
+
+async def get_bucket_access(
+    db: AsyncSession, team_member_id: uuid.UUID, bucket_id: uuid.UUID
+) -> BucketGrant | None:
+    return (await _load_grants(db, team_member_id)).get(bucket_id)
 
 
 async def get_accessible_bucket_ids(
     db: AsyncSession, team_member_id: uuid.UUID
 ) -> list[uuid.UUID]:
-    result = await db.execute(
-        select(TeamBucketAccess.bucket_id).where(
-            TeamBucketAccess.team_member_id == team_member_id
-        )
-    )
-    return [row[0] for row in result.all()]
+    return list(await _load_grants(db, team_member_id))
 
 
 async def check_bucket_permission(
@@ -188,7 +283,7 @@ async def check_bucket_permission(
     ctx: UserContext,
     bucket_id: uuid.UUID,
     permission: str,
-) -> TeamBucketAccess | None:
+) -> BucketGrant | None:
     """Raise 403 if member lacks `permission` on bucket. Owner is always allowed."""
     if not ctx.is_member:
         return None
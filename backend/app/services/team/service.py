@@ -1,3 +1,4 @@
+import asyncio
 import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -18,6 +19,7 @@ from app.schemas.team import (
     TeamMemberUpdateRequest,
 )
 from app.services.email import send_team_invite_email
+from app.services.team.permissions import invalidate_bucket_grants, invalidate_user_context
 
 
 INVITE_TOKEN_TTL_DAYS = 7
@@ -120,7 +122,8 @@ async def invite_member(
 
     owner_name = await _resolve_display_name(db, owner)
     try:
-        send_team_invite_email(
+        await asyncio.to_thread(
+            send_team_invite_email,
             to=member.invite_email,
             display_name=member.display_name or "there",
             owner_name=owner_name,
@@ -167,6 +170,7 @@ async def update_member(
         member.display_color = request.display_color
     await db.commit()
     await db.refresh(member)
+    invalidate_user_context(member.member_user_id)
     return member
 
 
@@ -174,8 +178,11 @@ async def remove_member(
     db: AsyncSession, owner_id: uuid.UUID, member_id: uuid.UUID
 ) -> None:
     member = await get_member(db, owner_id, member_id)
+    member_user_id = member.member_user_id
     await db.delete(member)
     await db.commit()
+    invalidate_user_context(member_user_id)
+    invalidate_bucket_grants(member_id)
 
 
 async def resend_invite(
@@ -194,7 +201,8 @@ async def resend_invite(
 
     owner_name = await _resolve_display_name(db, owner)
     try:
-        send_team_invite_email(
+        await asyncio.to_thread(
+            send_team_invite_email,
             to=member.invite_email,
             display_name=member.display_name or "there",
             owner_name=owner_name,
@@ -253,11 +261,11 @@ async def accept_invite(db: AsyncSession, token: str, password: str) -> dict:
 
     if user:
         if not user.password_hash:
-            user.password_hash = hash_password(password)
+            user.password_hash = await asyncio.to_thread(hash_password, password)
     else:
         user = User(
             email=member_email,
-            password_hash=hash_password(password),
+            password_hash=await asyncio.to_thread(hash_password, password),
             provider="email",
             is_verified=True,
         )
@@ -274,6 +282,7 @@ async def accept_invite(db: AsyncSession, token: str, password: str) -> dict:
     await db.commit()
     await db.refresh(member)
     await db.refresh(user)
+    invalidate_user_context(user.id)
 
     access_token = create_access_token(str(user.id), user.email)
     refresh = create_refresh_token()
@@ -330,6 +339,7 @@ async def grant_bucket_access(
         existing.granted_by_user_id = owner.id
         await db.commit()
         await db.refresh(existing)
+        invalidate_bucket_grants(team_member_id)
         return existing
 
     access = TeamBucketAccess(
@@ -341,6 +351,7 @@ async def grant_bucket_access(
     db.add(access)
     await db.commit()
     await db.refresh(access)
+    invalidate_bucket_grants(team_member_id)
     return access
 
 
@@ -364,6 +375,7 @@ async def update_bucket_access(
     _apply_permissions(access, permissions)
     await db.commit()
     await db.refresh(access)
+    invalidate_bucket_grants(team_member_id)
     return access
 
 
@@ -385,6 +397,7 @@ async def revoke_bucket_access(
         raise HTTPException(status_code=404, detail="Access record not found.")
     await db.delete(access)
     await db.commit()
+    invalidate_bucket_grants(team_member_id)
 
 
 async def _resolve_display_name(db: AsyncSession, user: User) -> str:
@@ -2,9 +2,15 @@ import uvicorn
 from app.config import settings
 
 if __name__ == "__main__":
+    dev = settings.app_env == "development"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=settings.port,
-        reload=settings.app_env == "development",
+        reload=dev,
+        # Outside dev, require the uvicorn[standard] fast paths instead of
+        # silently falling back to the asyncio loop / h11 parser.
+        loop="auto" if dev else "uvloop",
+        http="auto" if dev else "httptools",
+        backlog=2048,
     )
@@ -0,0 +1,46 @@
+"""Tests for picking a conversation's active file from recent citations."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.agent.service import _resolve_active_file
+
+
+def _db(chunk_rows, ready_ids):
+    history = MagicMock()
+    history.all.return_value = [(row,) for row in chunk_rows]
+    ready = MagicMock()
+    ready.scalars.return_value.all.return_value = list(ready_ids)
+    db = AsyncMock()
+    db.execute.side_effect = [history, ready]
+    return db
+
+
+async def test_most_recent_ready_file_wins_with_one_lookup():
+    stale, newer_ready, older_ready = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _db(
+        [
+            [{"kind": "web", "url": "x"}, {"kind": "document", "file_id": str(stale)}],
+            [{"kind": "document", "file_id": str(newer_ready)}, {"kind": "document", "file_id": "bad"}],
+            [{"kind": "document", "file_id": str(older_ready)}],
+        ],
+        ready_ids=[older_ready, newer_ready],
+    )
+
+    active = await _resolve_active_file(
+        db, conversation_id=uuid.uuid4(), bucket_id=uuid.uuid4(), exclude_message_id=uuid.uuid4()
+    )
+
+    assert active == newer_ready
+    assert db.execute.await_count == 2
+
+
+async def test_no_cited_documents_skips_file_lookup():
+    db = _db([None, [{"kind": "web"}]], ready_ids=[])
+
+    active = await _resolve_active_file(
+        db, conversation_id=uuid.uuid4(), bucket_id=uuid.uuid4(), exclude_message_id=uuid.uuid4()
+    )
+
+    assert active is None
+    assert db.execute.await_count == 1
@@ -0,0 +1,76 @@
+"""Tests for the per-bucket file list reused across chat turns."""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.agent import service
+from app.services.agent.service import _load_bucket_files
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    service._BUCKET_FILES_CACHE.clear()
+    yield
+    service._BUCKET_FILES_CACHE.clear()
+
+
+def _signature(count, stamp, processing=0, ready=None, failed=0):
+    res = MagicMock()
+    res.one.return_value = (count, stamp, processing, count if ready is None else ready, failed)
+    return res
+
+
+def _files(*names):
+    res = MagicMock()
+    res.all.return_value = [
+        SimpleNamespace(id=uuid.uuid4(), name=n, status="ready", is_agent_written=None) for n in names
+    ]
+    return res
+
+
+async def test_unchanged_signature_skips_file_query():
+    stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db = AsyncMock()
+    db.execute.side_effect = [_signature(2, stamp), _files("a.pdf", "b.pdf"), _signature(2, stamp)]
+    bucket_id = uuid.uuid4()
+
+    first = await _load_bucket_files(db, bucket_id)
+    second = await _load_bucket_files(db, bucket_id)
+
+    assert db.execute.await_count == 3
+    assert [f.name for f in second] == ["a.pdf", "b.pdf"]
+    assert second == first and second is not first
+
+
+async def test_changed_signature_reloads():
+    db = AsyncMock()
+    db.execute.side_effect = [
+        _signature(1, datetime(2026, 1, 1, tzinfo=timezone.utc)), _files("a.pdf"),
+        _signature(1, datetime(2026, 1, 2, tzinfo=timezone.utc)), _files("a.pdf"),
+    ]
+    bucket_id = uuid.uuid4()
+
+    await _load_bucket_files(db, bucket_id)
+    await _load_bucket_files(db, bucket_id)
+
+    assert db.execute.await_count == 4
+
+
+async def test_status_change_with_same_updated_at_reloads():
+    stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db = AsyncMock()
+    db.execute.side_effect = [
+        _signature(2, stamp, processing=1, ready=1), _files("a.pdf", "b.pdf"),
+        _signature(2, stamp, processing=0, ready=2), _files("a.pdf", "b.pdf"),
+    ]
+    bucket_id = uuid.uuid4()
+
+    await _load_bucket_files(db, bucket_id)
+    await _load_bucket_files(db, bucket_id)
+
+    assert db.execute.await_count == 4
+    assert "FILTER (WHERE files.status" in str(db.execute.await_args_list[0].args[0])
@@ -0,0 +1,56 @@
+"""Tests for GET /buckets paging: the page plus the total across all pages."""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import Response
+
+from app.api.v1.endpoints.buckets import list_buckets_endpoint
+from app.services import dashboard
+
+
+def _rows(n, total):
+    now = datetime.now(timezone.utc)
+    res = MagicMock()
+    res.all.return_value = [
+        SimpleNamespace(
+            id=uuid.uuid4(), name=f"b{i}", description=None, color="#fff", icon="folder",
+            processing_tier="full", updated_at=now, created_at=now, total=total,
+        )
+        for i in range(n)
+    ]
+    return res
+
+
+def _scalar(value):
+    res = MagicMock()
+    res.scalar_one.return_value = value
+    return res
+
+
+async def test_limited_page_reports_full_total_in_header():
+    db = AsyncMock()
+    db.execute.return_value = _rows(2, total=7)
+    ctx = SimpleNamespace(owner_user_id=uuid.uuid4(), is_member=False)
+    response = Response()
+
+    with patch.object(dashboard, "_get_bucket_stats_map", AsyncMock(return_value={})):
+        buckets = await list_buckets_endpoint(response, limit=2, offset=0, db=db, ctx=ctx)
+
+    assert len(buckets) == 2
+    assert response.headers["X-Total-Count"] == "7"
+    stmt = db.execute.await_args.args[0]
+    assert "count(*) OVER ()" in str(stmt)
+    assert db.execute.await_count == 1
+
+
+async def test_offset_past_the_end_counts_separately():
+    db = AsyncMock()
+    db.execute.side_effect = [_rows(0, total=None), _scalar(5)]
+
+    with patch.object(dashboard, "_get_bucket_stats_map", AsyncMock(return_value={})):
+        buckets, total = await dashboard.list_buckets(db, str(uuid.uuid4()), limit=10, offset=20)
+
+    assert buckets == [] and total == 5
@@ -0,0 +1,55 @@
+"""Tests for folding ownership checks into the conversation/message list queries."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.agent import service
+
+
+def _scalars(items):
+    res = MagicMock()
+    res.scalars.return_value.all.return_value = list(items)
+    res.scalar_one_or_none.return_value = items[0] if items else None
+    return res
+
+
+def _ids():
+    return str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+
+
+async def test_messages_with_history_take_one_round_trip():
+    user_id, bucket_id, conversation_id = _ids()
+    db = AsyncMock()
+    db.execute.return_value = _scalars([SimpleNamespace(id=1), SimpleNamespace(id=2)])
+
+    messages = await service.list_conversation_messages(db, user_id, bucket_id, conversation_id)
+
+    assert [m.id for m in messages] == [1, 2]
+    assert db.execute.await_count == 1
+    sql = str(db.execute.await_args.args[0])
+    assert "JOIN conversations" in sql
+    assert "agent_wrote_file_id" not in sql
+
+
+async def test_empty_history_still_404s_for_foreign_conversation():
+    user_id, bucket_id, conversation_id = _ids()
+    db = AsyncMock()
+    db.execute.side_effect = [_scalars([]), _scalars([])]
+
+    with pytest.raises(HTTPException) as exc:
+        await service.list_conversation_messages(db, user_id, bucket_id, conversation_id)
+    assert exc.value.status_code == 404
+
+
+async def test_conversation_list_skips_bucket_check_when_non_empty():
+    user_id, bucket_id, _ = _ids()
+    db = AsyncMock()
+    db.execute.return_value = _scalars([SimpleNamespace(id=1)])
+
+    assert len(await service.list_conversations(db, user_id, bucket_id)) == 1
+    assert db.execute.await_count == 1
+    assert "demo_lead_id" not in str(db.execute.await_args.args[0])
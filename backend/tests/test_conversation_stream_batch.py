@@ -0,0 +1,85 @@
+"""Tests for batching conversation stream writes: SSE events and message lists."""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.v1 import sse
+from app.api.v1.endpoints.conversations import _MESSAGE_LIST_BATCH, _message_list_chunks
+from app.api.v1.sse import sse_batch
+from app.schemas.agent import MessageResponse
+
+DONE = object()
+
+
+def _events(chunk: bytes) -> list[dict]:
+    return [json.loads(frame[len(b"data: "):]) for frame in chunk.split(b"\n\n") if frame]
+
+
+def test_consecutive_tokens_merge_between_other_events():
+    chunk, finished = sse_batch(
+        [
+            {"kind": "token", "text": "Hel"},
+            {"kind": "token", "text": "lo "},
+            {"kind": "step", "event": {"type": "search"}},
+            {"kind": "token", "text": "world"},
+        ],
+        DONE,
+    )
+
+    assert not finished
+    assert _events(chunk) == [
+        {"kind": "token", "text": "Hello "},
+        {"kind": "step", "event": {"type": "search"}},
+        {"kind": "token", "text": "world"},
+    ]
+
+
+def test_done_sentinel_ends_the_batch():
+    chunk, finished = sse_batch([{"kind": "done", "result": {}}, DONE], DONE)
+    assert finished
+    assert _events(chunk) == [{"kind": "done", "result": {}}]
+
+    assert sse_batch([DONE], DONE) == (b"", True)
+
+
+async def test_message_list_chunks_form_one_json_document():
+    conversation_id = uuid.uuid4()
+    messages = [
+        SimpleNamespace(
+            id=uuid.uuid4(), conversation_id=conversation_id, parent_message_id=None,
+            role="user", content=f"message {i}", chunks_used=[], token_count=i,
+            embedding_status="embedded", agent_plan=None, agent_steps=None,
+            sender_team_member_id=None, sender=None, created_at=datetime.now(timezone.utc),
+        )
+        for i in range(_MESSAGE_LIST_BATCH * 2 + 3)
+    ]
+
+    chunks = [c async for c in _message_list_chunks([MessageResponse.model_validate(m) for m in messages])]
+    body = json.loads(b"".join(chunks))
+
+    assert len(chunks) == 5  # header, three batches, footer
+    assert body["total"] == len(messages)
+    assert [m["content"] for m in body["messages"]] == [m.content for m in messages]
+    assert [c async for c in _message_list_chunks([])] == [b'{"total":0,"messages":[', b"]}"]
+
+
+async def test_drain_pings_while_the_agent_is_silent():
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def agent():
+        await asyncio.sleep(0.05)
+        await queue.put({"kind": "token", "text": "hi"})
+        await queue.put(DONE)
+
+    with patch.object(sse, "SSE_PING_INTERVAL", 0.01):
+        task = asyncio.create_task(agent())
+        chunks = [c async for c in sse.drain_sse_queue(queue, DONE)]
+        await task
+
+    assert chunks[0] == sse.SSE_PING
+    assert _events(chunks[-1]) == [{"kind": "token", "text": "hi"}]
+    assert all(c == sse.SSE_PING for c in chunks[:-1])
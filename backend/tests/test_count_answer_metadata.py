@@ -0,0 +1,45 @@
+"""Tests for exact structural counts answered from file metadata."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.agent import service
+from app.services.mcp import tools
+
+
+def _file(name, layout_path):
+    return SimpleNamespace(
+        id=uuid.uuid4(), name=name, layout_json_path=layout_path,
+        page_count=1, image_count=0, section_outline=[],
+    )
+
+
+def _layout(types):
+    return {"pages": [{"page": 1, "elements": [
+        {"source": "visual_understanding", "type": t, "sort_order": i} for i, t in enumerate(types)
+    ]}]}
+
+
+async def test_visual_counts_load_each_layout_without_per_file_queries(monkeypatch):
+    files = [_file("a.pdf", "a.json"), _file("b.pdf", "b.json"), _file("c.txt", None)]
+    layouts = {"a.json": _layout(["image", "text"]), "b.json": _layout(["chart", "text", "text"])}
+    loaded: list[str] = []
+
+    async def _fake_load(path):
+        loaded.append(path)
+        return layouts[path]
+
+    monkeypatch.setattr(tools, "_load_layout", _fake_load)
+    res = MagicMock()
+    res.scalars.return_value.all.return_value = files
+    db = AsyncMock()
+    db.execute.return_value = res
+
+    answer = await service._count_answer_from_metadata(
+        db, uuid.uuid4(), ["text_blocks", "total_visuals"], None
+    )
+
+    assert sorted(loaded) == ["a.json", "b.json"]
+    assert db.execute.await_count == 1
+    assert "Text blocks: 3" in answer and "Total visuals: 5" in answer
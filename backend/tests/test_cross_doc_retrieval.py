@@ -10,6 +10,7 @@ from app.services.agent.retrieval import (
     _category_match_score,
     _has_standalone_image_intent,
     _is_document_like_file,
+    _prioritize_file_summaries,
     search_bucket_documents_with_file_coverage,
 )
 
@@ -377,3 +378,19 @@ async def test_standalone_image_query_fetches_each_image_file():
     image_search.assert_awaited_once()
     standard_search.assert_not_awaited()
     fallback.assert_not_awaited()
+
+
+async def test_file_summaries_lead_each_file_group_in_first_seen_order():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    a1, b1, a2 = _chunk(a, "a.pdf"), _chunk(b, "b.pdf"), _chunk(a, "a.pdf")
+    summary = type("Row", (), {"id": uuid.uuid4(), "content": "A overview"})()
+
+    with patch(
+        "app.services.agent.retrieval._resolve_file_summaries",
+        new=AsyncMock(return_value={a: summary}),
+    ) as resolve:
+        chunks = await _prioritize_file_summaries(None, [a1, b1, a2], limit=10)
+
+    assert resolve.await_args.args[1] == [a, b]
+    assert chunks[0].is_summary and chunks[0].content == "A overview"
+    assert chunks[1:] == [a1, a2, b1]
@@ -0,0 +1,71 @@
+"""Tests for the dashboard stats queries (monthly series, cached counters)."""
+
+import uuid
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import dashboard
+from app.services.dashboard import get_monthly_stats, get_stats, invalidate_dashboard_stats
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    dashboard._STATS_CACHE.clear()
+    yield
+    dashboard._STATS_CACHE.clear()
+
+
+def _rows(*rows):
+    res = MagicMock()
+    res.all.return_value = list(rows)
+    return res
+
+
+def _month(y: int, m: int) -> datetime:
+    return datetime(y, m, 1, tzinfo=timezone.utc)
+
+
+async def test_baseline_is_folded_into_first_month():
+    db = AsyncMock()
+    db.execute.side_effect = [
+        # buckets: 3 older than the window (clamped to Jan), 1 created in Mar
+        _rows((_month(2026, 1), 3), (_month(2026, 3), 1)),
+        # files: 5 older files / 100 bytes, 2 more in Feb
+        _rows((_month(2026, 1), 5, 100), (_month(2026, 2), 2, 50)),
+        _rows((_month(2026, 2), 7)),  # messages
+        _rows(),  # mcp calls
+    ]
+
+    series = await get_monthly_stats(
+        db, str(uuid.uuid4()), start_month=date(2026, 1, 1), end_month=date(2026, 3, 1)
+    )
+
+    assert db.execute.await_count == 4
+    assert [p["buckets"] for p in series] == [3, 3, 4]
+    assert [p["files"] for p in series] == [5, 7, 7]
+    assert [p["messages"] for p in series] == [0, 7, 0]
+    assert series[-1]["month"] == "2026-03-01"
+
+
+def _counters_db() -> AsyncMock:
+    res = MagicMock()
+    res.one.return_value = (2048, 3, 1, 4, 0)
+    db = AsyncMock()
+    db.execute.return_value = res
+    return db
+
+
+async def test_stats_are_cached_until_invalidated():
+    db, user_id = _counters_db(), str(uuid.uuid4())
+
+    first = await get_stats(db, user_id)
+    first["files_count"] = -1  # callers get their own copy
+    second = await get_stats(db, user_id)
+    assert db.execute.await_count == 1
+    assert second["files_count"] == 3 and second["bucket_count"] == 1
+
+    invalidate_dashboard_stats(user_id)
+    await get_stats(db, user_id)
+    assert db.execute.await_count == 2
@@ -567,3 +567,17 @@ class TestMetaCloserDetector:
         # Real answers pass through.
         assert not _is_incomplete_final("No, the full ingredient list is not provided in the document.")
         assert not _is_incomplete_final("1. A is x. 2. B is y. 3. C is z. " * 10)
+
+
+class TestFinalTextStreaming:
+    """The final answer is re-chunked for the UI without losing any text."""
+
+    async def test_chunks_rejoin_to_the_original_text(self, event_capture):
+        from app.services.agent.harness.runner import _stream_final_text
+        text = "The quick brown fox jumps over the lazy dog and keeps on running  through the forest."
+        await _stream_final_text(text, event_capture)
+
+        tokens = [e["text"] for e in event_capture.of_kind("token")]
+        assert event_capture.token_text() == text
+        assert tokens[0] == "The quick brown fox jumps over the "
+        assert all(len(t.rstrip(" ")) >= 32 for t in tokens[:-1])
@@ -122,6 +122,14 @@ class TestSourcePool:
         state.commit_pending_sources()
         assert state.used_doc_sources == [src]
 
+    def test_commit_dedupes_within_one_batch(self):
+        state = AgentState()
+        a = {"kind": "document", "file_id": "f1", "page": 1}
+        b = {"kind": "document", "file_id": "f1", "page": 2}
+        state.pending_doc_sources.extend([a, b, dict(a)])
+        state.commit_pending_sources()
+        assert state.used_doc_sources == [a, b]
+
     def test_reset_clears_pending(self):
         state = AgentState()
         state.pending_doc_sources.append({"file_id": "x"})
@@ -14,8 +14,10 @@ import pytest
 from app.services.agent.harness.contract import TurnInput
 from app.services.agent.harness.state import AgentState
 from app.services.agent.harness.tools import (
+    _resolve_file_uuid,
     _t_ask_user,
     _t_make_plan,
+    _t_read_all_chunks,
     _t_search_web,
     _t_update_plan,
     build_registry,
@@ -24,6 +26,33 @@ from app.services.agent.harness.tools import (
 from tests.conftest import fake_file, make_turn
 
 
+# ─────────────────────────────────────────────────────── file resolution ──
+
+class TestResolveFileUuid:
+    def test_matches_id_name_and_stem_case_insensitively(self):
+        report, notes = fake_file("Q3 Report.final.pdf"), fake_file("notes.md")
+        turn = make_turn(bucket_files=[report, notes])
+
+        assert _resolve_file_uuid(str(notes.file_id), turn) == notes.file_id
+        assert _resolve_file_uuid("q3 report.final.pdf", turn) == report.file_id
+        assert _resolve_file_uuid("  Q3 REPORT ", turn) == report.file_id
+        assert _resolve_file_uuid("NOTES", turn) == notes.file_id
+        assert _resolve_file_uuid("missing.pdf", turn) is None
+
+    def test_out_of_scope_id_is_not_resolved(self):
+        turn = make_turn(bucket_files=[fake_file("a.pdf")])
+        assert _resolve_file_uuid(str(uuid.uuid4()), turn) is None
+
+    def test_first_file_claiming_a_name_wins_and_index_is_reused(self):
+        first, second = fake_file("report.pdf"), fake_file("report")
+        turn = make_turn(bucket_files=[first, second])
+
+        assert _resolve_file_uuid("report", turn) == first.file_id
+        index = turn.file_index
+        _resolve_file_uuid("report.pdf", turn)
+        assert turn.file_index is index
+
+
 # ─────────────────────────────────────────────────────────────── ask_user ──
 
 class TestAskUserTool:
@@ -156,6 +185,42 @@ class TestSearchWebTool:
         assert result.pending_web[0]["url"] == "https://btc.example/x"
 
 
+# ─────────────────────────────────────────────────────── read_all_chunks ──
+
+class TestReadAllChunksTool:
+    async def test_requests_only_the_current_batch(self):
+        f = fake_file("report.pdf")
+        turn = make_turn(bucket_files=[f])
+        payload = {
+            "file_name": "report.pdf",
+            "total_chunks": 85,
+            "chunks": [{"page": 3, "content": "batch two"}] * 40,
+        }
+        with patch(
+            "app.services.agent.harness.tools.bucket_data.fetch_chunks_list",
+            AsyncMock(return_value=payload),
+        ) as fetch:
+            result = await _t_read_all_chunks(AgentState(), turn, MagicMock(), {"offset": 40})
+
+        assert fetch.await_args.kwargs == {"offset": 40, "limit": 40}
+        assert "[chunk 41/85] p.3" in result.summary
+        assert "call read_all_chunks again with offset=80" in result.summary
+
+    async def test_offset_past_the_end_reports_total(self):
+        f = fake_file("report.pdf")
+        payload = {"file_name": "report.pdf", "total_chunks": 12, "chunks": []}
+        with patch(
+            "app.services.agent.harness.tools.bucket_data.fetch_chunks_list",
+            AsyncMock(return_value=payload),
+        ):
+            result = await _t_read_all_chunks(
+                AgentState(), make_turn(bucket_files=[f]), MagicMock(), {"offset": 40},
+            )
+
+        assert result.success is False
+        assert "12 chunks total" in result.summary
+
+
 # ──────────────────────────────────────────────────── registry shape ──
 
 class TestRegistryShape:
@@ -1,16 +1,14 @@
 from __future__ import annotations
 
 import logging
-import sys
-from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.http_logging import install_http_logging
+from app.logging_config import request_id_var
 
 
 def _build_app() -> FastAPI:
@@ -21,6 +19,10 @@ def _build_app() -> FastAPI:
     async def ok():
         return {"ok": True}
 
+    @app.get("/rid")
+    async def rid():
+        return {"rid": request_id_var.get()}
+
     @app.get("/boom")
     async def boom():
         raise RuntimeError("kaboom")
@@ -86,3 +88,57 @@ def test_unhandled_exception_logs_and_returns_request_id(caplog):
     assert response.headers["X-Request-ID"] == response.json()["request_id"]
     assert "unhandled rid=" in caplog.text
     assert "[HTTP] GET /boom -> 500" in caplog.text
+
+
+def test_filtered_level_skips_access_log(caplog):
+    app = _build_app()
+
+    with TestClient(app) as client, caplog.at_level(logging.WARNING, logger="app.http"):
+        response = client.get("/ok")
+
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"]
+    assert "[HTTP] GET /ok" not in caplog.text
+
+
+def test_cors_preflight_bypasses_access_log(caplog):
+    # Same order as app.main: CORS first, so the logging middleware wraps it.
+    app = FastAPI()
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    install_http_logging(app)
+
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+
+    with TestClient(app) as client, caplog.at_level(logging.INFO, logger="app.http"):
+        response = client.options(
+            "/ok",
+            headers={
+                "origin": "http://localhost:5173",
+                "access-control-request-method": "GET",
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert "X-Request-ID" not in response.headers
+    assert "[HTTP] OPTIONS" not in caplog.text
+
+
+def test_request_id_is_visible_to_handlers():
+    app = _build_app()
+
+    with TestClient(app) as client:
+        response = client.get("/rid", headers={"x-request-id": "req-42"})
+        forbidden = client.get("/forbidden")
+
+    assert response.json() == {"rid": "req-42"}
+    assert response.headers["X-Request-ID"] == "req-42"
+    assert forbidden.headers["X-Request-ID"]
+    assert request_id_var.get() is None
@@ -0,0 +1,41 @@
+import json
+import logging
+import sys
+
+from app.logging_config import _JsonFormatter, request_id_var
+
+
+def _record(msg: str, *args, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("app.test", logging.WARNING, __file__, 1, msg, args, exc_info)
+
+
+def test_json_formatter_emits_one_object_per_line():
+    line = _JsonFormatter().format(_record("[HTTP] %s -> %d", "GET /ok", 200))
+
+    entry = json.loads(line)
+    assert "\n" not in line
+    assert entry["severity"] == "WARNING"
+    assert entry["logger"] == "app.test"
+    assert entry["message"] == "[HTTP] GET /ok -> 200"
+    assert entry["time"].endswith("+00:00")
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise RuntimeError("kaboom")
+    except RuntimeError:
+        line = _JsonFormatter().format(_record("failed", exc_info=sys.exc_info()))
+
+    entry = json.loads(line)
+    assert "RuntimeError: kaboom" in entry["exception"]
+
+
+def test_json_formatter_tags_current_request_id():
+    token = request_id_var.set("abc123")
+    try:
+        entry = json.loads(_JsonFormatter().format(_record("inside a request")))
+    finally:
+        request_id_var.reset(token)
+
+    assert entry["request_id"] == "abc123"
+    assert "request_id" not in json.loads(_JsonFormatter().format(_record("outside")))
@@ -0,0 +1,146 @@
+"""Tests for the batched MCP access-log writer."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.mcp import access_log
+
+
+def _request():
+    return SimpleNamespace(headers={"x-forwarded-for": "10.0.0.1, 10.0.0.2"}, client=None)
+
+
+def _token():
+    return SimpleNamespace(id=uuid.uuid4(), bucket_id=uuid.uuid4())
+
+
+@pytest.fixture
+def db():
+    session = AsyncMock()
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    with patch.object(access_log, "db_session", factory):
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def _reset_buffer():
+    access_log._pending_rows.clear()
+    access_log._touched_tokens.clear()
+    access_log._flush_scheduled = False
+    access_log._flush_now.clear()
+    yield
+    for task in access_log._flush_tasks:
+        task.cancel()
+    access_log._pending_rows.clear()
+    access_log._touched_tokens.clear()
+    access_log._flush_scheduled = False
+    access_log._flush_now.clear()
+
+
+def _log(token, tool="search"):
+    access_log.log_bucket_call(
+        token=token, tool=tool, status="success", status_code=200,
+        duration_ms=12, request=_request(),
+    )
+
+
+async def test_calls_within_interval_share_one_write(db):
+    token = _token()
+    with patch.object(access_log, "_FLUSH_INTERVAL", 0.01):
+        _log(token, "search")
+        _log(token, "get_file")
+        await asyncio.gather(*access_log._flush_tasks)
+
+    insert_call, update_call = db.execute.await_args_list
+    rows = insert_call.args[1]
+    assert [r["tool"] for r in rows] == ["search", "get_file"]
+    assert rows[0]["ip_address"] == "10.0.0.1"
+    assert rows[0]["token_id"] == token.id
+    db.commit.assert_awaited_once()
+    assert not access_log._pending_rows
+
+
+async def test_full_buffer_flushes_without_waiting(db):
+    with patch.object(access_log, "_FLUSH_MAX_ROWS", 2), \
+            patch.object(access_log, "_FLUSH_INTERVAL", 60):
+        _log(_token())
+        _log(_token())
+        assert len(access_log._flush_tasks) == 1
+        await asyncio.wait_for(asyncio.gather(*access_log._flush_tasks), 1)
+
+    assert len(db.execute.await_args_list[0].args[1]) == 2
+    assert not access_log._flush_scheduled
+
+
+async def test_drain_writes_rows_left_at_shutdown(db):
+    with patch.object(access_log, "_FLUSH_INTERVAL", 60):
+        _log(_token())
+        await asyncio.wait_for(access_log.drain_access_logs(), 1)
+
+    assert len(db.execute.await_args_list[0].args[1]) == 1
+    assert not access_log._pending_rows and not access_log._flush_tasks
+
+
+async def test_empty_buffer_skips_the_database(db):
+    await access_log.flush_access_logs()
+    db.execute.assert_not_awaited()
+
+
+async def test_oversized_headers_are_truncated_to_column_widths():
+    request = SimpleNamespace(
+        headers={"referer": "https://x.test/" + "a" * 400, "x-forwarded-for": "9" * 200},
+        client=None,
+    )
+    with patch.object(access_log, "_FLUSH_INTERVAL", 60):
+        access_log.log_bucket_call(
+            token=_token(), tool="search", status="success", status_code=200,
+            duration_ms=1, request=request,
+        )
+    row = access_log._pending_rows[0]
+    assert len(row["origin"]) == access_log._ORIGIN_MAX
+    assert len(row["ip_address"]) == access_log._IP_MAX
+
+
+async def test_failed_batch_retries_rows_individually(db):
+    good, bad = _token(), _token()
+    with patch.object(access_log, "_FLUSH_INTERVAL", 60):
+        _log(good, "search")
+        _log(bad, "get_file")
+        _log(good, "list_files")
+
+    async def execute(stmt, rows=None):
+        # The whole batch and the bad token's own row are rejected.
+        if rows is not None and any(r["token_id"] == bad.id for r in rows):
+            raise IntegrityError("INSERT", {}, Exception("fk violation"))
+
+    db.execute.side_effect = execute
+    await access_log.flush_access_logs()
+
+    inserted = [
+        c.args[1][0]["tool"] for c in db.execute.await_args_list
+        if len(c.args) > 1 and len(c.args[1]) == 1
+    ]
+    assert inserted == ["search", "get_file", "list_files"]
+    assert db.commit.await_count == 2  # the two good rows
+
+
+async def test_unreachable_database_drops_batch_without_per_row_retries(db):
+    with patch.object(access_log, "_FLUSH_INTERVAL", 60):
+        _log(_token())
+        _log(_token())
+    db.execute.side_effect = OSError("connection refused")
+
+    await access_log.flush_access_logs()
+
+    assert db.execute.await_count == 1
+    assert not access_log._pending_rows
@@ -0,0 +1,83 @@
+"""Tests for the short-lived account-MCP bucket listing cache."""
+
+import datetime
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.mcp import account_tools
+from app.services.mcp.account_tools import acct_list_buckets, invalidate_bucket_listing
+
+
+def _db() -> AsyncMock:
+    res = MagicMock()
+    res.scalars.return_value.all.return_value = []
+    db = AsyncMock()
+    db.execute.return_value = res
+    return db
+
+
+def _token(user_id: uuid.UUID, mode: str = "all", allowed=None):
+    return SimpleNamespace(user_id=user_id, bucket_mode=mode, allowed_bucket_ids=allowed)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    account_tools._LIST_CACHE.clear()
+    yield
+    account_tools._LIST_CACHE.clear()
+
+
+async def test_repeat_listing_hits_cache():
+    db, user_id = _db(), uuid.uuid4()
+
+    first = await acct_list_buckets(db, _token(user_id))
+    second = await acct_list_buckets(db, _token(user_id))
+
+    assert db.execute.await_count == 1
+    assert first == second == {"buckets": [], "total": 0}
+
+
+async def test_scope_is_part_of_the_key():
+    db, user_id = _db(), uuid.uuid4()
+
+    await acct_list_buckets(db, _token(user_id))
+    await acct_list_buckets(db, _token(user_id, "selected", [uuid.uuid4()]))
+
+    assert db.execute.await_count == 2
+
+
+async def test_invalidate_forces_reload():
+    db, user_id = _db(), uuid.uuid4()
+
+    await acct_list_buckets(db, _token(user_id))
+    invalidate_bucket_listing(user_id)
+    await acct_list_buckets(db, _token(user_id))
+
+    assert db.execute.await_count == 2
+
+
+async def test_listing_batches_stats_and_token_lookups():
+    user_id = uuid.uuid4()
+    b1, b2 = uuid.uuid4(), uuid.uuid4()
+    now = datetime.datetime(2026, 1, 1)
+    buckets = [
+        SimpleNamespace(id=b1, name="one", description=None, color="#fff", created_at=now),
+        SimpleNamespace(id=b2, name="two", description="d", color="#000", created_at=now),
+    ]
+    bucket_res, stats_res, token_res = MagicMock(), MagicMock(), MagicMock()
+    bucket_res.scalars.return_value.all.return_value = buckets
+    stats_res.all.return_value = [(b1, 3, 1024)]
+    token_res.all.return_value = [(b2, "oldest"), (b2, "newer")]
+    db = AsyncMock()
+    db.execute.side_effect = [bucket_res, stats_res, token_res]
+
+    result = await acct_list_buckets(db, _token(user_id))
+
+    assert db.execute.await_count == 3
+    one, two = result["buckets"]
+    assert (one["files_count"], one["storage_used"], one["mcp_url"]) == (3, 1024, None)
+    assert (two["files_count"], two["storage_used"]) == (0, 0)
+    assert two["mcp_url"].endswith("/v1/mcp/bucket/oldest")
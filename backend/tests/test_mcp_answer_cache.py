@@ -0,0 +1,100 @@
+"""Tests for the MCP query tool's semantic answer cache."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.agent.retrieval import QueryEmbedding
+from app.services.mcp import answer_cache
+from app.services.mcp.answer_cache import answer_bucket_question
+
+_VECTORS = {
+    "what does X do?": [1.0, 0.0, 0.0],
+    "What does X do": [0.99, 0.05, 0.0],
+    "who wrote Y?": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture(autouse=True)
+def _patched(monkeypatch):
+    answer_cache._ANSWER_CACHE.clear()
+    monkeypatch.setattr(answer_cache, "_bucket_processing_tier", AsyncMock(return_value="full"))
+    monkeypatch.setattr(
+        answer_cache,
+        "_embed_query_text",
+        AsyncMock(side_effect=lambda q, lite=False: QueryEmbedding(dense=_VECTORS[q])),
+    )
+    answer = AsyncMock(side_effect=lambda db, **kw: SimpleNamespace(
+        answer=f"answer to {kw['question']}", sources=[], used_web_search=False,
+    ))
+    monkeypatch.setattr(answer_cache, "answer_bucket_query", answer)
+    yield answer
+    answer_cache._ANSWER_CACHE.clear()
+
+
+async def _ask(question, user_id, bucket_id):
+    return await answer_bucket_question(
+        AsyncMock(), user_id=user_id, bucket_id=bucket_id, question=question
+    )
+
+
+async def test_near_duplicate_question_reuses_answer(_patched):
+    user_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+
+    first = await _ask("what does X do?", user_id, bucket_id)
+    second = await _ask("What does X do", user_id, bucket_id)
+
+    assert _patched.await_count == 1
+    assert second == first
+
+
+async def test_different_question_misses(_patched):
+    user_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+
+    await _ask("what does X do?", user_id, bucket_id)
+    other = await _ask("who wrote Y?", user_id, bucket_id)
+
+    assert _patched.await_count == 2
+    assert other["answer"] == "answer to who wrote Y?"
+
+
+async def test_cache_is_scoped_per_user(_patched):
+    bucket_id = uuid.uuid4()
+
+    await _ask("what does X do?", uuid.uuid4(), bucket_id)
+    await _ask("what does X do?", uuid.uuid4(), bucket_id)
+
+    assert _patched.await_count == 2
+
+
+async def test_fresh_flag_and_nocache_marker_bypass_lookup_and_store(_patched, monkeypatch):
+    user_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+    await _ask("what does X do?", user_id, bucket_id)
+    embed = AsyncMock()
+    monkeypatch.setattr(answer_cache, "_embed_query_text", embed)
+
+    fresh = await answer_bucket_question(
+        AsyncMock(), user_id=user_id, bucket_id=bucket_id, question="What does X do", fresh=True
+    )
+    marked = await _ask("what does the nocache header do?", user_id, bucket_id)
+
+    assert _patched.await_count == 3
+    assert fresh["answer"] == "answer to What does X do"
+    # The question is answered as asked, marker included.
+    assert marked["answer"] == "answer to what does the nocache header do?"
+    embed.assert_not_awaited()
+    assert len(answer_cache._ANSWER_CACHE[(user_id, bucket_id)]) == 1
+
+
+async def test_hit_returns_a_copy_of_the_cached_answer(_patched):
+    user_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+
+    first = await _ask("what does X do?", user_id, bucket_id)
+    first["answer"] = "mutated"
+    first["sources"].append({"kind": "web"})
+    second = await _ask("What does X do", user_id, bucket_id)
+
+    assert second["answer"] == "answer to what does X do?"
+    assert second["sources"] == []
@@ -0,0 +1,35 @@
+"""Tests for fetch_file_layout's chunk linking on the layout-JSON path."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.mcp.tools import fetch_file_layout
+
+
+def _result(*, one=None, rows=()):
+    res = MagicMock()
+    res.one_or_none.return_value = one
+    res.all.return_value = list(rows)
+    return res
+
+
+async def test_layout_path_links_chunks_without_loading_content():
+    file_id, chunk_id = uuid.uuid4(), uuid.uuid4()
+    file_row = SimpleNamespace(id=file_id, name="deck.pdf", page_count=1, layout_json_path="layouts/deck.json")
+    chunk_row = SimpleNamespace(id=chunk_id, block_id="b1", token_count=12, nearby_image_id=None)
+    db = AsyncMock()
+    db.execute.side_effect = [_result(one=file_row), _result(rows=[chunk_row])]
+    layout = {"pages": [{"page": 1, "elements": [
+        {"id": "b1", "type": "paragraph", "source": "native_text", "sort_order": 0, "content": "Hello"},
+    ]}]}
+
+    with patch("app.services.mcp.tools._load_layout", AsyncMock(return_value=layout)):
+        result = await fetch_file_layout(db, uuid.uuid4(), file_id)
+
+    chunk_stmt = db.execute.await_args_list[1].args[0]
+    assert "content" not in [c.name for c in chunk_stmt.selected_columns]
+    block = result["pages"][0]["blocks"][0]
+    assert block["content"] == "Hello"
+    assert block["chunk_id"] == str(chunk_id)
+    assert block["token_count"] == 12
@@ -0,0 +1,98 @@
+"""Tests for the MCP JSON-RPC message handler (protocol-level methods only)."""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints.mcp_server import (
+    DEFAULT_PROTOCOL,
+    _handle_message,
+    _process_request,
+    _tool_ok,
+    router,
+)
+
+
+async def _send(msg: dict, kind: str = "bucket") -> dict | None:
+    return await _handle_message(
+        msg,
+        db=AsyncMock(),
+        request=None,
+        kind=kind,
+        tool_defs=[],
+        tools={},
+        allowed=None,
+        bucket_token=None,
+    )
+
+
+async def test_initialize_echoes_supported_protocol():
+    resp = await _send({
+        "jsonrpc": "2.0", "id": 1, "method": "initialize",
+        "params": {"protocolVersion": "2025-03-26"},
+    })
+    assert resp["id"] == 1
+    assert resp["result"]["protocolVersion"] == "2025-03-26"
+    assert resp["result"]["serverInfo"]["name"] == "AIveilix MCP"
+    assert "(bucket scope)" in resp["result"]["instructions"]
+
+
+async def test_initialize_falls_back_to_default_protocol():
+    resp = await _send(
+        {"jsonrpc": "2.0", "id": "a", "method": "initialize", "params": {"protocolVersion": "1999-01-01"}},
+        kind="account",
+    )
+    assert resp["result"]["protocolVersion"] == DEFAULT_PROTOCOL
+    assert "(account scope)" in resp["result"]["instructions"]
+
+
+async def test_notification_gets_no_response():
+    assert await _send({"jsonrpc": "2.0", "method": "notifications/initialized"}) is None
+    assert await _send({"jsonrpc": "2.0", "method": "initialized"}) is None
+    assert await _send({"jsonrpc": "2.0", "method": "notifications/cancelled"}) is None
+
+
+async def test_unknown_method_is_reported():
+    resp = await _send({"jsonrpc": "2.0", "id": 7, "method": "resources/list"})
+    assert resp["error"]["code"] == -32601
+
+
+def test_get_is_refused_with_static_body():
+    app = FastAPI()
+    app.include_router(router)
+    resp = TestClient(app).get("/mcp/bucket/anything")
+
+    assert resp.status_code == 405
+    assert resp.headers["allow"] == "POST"
+    assert resp.json()["error"]["code"] == -32000
+
+
+def test_tool_ok_text_matches_structured_content():
+    fid = uuid.uuid4()
+    result = _tool_ok({
+        "file_id": fid,
+        "size": Decimal("12"),
+        "created_at": datetime.date(2026, 1, 2),
+    })
+
+    assert result["structuredContent"] == {"file_id": str(fid), "size": 12, "created_at": "2026-01-02"}
+    assert json.loads(result["content"][0]["text"]) == result["structuredContent"]
+    assert _tool_ok([1, 2])["structuredContent"] == {"value": [1, 2]}
+
+
+async def test_invalid_json_body_gets_parse_error():
+    request = AsyncMock()
+    request.body.return_value = b"{not json"
+    resp = await _process_request(
+        request, kind="bucket", tool_defs=[], tools={}, allowed=None,
+        bucket_token=None, db=AsyncMock(),
+    )
+
+    assert resp.status_code == 400
+    assert resp.media_type == "application/json"
+    assert json.loads(resp.body)["error"]["code"] == -32700
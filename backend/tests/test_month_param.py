@@ -0,0 +1,21 @@
+"""Tests for the YYYY-MM query parameter parser on the monthly stats endpoint."""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.users import _parse_month
+
+
+def test_padded_and_unpadded_months_parse():
+    assert _parse_month("2026-01", "start_month") == date(2026, 1, 1)
+    assert _parse_month("2026-1", "start_month") == date(2026, 1, 1)
+    assert _parse_month(None, "start_month") is None
+
+
+@pytest.mark.parametrize("value", ["2026-13", "2026", "2026-01-05", "abcd-01", "2026-"])
+def test_invalid_months_are_400(value):
+    with pytest.raises(HTTPException) as exc:
+        _parse_month(value, "start_month")
+    assert exc.value.status_code == 400
@@ -0,0 +1,49 @@
+"""Tests for the query-embedding LRU cache in agent retrieval."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.agent import retrieval
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    retrieval._QUERY_EMBED_CACHE.clear()
+    yield
+    retrieval._QUERY_EMBED_CACHE.clear()
+
+
+@pytest.fixture
+def embed(monkeypatch):
+    mock = AsyncMock(return_value=[0.5, 0.25])
+    monkeypatch.setattr(retrieval, "_voyage_embed_query", mock)
+    return mock
+
+
+async def test_whitespace_variants_share_an_entry(embed):
+    first = await retrieval._embed_query_text("what does  X do?")
+    second = await retrieval._embed_query_text("  what does X\ndo? ")
+
+    assert embed.await_count == 1
+    embed.assert_awaited_once_with("what does X do?", lite=False)
+    assert first is second
+
+
+async def test_lite_and_standard_are_cached_separately(embed):
+    await retrieval._embed_query_text("query")
+    await retrieval._embed_query_text("query", lite=True)
+
+    assert embed.await_count == 2
+
+
+async def test_eviction_drops_least_recently_used(embed, monkeypatch):
+    monkeypatch.setattr(retrieval, "_QUERY_EMBED_CACHE_MAX", 2)
+
+    await retrieval._embed_query_text("a")
+    await retrieval._embed_query_text("b")
+    await retrieval._embed_query_text("a")  # refresh "a"
+    await retrieval._embed_query_text("c")  # evicts "b"
+
+    assert ("a", False) in retrieval._QUERY_EMBED_CACHE
+    assert ("b", False) not in retrieval._QUERY_EMBED_CACHE
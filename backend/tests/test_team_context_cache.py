@@ -0,0 +1,115 @@
+"""Tests for the per-process identity and bucket-grant snapshot caches."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.team import permissions
+from app.services.team.permissions import (
+    get_accessible_bucket_ids,
+    get_bucket_access,
+    invalidate_bucket_grants,
+    invalidate_user_context,
+    resolve_user_context,
+)
+
+
+def _result(*, one=None, many=()):
+    res = MagicMock()
+    res.scalar_one_or_none.return_value = one
+    res.scalars.return_value.all.return_value = list(many)
+    return res
+
+
+def _db(user_id: uuid.UUID, owner_id: uuid.UUID, member_id: uuid.UUID) -> AsyncMock:
+    user = SimpleNamespace(id=user_id, email="member@example.com")
+    member = SimpleNamespace(
+        owner_user_id=owner_id, id=member_id, display_name="Sam", display_color="#10B981"
+    )
+    db = AsyncMock()
+    db.execute.side_effect = lambda *_a, **_k: (
+        _result(one=user) if db.execute.await_count % 2 == 1 else _result(many=[member])
+    )
+    return db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    permissions._CONTEXT_CACHE.clear()
+    permissions._GRANT_CACHE.clear()
+    yield
+    permissions._CONTEXT_CACHE.clear()
+    permissions._GRANT_CACHE.clear()
+
+
+async def test_second_resolve_hits_cache():
+    user_id, owner_id, member_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _db(user_id, owner_id, member_id)
+
+    first = await resolve_user_context(db, user_id)
+    second = await resolve_user_context(db, user_id)
+
+    assert db.execute.await_count == 2  # user + memberships, once
+    assert first == second
+    assert second.is_member and second.owner_user_id == owner_id
+    assert second.team_member_id == member_id
+
+
+async def test_self_mode_uses_cached_snapshot():
+    user_id, owner_id, member_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _db(user_id, owner_id, member_id)
+
+    await resolve_user_context(db, user_id)
+    own = await resolve_user_context(db, user_id, active_owner_id=user_id)
+
+    assert db.execute.await_count == 2
+    assert not own.is_member and own.owner_user_id == user_id
+
+
+async def test_invalidate_forces_reload():
+    user_id, owner_id, member_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _db(user_id, owner_id, member_id)
+
+    await resolve_user_context(db, user_id)
+    invalidate_user_context(user_id, None)
+    await resolve_user_context(db, user_id)
+
+    assert db.execute.await_count == 4
+
+
+def _grant_db(bucket_id: uuid.UUID) -> AsyncMock:
+    row = SimpleNamespace(
+        bucket_id=bucket_id, history_scope="all", can_see_other_members=False,
+        can_upload_files=True, can_download_files=True, can_delete_files=False,
+        can_use_mcp=False,
+    )
+    db = AsyncMock()
+    db.execute.side_effect = lambda *_a, **_k: _result(many=[row])
+    return db
+
+
+async def test_bucket_grants_load_once_per_member():
+    member_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+    db = _grant_db(bucket_id)
+
+    assert await get_accessible_bucket_ids(db, member_id) == [bucket_id]
+    access = await get_bucket_access(db, member_id, bucket_id)
+    missing = await get_bucket_access(db, member_id, uuid.uuid4())
+
+    assert db.execute.await_count == 1
+    assert access.can_upload_files and not access.can_delete_files
+    assert access.history_scope == "all"
+    assert missing is None
+
+
+async def test_invalidate_bucket_grants_forces_reload():
+    member_id, bucket_id = uuid.uuid4(), uuid.uuid4()
+    db = _grant_db(bucket_id)
+
+    await get_bucket_access(db, member_id, bucket_id)
+    invalidate_bucket_grants(member_id)
+    await get_bucket_access(db, member_id, bucket_id)
+
+    assert db.execute.await_count == 2
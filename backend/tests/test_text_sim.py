@@ -0,0 +1,29 @@
+"""Tests for the canonical text form used by dedup and reranking."""
+
+import unicodedata
+
+from app.services.processing_v3 import text_sim
+from app.services.processing_v3.text_sim import normalize_text
+
+
+def _normalize_via_nfkd(text: str) -> str:
+    """normalize_text without the ASCII shortcut: always runs the accent pass."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return text_sim._WS_RE.sub(" ", text_sim._PUNCT_RE.sub(" ", text)).strip()
+
+
+def test_ascii_is_lowered_and_depunctuated():
+    text = "  Revenue, Q3 -  GREW!\n12% "
+    assert text.isascii()
+    assert normalize_text(text) == "revenue q3 grew 12"
+    assert normalize_text(text) == _normalize_via_nfkd(text)
+
+
+def test_non_ascii_punctuation_matches_ascii_form():
+    assert normalize_text("Revenue, Q3 — GREW!") == normalize_text("Revenue, Q3 - GREW!")
+
+
+def test_accents_are_stripped():
+    assert normalize_text("Café Résumé") == "cafe resume"
+    assert normalize_text("ﬁnal") == "final"  # NFKD expands the ligature
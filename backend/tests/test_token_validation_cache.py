@@ -0,0 +1,72 @@
+"""Tests for the get_current_user fast path (token cache, presence throttle)."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1 import deps
+from app.api.v1.deps import forget_token, get_current_user
+from app.core.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    deps._TOKEN_CACHE.clear()
+    deps._SEEN_LOCAL.clear()
+    yield
+    deps._TOKEN_CACHE.clear()
+    deps._SEEN_LOCAL.clear()
+
+
+@pytest.fixture
+def valkey():
+    v = AsyncMock()
+    v.get.return_value = None
+    with patch.object(deps, "get_valkey", return_value=v), \
+            patch.object(deps, "_touch_last_seen", AsyncMock()):
+        yield v
+
+
+def _creds(token: str) -> SimpleNamespace:
+    return SimpleNamespace(credentials=token)
+
+
+async def test_repeat_request_skips_blacklist_lookup(valkey):
+    token = create_access_token("00000000-0000-0000-0000-000000000001", "a@example.com")
+
+    first = await get_current_user(_creds(token))
+    second = await get_current_user(_creds(token))
+
+    assert first == second
+    assert valkey.get.await_count == 1
+
+
+async def test_forget_token_forces_revalidation(valkey):
+    token = create_access_token("00000000-0000-0000-0000-000000000001", "a@example.com")
+    payload = await get_current_user(_creds(token))
+
+    forget_token(payload["jti"])
+    valkey.get.return_value = "1"
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user(_creds(token))
+    assert exc.value.status_code == 401
+
+
+async def test_invalid_token_is_not_cached(valkey):
+    with pytest.raises(HTTPException):
+        await get_current_user(_creds("not-a-jwt"))
+    assert not deps._TOKEN_CACHE
+
+
+async def test_presence_heartbeat_is_throttled_in_process():
+    v = AsyncMock()
+    v.set.return_value = None  # another worker already claimed the window
+    with patch.object(deps, "get_valkey", return_value=v), \
+            patch.object(deps, "db_session") as db_session:
+        await deps._touch_last_seen("u1")
+        await deps._touch_last_seen("u1")
+
+    assert v.set.await_count == 1
+    db_session.assert_not_called()
@@ -0,0 +1,54 @@
+"""Tests for embedding a finished turn's messages off the response path."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.services.agent import service
+
+
+def _session(conversation, messages: dict):
+    db = AsyncMock()
+
+    async def get(model, key):
+        return conversation if model is service.Conversation else messages.get(key)
+
+    db.get.side_effect = get
+
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return db, factory
+
+
+async def test_scheduled_memory_embeds_each_message_then_commits():
+    conversation = SimpleNamespace(id=uuid.uuid4())
+    user_id, assistant_id = uuid.uuid4(), uuid.uuid4()
+    messages = {user_id: SimpleNamespace(id=user_id), assistant_id: SimpleNamespace(id=assistant_id)}
+    db, factory = _session(conversation, messages)
+    persist = AsyncMock()
+
+    with patch.object(service, "db_session", factory), \
+            patch.object(service, "_persist_message_memory", persist):
+        service._schedule_turn_memory(conversation.id, [user_id, assistant_id])
+        assert len(service._memory_tasks) == 1
+        await asyncio.gather(*service._memory_tasks)
+
+    assert [c.kwargs["message"].id for c in persist.await_args_list] == [user_id, assistant_id]
+    db.commit.assert_awaited_once()
+    assert not service._memory_tasks
+
+
+async def test_memory_failure_is_contained():
+    conversation = SimpleNamespace(id=uuid.uuid4())
+    message_id = uuid.uuid4()
+    db, factory = _session(conversation, {message_id: SimpleNamespace(id=message_id)})
+
+    with patch.object(service, "db_session", factory), \
+            patch.object(service, "_persist_message_memory", AsyncMock(side_effect=RuntimeError("qdrant down"))):
+        await service._persist_turn_memory(conversation.id, [message_id])
+
+    db.commit.assert_not_awaited()
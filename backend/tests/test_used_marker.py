@@ -0,0 +1,26 @@
+"""Tests for parsing the trailing USED: citation marker from LLM answers."""
+
+from app.services.agent.llm import extract_used_marker
+
+
+def test_marker_on_own_line_is_parsed_and_removed():
+    cleaned, docs, web = extract_used_marker("Revenue grew 12%.\n\nUSED: D1, D3, W2")
+    assert cleaned == "Revenue grew 12%."
+    assert docs == {1, 3}
+    assert web == {2}
+
+
+def test_inline_marker_any_case():
+    cleaned, docs, web = extract_used_marker("It was Rolling Stone. used: doc#2")
+    assert cleaned == "It was Rolling Stone."
+    assert docs == {2} and web == set()
+
+
+def test_missing_marker_returns_none():
+    assert extract_used_marker("No citations here.  ") == ("No citations here.", None, None)
+    # "focused:" must not count as a marker.
+    assert extract_used_marker("We focused: on revenue.")[1] is None
+
+
+def test_explicit_none():
+    assert extract_used_marker("Answer.\nUSED: none") == ("Answer.", set(), set())
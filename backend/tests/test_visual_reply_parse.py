@@ -0,0 +1,28 @@
+"""Tests for pulling the JSON object out of a visual model reply."""
+
+import pytest
+
+from app.services.processing_v3.visual import _json_object_span, _parse_visual_reply
+
+
+def test_object_is_found_inside_fences_and_prose():
+    raw = 'Sure!\n```json\n{"asset_type": "chart", "summary": "a"}\n```\nHope that helps {:'
+    assert _parse_visual_reply(raw) == {"asset_type": "chart", "summary": "a"}
+
+
+def test_braces_and_escaped_quotes_inside_strings_are_ignored():
+    raw = '{"visible_text": "f(x) = {a} \\" }", "confidence": 0.9} trailing }'
+    assert _json_object_span(raw) == '{"visible_text": "f(x) = {a} \\" }", "confidence": 0.9}'
+    assert _parse_visual_reply(raw)["visible_text"] == 'f(x) = {a} " }'
+
+
+def test_nested_objects_stay_whole():
+    assert _parse_visual_reply('x {"a": {"b": 1}, "c": 2} y') == {"a": {"b": 1}, "c": 2}
+
+
+def test_unbalanced_or_missing_object_is_rejected():
+    assert _json_object_span('{"a": 1') is None
+    with pytest.raises(ValueError):
+        _parse_visual_reply("no json here")
+    with pytest.raises(ValueError):
+        _parse_visual_reply("[1, 2]")